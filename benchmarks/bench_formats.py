@@ -0,0 +1,79 @@
+"""
+Бенчмарк форматов файла хранилища: размер, время записи и загрузки
+
+Запуск:
+    python benchmarks/bench_formats.py --count 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.datagen import generate_records  # noqa: E402
+from src.storage.codecs import (  # noqa: E402
+    FORMATS,
+    decode_records,
+    encode_records,
+)
+
+
+def measure(records, storage_format: str, directory: str, repeat: int) -> dict:
+    """Лучшее из repeat время записи и чтения файла одного формата"""
+    filename = os.path.join(directory, f"vacancies.{storage_format}")
+    save_times, load_times = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with open(filename, "wb") as f:
+            f.write(encode_records(records, storage_format))
+        save_times.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        with open(filename, "rb") as f:
+            loaded = decode_records(f.read())
+        load_times.append(time.perf_counter() - started)
+        assert len(loaded) == len(records)
+
+    return {
+        "format": storage_format,
+        "size": os.path.getsize(filename),
+        "save": min(save_times),
+        "load": min(load_times),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        "--count", type=int, default=10000, help="число записей"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="число повторов")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    records = generate_records(args.count, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        results = [
+            measure(records, storage_format, directory, args.repeat)
+            for storage_format in FORMATS
+        ]
+
+    base_size = results[0]["size"]
+    print(f"Записей: {args.count}")
+    print(f"{'формат':<10} {'размер, КБ':>12} {'доля':>7} {'запись, мс':>12} "
+          f"{'загрузка, мс':>14}")
+    for result in results:
+        print(
+            f"{result['format']:<10} {result['size'] / 1024:>12.1f} "
+            f"{result['size'] / base_size:>7.2f} "
+            f"{result['save'] * 1000:>12.1f} "
+            f"{result['load'] * 1000:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Бенчмарк времени запуска точек входа (python -X importtime)
+
+Каждая точка входа импортируется в отдельном процессе несколько раз;
+берется минимальное суммарное время импорта модуля точки входа (минимум
+меньше всего подвержен шуму). Отдельно проверяется, что при импорте
+не загружаются тяжелые модули, нужные только сети или аналитике:
+работа с сохраненными данными (src.cli query/export) не должна ждать
+загрузки requests, urllib3 или numpy.
+
+Запуск:
+    python benchmarks/bench_startup.py --budget-ms 100
+Код возврата 1 — превышен бюджет или загружен запрещенный модуль.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Точки входа: имя -> импортируемый модуль
+ENTRY_POINTS: Dict[str, str] = {
+    "cli": "src.cli",
+    "main": "main",
+}
+
+# Модули, которые не должны загружаться при запуске: сетевой стек
+# и numpy подключаются при первом запросе к API или расчете статистики
+FORBIDDEN_MODULES = (
+    "requests",
+    "urllib3",
+    "charset_normalizer",
+    "idna",
+    "numpy",
+)
+
+DEFAULT_BUDGET_MS = 100.0
+
+
+class ImportRecord(NamedTuple):
+    """Строка вывода -X importtime"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Разбирает вывод python -X importtime
+
+    Returns:
+        Записи в порядке вывода (вложенные модули — перед родителем)
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # заголовок таблицы
+        name = parts[2].rstrip()
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        records.append(
+            ImportRecord(module, int(parts[0]), int(parts[1]), max(depth, 0))
+        )
+    return records
+
+
+def entry_subtree(
+    records: List[ImportRecord], module: str
+) -> List[ImportRecord]:
+    """
+    Модуль верхнего уровня и все, что загружено при его импорте
+
+    Модули, загруженные до него (site, .pth-файлы), не учитываются.
+    """
+    for end in range(len(records) - 1, -1, -1):
+        if records[end].depth == 0 and records[end].module == module:
+            break
+    else:
+        raise ValueError(f"Модуль {module} не найден в выводе importtime")
+    start = end
+    while start > 0 and records[start - 1].depth > 0:
+        start -= 1
+    return records[start : end + 1]
+
+
+def measure(module: str, runs: int = 5) -> Dict[str, Any]:
+    """
+    Импортирует модуль в новых процессах и собирает статистику
+
+    Returns:
+        Минимальное и медианное время импорта, число загруженных модулей,
+        самые тяжелые из них и загруженные запрещенные модули
+    """
+    samples = []
+    subtree: List[ImportRecord] = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        subtree = entry_subtree(parse_importtime(completed.stderr), module)
+        samples.append(subtree[-1].cumulative_us / 1000)
+
+    samples.sort()
+    loaded = {record.module for record in subtree}
+    heaviest = sorted(
+        subtree[:-1], key=lambda r: r.cumulative_us, reverse=True
+    )
+    return {
+        "module": module,
+        "min_ms": samples[0],
+        "median_ms": samples[len(samples) // 2],
+        "modules": len(loaded),
+        "top": [(r.module, r.cumulative_us / 1000) for r in heaviest[:5]],
+        "forbidden": sorted(loaded.intersection(FORBIDDEN_MODULES)),
+    }
+
+
+def check(result: Dict[str, Any], budget_ms: Optional[float]) -> List[str]:
+    """Нарушения: превышение бюджета и запрещенные модули"""
+    problems = []
+    if budget_ms is not None and result["min_ms"] > budget_ms:
+        problems.append(
+            f"{result['module']}: {result['min_ms']:.1f} мс "
+            f"> бюджета {budget_ms} мс"
+        )
+    for name in result["forbidden"]:
+        problems.append(f"{result['module']}: импортируется {name}")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарк времени запуска")
+    parser.add_argument(
+        "--entries",
+        nargs="+",
+        choices=sorted(ENTRY_POINTS),
+        default=sorted(ENTRY_POINTS),
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="запусков на точку"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="допустимое время импорта, мс (0 — без ограничения)",
+    )
+    parser.add_argument("--output", help="сохранить результаты в JSON")
+    args = parser.parse_args(argv)
+    budget = args.budget_ms or None
+
+    results = [measure(ENTRY_POINTS[name], args.runs) for name in args.entries]
+    print(f"{'модуль':<10} {'мин, мс':>9} {'медиана, мс':>12} {'модулей':>8}")
+    for result in results:
+        print(
+            f"{result['module']:<10} {result['min_ms']:>9.1f} "
+            f"{result['median_ms']:>12.1f} {result['modules']:>8}"
+        )
+        for name, cumulative in result["top"]:
+            print(f"    {name:<40} {cumulative:>8.1f} мс")
+
+    if args.output:
+        directory = os.path.dirname(os.path.abspath(args.output))
+        os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    problems = [line for result in results for line in check(result, budget)]
+    if problems:
+        print("\nНарушения:")
+        for line in problems:
+            print(f"  {line}")
+        return 1
+    print("\nНарушений нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+Бенчмарк хранилищ вакансий на синтетических данных
+
+Для каждого хранилища и размера измеряются:
+- bulk_load: пакетная загрузка (add_vacancies), записей в секунду;
+- open: открытие существующего хранилища, время (лучшее из OPEN_RUNS
+  открытий без tracemalloc) и пик памяти (в отдельном открытии);
+- add / delete: задержка одиночных add_vacancy и delete_vacancy;
+- запросы get_vacancies с разными фильтрами: задержка p50/p95 (для
+  JSONStorage повторы попадают в кэш результатов, json-nocache
+  измеряет само выполнение);
+- query_page: первая страница отсортированной выдачи (limit=20);
+- get_all: get_vacancies без фильтров (только для JSONStorage): у json
+  это цена попадания в кэш — проверка актуальности файла и копия
+  списка, у json-nocache — полное выполнение запроса.
+
+Результаты можно сохранить как базовые и сравнивать с ними:
+    python benchmarks/bench_storage.py --sizes 10000 --save-baseline \\
+        benchmarks/baselines/storage-10k.json
+    python benchmarks/bench_storage.py --sizes 10000 --compare \\
+        benchmarks/baselines/storage-10k.json
+При сравнении код возврата 1 означает регрессию выше допуска. Базовые
+результаты в benchmarks/baselines (storage-10k.json, storage-100k.json)
+записаны с параметрами по умолчанию для всех хранилищ; сравнивать с
+ними нужно с теми же --ops и --seed. Базовых результатов для 1 млн
+записей нет: прогон занимает часы.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.datagen import generate_vacancies  # noqa: E402
+from src.storage.abstract_storage import AbstractStorage  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.storage.mmap_storage import MmapJSONStorage  # noqa: E402
+from src.storage.query import VacancyQuery  # noqa: E402
+from src.storage.sharded_storage import ShardedJSONStorage  # noqa: E402
+
+# Фабрики хранилищ: имя -> функция(каталог) -> хранилище
+BACKENDS: Dict[str, Callable[[str], AbstractStorage]] = {
+    "json": lambda directory: JSONStorage(os.path.join(directory, "v.json")),
+    # Без кэша результатов: повторные запросы выполняются заново
+    "json-nocache": lambda directory: JSONStorage(
+        os.path.join(directory, "v.json"), cache_size=0
+    ),
+    "json-gzip": lambda directory: JSONStorage(
+        os.path.join(directory, "v.json"), storage_format="gzip"
+    ),
+    "jsonl-mmap": lambda directory: MmapJSONStorage(
+        os.path.join(directory, "v.jsonl")
+    ),
+    # Четыре шарда, запросы выполняются в пуле процессов
+    "json-sharded": lambda directory: ShardedJSONStorage(
+        os.path.join(directory, "shards"), shards=4
+    ),
+}
+
+# Запросы get_vacancies: имя -> критерии
+QUERIES: Dict[str, Dict[str, Any]] = {
+    "keyword": {"keyword": "django"},
+    "keywords_and": {"keywords": ["python", "docker"]},
+    "salary_min": {"salary_min": 250000},
+    "salary_max": {"salary_max": 90000},
+    "avg_range": {"avg_min": 150000, "avg_max": 160000},
+    "company": {"company": "стартап №1"},
+    "combined": {"keyword": "senior", "salary_min": 200000},
+}
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# Время открытия — лучшее из стольких открытий (одно открытие шумит)
+OPEN_RUNS = 3
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """p50/p95/max в миллисекундах"""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[p95_index] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def timed(func: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def run_backend(
+    name: str, size: int, ops: int, seed: int
+) -> List[Dict[str, Any]]:
+    """Все измерения одного хранилища на одном размере"""
+    factory = BACKENDS[name]
+    vacancies = generate_vacancies(size + ops, seed)
+    initial, extra = vacancies[:size], vacancies[size:]
+    results = []
+
+    def record(metric: str, **values: float) -> None:
+        results.append(
+            {"backend": name, "size": size, "metric": metric, **values}
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = factory(directory)
+        elapsed = timed(lambda: storage.add_vacancies(initial))
+        record("bulk_load", seconds=elapsed, records_per_s=size / elapsed)
+        if hasattr(storage, "close"):
+            storage.close()
+
+        # Пик памяти и время открытия замеряются в разных прогонах:
+        # tracemalloc в разы замедляет разбор JSON и построение индексов
+        tracemalloc.start()
+        storage = factory(directory)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        open_seconds = []
+        for _ in range(OPEN_RUNS):
+            if hasattr(storage, "close"):
+                storage.close()
+            # Прежний экземпляр освобождается до открытия следующего
+            del storage
+            started = time.perf_counter()
+            storage = factory(directory)
+            open_seconds.append(time.perf_counter() - started)
+        record("open", seconds=min(open_seconds), peak_mb=peak / 2**20)
+
+        for query_name, criteria in QUERIES.items():
+            found = []
+
+            def run_query() -> None:
+                found.append(len(storage.get_vacancies(**criteria)))
+
+            samples = [timed(run_query) for _ in range(ops)]
+            record(
+                f"get[{query_name}]", rows=found[-1], **percentiles(samples)
+            )
+
+        page = VacancyQuery(keyword="python", order_by="-avg", limit=20)
+        samples = [
+            timed(lambda: list(storage.query(page))) for _ in range(ops)
+        ]
+        record("query_page", **percentiles(samples))
+
+        if isinstance(storage, JSONStorage):
+            rows = len(storage.get_vacancies())
+            samples = [timed(storage.get_vacancies) for _ in range(ops)]
+            record("get_all", rows=rows, **percentiles(samples))
+
+        samples = [timed(lambda v=v: storage.add_vacancy(v)) for v in extra]
+        record("add", **percentiles(samples))
+
+        samples = [timed(lambda v=v: storage.delete_vacancy(v)) for v in extra]
+        record("delete", **percentiles(samples))
+
+        if hasattr(storage, "close"):
+            storage.close()
+    return results
+
+
+# Метрики «меньше — лучше», по которым ищутся регрессии, и минимальное
+# абсолютное ухудшение, которое считается значимым (отсекает шум
+# на быстрых операциях)
+_REGRESSION_FLOORS = {
+    "seconds": 0.005, "p50_ms": 2.0, "p95_ms": 5.0, "peak_mb": 1.0
+}
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Сравнивает результаты с базовыми
+
+    Returns:
+        Описания регрессий: значение хуже базового больше чем на tolerance
+        (и больше абсолютного порога из _REGRESSION_FLOORS)
+    """
+    base_index = {(r["backend"], r["size"], r["metric"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        key = (result["backend"], result["size"], result["metric"])
+        base = base_index.get(key)
+        if base is None:
+            continue
+        for field, floor in _REGRESSION_FLOORS.items():
+            if field in result and field in base and base[field] > 0:
+                ratio = result[field] / base[field]
+                worse = result[field] - base[field]
+                if ratio > 1 + tolerance and worse > floor:
+                    regressions.append(
+                        f"{'/'.join(map(str, key))} "
+                        f"{field}: {base[field]:.3f} -> {result[field]:.3f} "
+                        f"(x{ratio:.2f})"
+                    )
+    return regressions
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    print(
+        f"{'хранилище':<13} {'размер':>8} {'метрика':<20} {'p50, мс':>10} "
+        f"{'p95, мс':>9} {'доп.':>14}"
+    )
+    for r in results:
+        main_value = r.get("p50_ms", r.get("seconds", 0) * 1000)
+        extra = ""
+        if "records_per_s" in r:
+            extra = f"{r['records_per_s']:.0f} зап/с"
+        elif "peak_mb" in r:
+            extra = f"{r['peak_mb']:.1f} МБ"
+        elif "rows" in r:
+            extra = f"{r['rows']} строк"
+        p95 = f"{r['p95_ms']:.2f}" if "p95_ms" in r else ""
+        print(
+            f"{r['backend']:<13} {r['size']:>8} {r['metric']:<20} "
+            f"{main_value:>10.2f} {p95:>9} {extra:>14}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарк хранилищ вакансий")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=sorted(BACKENDS),
+        default=sorted(BACKENDS),
+    )
+    parser.add_argument(
+        "--ops", type=int, default=20, help="повторов на операцию"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="сохранить результаты в JSON")
+    parser.add_argument(
+        "--save-baseline", help="сохранить как базовые результаты"
+    )
+    parser.add_argument("--compare", help="сравнить с базовыми результатами")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.0,
+        help="допустимое ухудшение (доля)",
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        for backend in args.backends:
+            results.extend(run_backend(backend, size, args.ops, args.seed))
+    print_table(results)
+
+    payload = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "ops": args.ops,
+        },
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nРегрессии:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nРегрессий нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
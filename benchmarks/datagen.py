@@ -0,0 +1,94 @@
+"""
+Генератор синтетических вакансий для бенчмарков
+
+Основа — data/sample_vacancies.json: названия, описания, требования и
+компании берутся из образцов и комбинируются со случайными префиксами,
+стеком и зарплатами. Генератор детерминирован для заданного seed.
+"""
+import json
+import os
+import random
+import sys
+from typing import Any, Dict, Iterator, List
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from src.models.vacancy import Vacancy  # noqa: E402
+
+SAMPLE_FILE = os.path.join(ROOT, "data", "sample_vacancies.json")
+
+_LEVELS = ["Junior", "Middle", "Senior", "Lead", "Ведущий", "Старший", ""]
+_STACK = [
+    "Python", "Django", "Flask", "FastAPI", "PostgreSQL", "Redis", "Docker",
+    "Kubernetes", "Kafka", "asyncio", "Celery", "ClickHouse", "Go", "Java",
+    "Linux", "Git", "SQL", "Airflow", "PySpark", "ООП", "REST", "gRPC",
+]
+_CITIES = ["Москва", "Санкт-Петербург", "Казань", "Новосибирск", "удаленно"]
+_CURRENCIES = ["RUR"] * 8 + ["USD", "EUR"]
+
+
+def load_samples() -> List[Dict[str, Any]]:
+    """Образцы вакансий в формате хранилища (Vacancy.to_dict)"""
+    with open(SAMPLE_FILE, "r", encoding="utf-8") as f:
+        hh_data = json.load(f)
+    return [
+        vacancy.to_dict()
+        for vacancy in Vacancy.cast_to_object_list(hh_data)
+    ]
+
+
+def iter_records(count: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """
+    Генерирует записи вакансий
+
+    Args:
+        count: Количество записей
+        seed: Зерно генератора случайных чисел
+
+    Yields:
+        Словари в формате Vacancy.to_dict с уникальными URL
+    """
+    rng = random.Random(seed)
+    samples = load_samples()
+    for i in range(count):
+        base = samples[i % len(samples)]
+        level = rng.choice(_LEVELS)
+        stack = rng.sample(_STACK, 4)
+
+        salary_from = salary_to = None
+        roll = rng.random()
+        if roll < 0.8:
+            scale = rng.uniform(0.5, 2.0)
+            salary_from = (
+                int((base["salary_from"] or 100000) * scale) // 1000 * 1000
+            )
+        if 0.2 < roll < 0.9:
+            salary_to = (salary_from or 60000) + rng.randrange(0, 150000, 5000)
+
+        sentences = [s for s in base["description"].split(". ") if s]
+        rng.shuffle(sentences)
+
+        yield {
+            "title": f"{level} {base['title']} ({stack[0]})".strip(),
+            "url": f"https://hh.ru/vacancy/{10_000_000 + i}",
+            "salary_from": salary_from,
+            "salary_to": salary_to,
+            "currency": rng.choice(_CURRENCIES),
+            "description": ". ".join(sentences)
+            + f". Город: {rng.choice(_CITIES)}.",
+            "requirements": ", ".join(stack),
+            "company": (
+                f"{base['company']} №{rng.randrange(1, count // 10 + 2)}"
+            ),
+        }
+
+
+def generate_records(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Список из count синтетических записей"""
+    return list(iter_records(count, seed))
+
+
+def generate_vacancies(count: int, seed: int = 42) -> List[Vacancy]:
+    """Список из count синтетических объектов Vacancy"""
+    return [Vacancy.from_dict(data) for data in iter_records(count, seed)]
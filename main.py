@@ -4,6 +4,7 @@
 import os
 import sys
 import traceback
+from typing import List
 
 # Добавляем текущую директорию в путь
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -11,14 +12,19 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.api.hh_api import HeadHunterAPI
 from src.api.fallback_hh_api import FallbackHeadHunterAPI
 from src.models.vacancy import Vacancy
+from src.services.cached_search import CachedSearch
 from src.storage.json_storage import JSONStorage
 from src.utils.helpers import (
     filter_vacancies,
     get_vacancies_by_salary,
-    sort_vacancies,
-    get_top_vacancies,
     print_vacancies,
 )
+from src.utils.metrics import METRICS
+from src.utils.pipeline import Query
+from src.utils.render import Pager
+
+# Вакансий на странице при выводе всех вакансий
+PAGE_SIZE = 20
 
 
 def user_interaction() -> None:
@@ -37,53 +43,26 @@ def user_interaction() -> None:
             print("Поисковый запрос не может быть пустым!")
             return
 
-        # Получение вакансий
-        print(f"\nИщу вакансии по запросу: '{search_query}'...")
-
-        hh_vacancies_data = []
+        json_saver = JSONStorage()
+        cache = CachedSearch(HeadHunterAPI(), json_saver)
+
+        # Если тот же запрос недавно выполнялся, берем результаты из хранилища
+        vacancies_list = cache.lookup(search_query)
+        if vacancies_list is not None:
+            minutes = int((cache.age(search_query) or 0) // 60)
+            print(
+                f"\nРезультаты по запросу '{search_query}' взяты из "
+                f"локального хранилища (получены {minutes} мин назад)"
+            )
+        else:
+            vacancies_list = fetch_vacancies(search_query, cache, json_saver)
 
-        # Сначала пробуем основной API
-        try:
-            print("Попытка 1: Основной API...")
-            hh_api = HeadHunterAPI()
-            hh_vacancies_data = hh_api.get_vacancies(search_query, per_page=20)
-        except Exception as e:
-            print(f"Основной API не сработал: {e}")
-            hh_vacancies_data = []
-
-        # Если основной не сработал, пробуем резервный
-        if not hh_vacancies_data:
-            print("Попытка 2: Резервный API...")
-            try:
-                fallback_api = FallbackHeadHunterAPI()
-                hh_vacancies_data = fallback_api.get_vacancies(
-                    search_query, per_page=15
-                )
-            except Exception as e:
-                print(f"Резервный API не сработал: {e}")
-
-        # Если API не работают, используем тестовые данные
-        if not hh_vacancies_data:
-            print("\nAPI не доступен. Использую тестовые данные...")
-            hh_vacancies_data = load_sample_vacancies()
-            for item in hh_vacancies_data:
-                if search_query.lower() not in item["name"].lower():
-                    item["name"] = f"{search_query} - {item['name']}"
-
-        # Конвертация в объекты
-        vacancies_list = Vacancy.cast_to_object_list(hh_vacancies_data)
         print(f"\nНайдено вакансий: {len(vacancies_list)}")
 
         if not vacancies_list:
             print("Нет вакансий для обработки")
             return
 
-        # Сохранение в файл
-        json_saver = JSONStorage()
-        for vacancy in vacancies_list:
-            json_saver.add_vacancy(vacancy)
-        print("Вакансии сохранены в файл: data/vacancies.json")
-
         # Основной цикл взаимодействия
         while True:
             print("\n" + "=" * 60)
@@ -92,10 +71,11 @@ def user_interaction() -> None:
             print("2. Найти вакансии по ключевому слову в описании")
             print("3. Фильтровать по диапазону зарплат")
             print("4. Вывести все вакансии")
-            print("5. Поиск вакансий другой специальности")
-            print("6. Выход")
+            print("5. Статистика зарплат")
+            print("6. Поиск вакансий другой специальности")
+            print("7. Выход")
 
-            choice = input("\nВыберите действие (1-6): ").strip()
+            choice = input("\nВыберите действие (1-7): ").strip()
 
             if choice == "1":
                 try:
@@ -106,18 +86,15 @@ def user_interaction() -> None:
                         print("Число должно быть положительным!")
                         continue
 
-                    # Сортируем только вакансии с указанной зарплатой
-                    vacancies_with_salary = [
-                        v for v in vacancies_list if v.avg_salary > 0
-                    ]
-                    if not vacancies_with_salary:
+                    # Топ только среди вакансий с указанной зарплатой,
+                    # за один проход без полной сортировки
+                    top_vacancies = (
+                        Query(vacancies_list).with_salary().top(top_n)
+                    )
+                    if not top_vacancies:
                         print("Нет вакансий с указанной зарплатой для сортировки")
                         continue
 
-                    sorted_vacancies = sort_vacancies(vacancies_with_salary)
-                    top_vacancies = get_top_vacancies(
-                        sorted_vacancies, min(top_n, len(sorted_vacancies))
-                    )
                     print(f"\nТоп {len(top_vacancies)} вакансий по зарплате:")
                     print_vacancies(top_vacancies)
                 except ValueError:
@@ -151,15 +128,28 @@ def user_interaction() -> None:
                     print("Диапазон зарплат не может быть пустым!")
 
             elif choice == "4":
+                view = input(
+                    "Формат вывода: 1 — подробно, 2 — таблица [2]: "
+                ).strip()
                 print(f"\nВсе вакансии ({len(vacancies_list)}):")
-                print_vacancies(vacancies_list)
+                # Постранично: форматируется только показанная страница
+                Pager(vacancies_list, PAGE_SIZE, compact=view != "1").show()
 
             elif choice == "5":
+                # Перцентили, гистограмма и сводки по компаниям
+                # по колонкам зарплат (векторно, если установлен numpy);
+                # модуль с numpy загружается только при выборе пункта
+                from src.analytics.salary import SalaryFrame, salary_report
+
+                frame = SalaryFrame.from_vacancies(vacancies_list)
+                print("\n" + salary_report(frame), end="")
+
+            elif choice == "6":
                 # Выход в главное меню
                 print("\nВозврат к поиску...")
                 break
 
-            elif choice == "6":
+            elif choice == "7":
                 print("До свидания!")
                 sys.exit(0)
 
@@ -175,6 +165,66 @@ def user_interaction() -> None:
         print("Пожалуйста, попробуйте снова")
 
 
+def fetch_vacancies(
+    search_query: str, cache: CachedSearch, json_saver: JSONStorage
+) -> List[Vacancy]:
+    """Получает вакансии из API (с резервными вариантами) и сохраняет их"""
+    print(f"\nИщу вакансии по запросу: '{search_query}'...")
+
+    hh_vacancies_data = []
+
+    # Сначала пробуем основной API
+    try:
+        print("Попытка 1: Основной API...")
+        hh_api = HeadHunterAPI()
+        hh_vacancies_data = hh_api.get_vacancies(search_query, per_page=20)
+    except Exception as e:
+        print(f"Основной API не сработал: {e}")
+        hh_vacancies_data = []
+
+    # Если основной не сработал, пробуем резервный
+    if not hh_vacancies_data:
+        print("Попытка 2: Резервный API...")
+        try:
+            fallback_api = FallbackHeadHunterAPI()
+            hh_vacancies_data = fallback_api.get_vacancies(
+                search_query, per_page=15
+            )
+        except Exception as e:
+            print(f"Резервный API не сработал: {e}")
+
+    from_api = bool(hh_vacancies_data)
+
+    # Если API не работают, используем тестовые данные
+    if not hh_vacancies_data:
+        print("\nAPI не доступен. Использую тестовые данные...")
+        hh_vacancies_data = load_sample_vacancies()
+        for item in hh_vacancies_data:
+            if search_query.lower() not in item["name"].lower():
+                item["name"] = f"{search_query} - {item['name']}"
+
+    # Конвертация в объекты
+    with METRICS.timer("vacancy_convert_seconds"):
+        vacancies_list = Vacancy.cast_to_object_list(hh_vacancies_data)
+    METRICS.inc("vacancies_converted_total", len(vacancies_list))
+    if not vacancies_list:
+        return vacancies_list
+
+    # Сохранение в файл; в журнал запросов попадают только ответы API,
+    # тестовые данные не должны выдаваться за свежие результаты
+    if from_api:
+        result = cache.store(search_query, vacancies_list)
+    else:
+        result = json_saver.upsert_vacancies(vacancies_list)
+    print(
+        "Вакансии сохранены в файл: data/vacancies.json "
+        f"(новых: {result.inserted}, обновлено: {result.updated}, "
+        f"без изменений: {result.unchanged}, "
+        f"почти дубликатов: {result.near_duplicates})"
+    )
+    return vacancies_list
+
+
 def load_sample_vacancies() -> list:
     """Загрузка тестовых данных из файла, если API не работает"""
     import json
@@ -229,11 +279,25 @@ if __name__ == "__main__":
     # Создаем директории, если их нет
     os.makedirs("data", exist_ok=True)
 
-    # Основной цикл программы
-    while True:
-        user_interaction()
+    # HH_METRICS=metrics.prom (.json или "-" — таблица в stderr):
+    # замерить этапы поиска и выгрузить метрики при выходе
+    metrics_target = os.environ.get("HH_METRICS")
+    if metrics_target:
+        METRICS.enable()
 
-        cont = input("\nХотите выполнить новый поиск? (да/нет): ").strip().lower()
-        if cont not in ["да", "yes", "y", "д"]:
-            print("Выход из программы...")
-            break
+    # Основной цикл программы
+    try:
+        while True:
+            user_interaction()
+
+            cont = (
+                input("\nХотите выполнить новый поиск? (да/нет): ")
+                .strip()
+                .lower()
+            )
+            if cont not in ["да", "yes", "y", "д"]:
+                print("Выход из программы...")
+                break
+    finally:
+        if metrics_target:
+            METRICS.export(metrics_target)
@@ -0,0 +1,484 @@
+import math
+from array import array
+from itertools import compress
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from ..models.vacancy import Vacancy
+from ..storage.abstract_storage import AbstractStorage
+from ..storage.query import VacancyQuery
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy не установлен
+    np = None
+
+# Векторные вычисления доступны только с numpy (pip install .[analytics]);
+# без него используется реализация на чистом Python с тем же результатом
+HAS_NUMPY = np is not None
+
+# Подпись для вакансий без названия компании
+NO_COMPANY = "Не указана"
+
+
+class SalaryStats(NamedTuple):
+    """Сводка по средним зарплатам группы вакансий"""
+
+    total: int = 0
+    count: int = 0
+    mean: float = 0.0
+    median: float = 0.0
+    p10: float = 0.0
+    p90: float = 0.0
+    minimum: float = 0.0
+    maximum: float = 0.0
+
+
+class Histogram(NamedTuple):
+    """Гистограмма: границы интервалов (на одну больше) и число вакансий"""
+
+    edges: List[float]
+    counts: List[int]
+
+
+def _interpolate(
+    values: Sequence[float], start: int, count: int, q: float
+) -> float:
+    """Перцентиль q отсортированного среза с линейной интерполяцией"""
+    position = start + q * (count - 1)
+    low = math.floor(position)
+    high = min(low + 1, start + count - 1)
+    fraction = position - low
+    return values[low] * (1 - fraction) + values[high] * fraction
+
+
+def _python_group_stats(
+    codes: Sequence[int],
+    values: Sequence[float],
+    value_codes: Sequence[int],
+    groups: int,
+) -> List[SalaryStats]:
+    """
+    Сводки по группам на чистом Python
+
+    Args:
+        codes: Коды групп всех строк
+        values: Указанные зарплаты по возрастанию
+        value_codes: Коды групп этих зарплат
+        groups: Количество групп
+    """
+    totals = [0] * groups
+    for code in codes:
+        totals[code] += 1
+    # Зарплаты раскладываются по группам в порядке возрастания,
+    # поэтому списки групп уже отсортированы
+    paid: List[List[float]] = [[] for _ in range(groups)]
+    for value, code in zip(values, value_codes):
+        paid[code].append(value)
+
+    result = []
+    for total, group in zip(totals, paid):
+        if not group:
+            result.append(SalaryStats(total))
+            continue
+        count = len(group)
+        result.append(
+            SalaryStats(
+                total,
+                count,
+                math.fsum(group) / count,
+                _interpolate(group, 0, count, 0.5),
+                _interpolate(group, 0, count, 0.1),
+                _interpolate(group, 0, count, 0.9),
+                group[0],
+                group[-1],
+            )
+        )
+    return result
+
+
+def _numpy_group_stats(
+    codes: Any, values: Any, value_codes: Any, groups: int
+) -> List[SalaryStats]:
+    """
+    Сводки по группам векторными операциями numpy
+
+    Аргументы как у _python_group_stats. Устойчивая сортировка
+    по коду группы сохраняет порядок зарплат внутри группы, поэтому
+    каждая группа становится отсортированным срезом, и перцентили всех
+    групп вычисляются одной операцией по индексам начала срезов. Коды
+    до 65536 групп сортируются поразрядно (uint16) за линейное время.
+    """
+    totals = np.bincount(codes, minlength=groups)
+    sort_codes = (
+        value_codes.astype(np.uint16) if groups <= 65536 else value_codes
+    )
+    order = np.argsort(sort_codes, kind="stable")
+    values = values[order]
+    value_codes = value_codes[order]
+
+    counts = np.bincount(value_codes, minlength=groups)
+    sums = np.bincount(value_codes, weights=values, minlength=groups)
+    starts = np.cumsum(counts) - counts
+    present = counts > 0
+    starts_present = starts[present]
+    counts_present = counts[present]
+
+    def percentile(q: float) -> Any:
+        position = starts_present + q * (counts_present - 1)
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, starts_present + counts_present - 1)
+        fraction = position - low
+        return values[low] * (1 - fraction) + values[high] * fraction
+
+    columns = np.zeros((6, groups))
+    if values.size:
+        columns[0, present] = sums[present] / counts_present
+        columns[1, present] = percentile(0.5)
+        columns[2, present] = percentile(0.1)
+        columns[3, present] = percentile(0.9)
+        columns[4, present] = values[starts_present]
+        columns[5, present] = values[starts_present + counts_present - 1]
+
+    return [
+        SalaryStats(int(total), int(count), *map(float, column))
+        for total, count, column in zip(
+            totals.tolist(), counts.tolist(), columns.T.tolist()
+        )
+    ]
+
+
+class SalaryFrame:
+    """
+    Колоночное представление зарплат для аналитики
+
+    Из вакансий один раз извлекаются три колонки: средняя зарплата
+    (как Vacancy.avg_salary, 0 — не указана), код компании и код
+    валюты. Сводки, перцентили, гистограммы и группировки считаются по
+    колонкам векторными операциями numpy, а при его отсутствии — на
+    чистом Python с тем же результатом.
+
+    Зарплаты в разных валютах не пересчитываются: для сводок по одной
+    валюте используйте where(currency=...) или by_currency().
+    """
+
+    def __init__(
+        self,
+        salaries: Iterable[float],
+        companies: Iterable[str],
+        currencies: Iterable[str],
+    ):
+        company_labels: Dict[str, int] = {}
+        currency_labels: Dict[str, int] = {}
+        company_codes = array(
+            "q",
+            (
+                company_labels.setdefault(item, len(company_labels))
+                for item in companies
+            ),
+        )
+        currency_codes = array(
+            "q",
+            (
+                currency_labels.setdefault(item, len(currency_labels))
+                for item in currencies
+            ),
+        )
+        salary_column = array("d", salaries)
+        if not len(salary_column) == len(company_codes) == len(currency_codes):
+            raise ValueError("Колонки должны быть одной длины")
+
+        self.companies = list(company_labels)
+        self.currencies = list(currency_labels)
+        if HAS_NUMPY:
+            self._salaries: Any = np.frombuffer(
+                salary_column, dtype=np.float64
+            )
+            self._company_codes: Any = np.frombuffer(
+                company_codes, dtype=np.int64
+            )
+            self._currency_codes: Any = np.frombuffer(
+                currency_codes, dtype=np.int64
+            )
+        else:
+            self._salaries = salary_column
+            self._company_codes = company_codes
+            self._currency_codes = currency_codes
+        self._sorted: Optional[Tuple[Any, Any]] = None
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> "SalaryFrame":
+        """Колонки по вакансиям"""
+        salaries = array("d")
+        companies: List[str] = []
+        currencies: List[str] = []
+        for vacancy in vacancies:
+            salaries.append(vacancy.avg_salary)
+            companies.append(vacancy.company or NO_COMPANY)
+            currencies.append(vacancy.currency)
+        return cls(salaries, companies, currencies)
+
+    @classmethod
+    def from_storage(
+        cls, storage: AbstractStorage, query: Optional[VacancyQuery] = None
+    ) -> "SalaryFrame":
+        """Колонки по вакансиям хранилища (по умолчанию — всем)"""
+        return cls.from_vacancies(storage.query(query or VacancyQuery()))
+
+    def __len__(self) -> int:
+        return len(self._salaries)
+
+    def _take(self, mask: Any) -> "SalaryFrame":
+        """Новая таблица из строк, отмеченных в mask (подписи групп общие)"""
+        frame = SalaryFrame.__new__(SalaryFrame)
+        frame.companies = self.companies
+        frame.currencies = self.currencies
+        frame._sorted = None
+        if HAS_NUMPY:
+            frame._salaries = self._salaries[mask]
+            frame._company_codes = self._company_codes[mask]
+            frame._currency_codes = self._currency_codes[mask]
+        else:
+            frame._salaries = array("d", compress(self._salaries, mask))
+            frame._company_codes = array(
+                "q", compress(self._company_codes, mask)
+            )
+            frame._currency_codes = array(
+                "q", compress(self._currency_codes, mask)
+            )
+        return frame
+
+    def where(
+        self, currency: Optional[str] = None, company: Optional[str] = None
+    ) -> "SalaryFrame":
+        """
+        Строки с заданной валютой и (или) компанией
+
+        Args:
+            currency: Код валюты (например, "RUR")
+            company: Точное название компании
+
+        Returns:
+            Новая таблица
+        """
+        conditions: List[Tuple[Any, List[str], str]] = []
+        if currency is not None:
+            conditions.append(
+                (self._currency_codes, self.currencies, currency)
+            )
+        if company is not None:
+            conditions.append((self._company_codes, self.companies, company))
+        if not conditions:
+            return self
+
+        if HAS_NUMPY:
+            mask = np.ones(len(self), dtype=bool)
+            for codes, labels, label in conditions:
+                code = labels.index(label) if label in labels else -1
+                mask &= codes == code
+            return self._take(mask)
+
+        mask = [True] * len(self)
+        for codes, labels, label in conditions:
+            code = labels.index(label) if label in labels else -1
+            mask = [keep and value == code for keep, value in zip(mask, codes)]
+        return self._take(mask)
+
+    def _sorted_salaries(self) -> Tuple[Any, Any]:
+        """
+        Указанные зарплаты по возрастанию и номера их строк
+
+        Сортировка выполняется один раз на таблицу; все сводки,
+        группировки и гистограммы затем используют ее результат.
+        """
+        if self._sorted is None:
+            salaries = self._salaries
+            if HAS_NUMPY:
+                rows = np.flatnonzero(salaries > 0)
+                order = rows[np.argsort(salaries[rows], kind="stable")]
+                self._sorted = (salaries[order], order)
+            else:
+                order = sorted(
+                    (row for row, salary in enumerate(salaries) if salary > 0),
+                    key=salaries.__getitem__,
+                )
+                self._sorted = ([salaries[row] for row in order], order)
+        return self._sorted
+
+    def _group_stats(self, codes: Any, groups: int) -> List[SalaryStats]:
+        values, order = self._sorted_salaries()
+        if HAS_NUMPY:
+            return _numpy_group_stats(codes, values, codes[order], groups)
+        return _python_group_stats(
+            codes, values, [codes[row] for row in order], groups
+        )
+
+    def stats(self) -> SalaryStats:
+        """Сводка по всем строкам (перцентили — по вакансиям с зарплатой)"""
+        values, _ = self._sorted_salaries()
+        count = len(values)
+        if not count:
+            return SalaryStats(len(self))
+        total = float(values.sum()) if HAS_NUMPY else math.fsum(values)
+        return SalaryStats(
+            len(self),
+            count,
+            total / count,
+            float(_interpolate(values, 0, count, 0.5)),
+            float(_interpolate(values, 0, count, 0.1)),
+            float(_interpolate(values, 0, count, 0.9)),
+            float(values[0]),
+            float(values[-1]),
+        )
+
+    def by_company(self, min_count: int = 1) -> Dict[str, SalaryStats]:
+        """
+        Сводки по компаниям
+
+        Args:
+            min_count: Минимальное число вакансий с зарплатой у компании
+
+        Returns:
+            Название компании -> сводка, по убыванию числа вакансий с зарплатой
+        """
+        stats = self._group_stats(self._company_codes, len(self.companies))
+        return self._grouped(self.companies, stats, min_count)
+
+    def by_currency(self, min_count: int = 1) -> Dict[str, SalaryStats]:
+        """
+        Сводки по валютам
+
+        Args:
+            min_count: Минимальное число вакансий с зарплатой в валюте
+
+        Returns:
+            Код валюты -> сводка, по убыванию числа вакансий с зарплатой
+        """
+        stats = self._group_stats(self._currency_codes, len(self.currencies))
+        return self._grouped(self.currencies, stats, min_count)
+
+    @staticmethod
+    def _grouped(
+        labels: List[str], stats: List[SalaryStats], min_count: int
+    ) -> Dict[str, SalaryStats]:
+        pairs = [
+            (label, item)
+            for label, item in zip(labels, stats)
+            if item.total and item.count >= min_count
+        ]
+        pairs.sort(key=lambda pair: -pair[1].count)
+        return dict(pairs)
+
+    def histogram(
+        self,
+        bins: int = 10,
+        low: Optional[float] = None,
+        high: Optional[float] = None,
+    ) -> Histogram:
+        """
+        Гистограмма средних зарплат (вакансии без зарплаты не учитываются)
+
+        Args:
+            bins: Количество интервалов равной ширины
+            low: Нижняя граница (по умолчанию — минимальная зарплата)
+            high: Верхняя граница (по умолчанию — максимальная зарплата)
+
+        Returns:
+            Гистограмма; зарплаты вне [low, high] не учитываются,
+            последний интервал включает правую границу
+        """
+        if bins <= 0:
+            raise ValueError("Количество интервалов должно быть положительным")
+
+        if HAS_NUMPY:
+            values, _ = self._sorted_salaries()
+            if low is None:
+                low = float(values[0]) if values.size else 0.0
+            if high is None:
+                high = float(values[-1]) if values.size else 0.0
+            if high <= low:
+                high = low + 1.0
+            counts, edges = np.histogram(values, bins=bins, range=(low, high))
+            return Histogram(edges.tolist(), counts.tolist())
+
+        values_list, _ = self._sorted_salaries()
+        if low is None:
+            low = values_list[0] if values_list else 0.0
+        if high is None:
+            high = values_list[-1] if values_list else 0.0
+        if high <= low:
+            high = low + 1.0
+        width = (high - low) / bins
+        histogram_counts = [0] * bins
+        for salary in values_list:
+            if low <= salary <= high:
+                bucket = min(int((salary - low) / width), bins - 1)
+                histogram_counts[bucket] += 1
+        edges_list = [low + width * position for position in range(bins)]
+        edges_list.append(high)
+        return Histogram(edges_list, histogram_counts)
+
+
+def _money(value: float) -> str:
+    """Сумма с разделителем тысяч"""
+    return f"{value:,.0f}".replace(",", " ")
+
+
+def salary_report(
+    frame: SalaryFrame, top_companies: int = 10, bins: int = 10
+) -> str:
+    """
+    Текстовый отчет по зарплатам для вывода в консоль
+
+    Сводка и гистограмма строятся по самой частой валюте, сводки по
+    компаниям — по ней же (компании с наибольшим числом вакансий с
+    зарплатой).
+
+    Args:
+        frame: Таблица зарплат
+        top_companies: Количество компаний в отчете
+        bins: Количество интервалов гистограммы
+
+    Returns:
+        Текст отчета
+    """
+    by_currency = frame.by_currency()
+    if not by_currency:
+        return f"Вакансий: {len(frame)}, ни в одной не указана зарплата\n"
+
+    lines = [f"Вакансий: {len(frame)}", "", "По валютам:"]
+    for currency, stats in by_currency.items():
+        lines.append(
+            f"  {currency}: {stats.count} с зарплатой, "
+            f"среднее {_money(stats.mean)}, медиана {_money(stats.median)}, "
+            f"p10 {_money(stats.p10)}, p90 {_money(stats.p90)}"
+        )
+
+    currency = next(iter(by_currency))
+    base = frame.where(currency=currency)
+    companies = list(base.by_company().items())[:top_companies]
+    lines += ["", f"Компании с наибольшим числом вакансий ({currency}):"]
+    for company, stats in companies:
+        lines.append(
+            f"  {company[:40]}: {stats.count}, "
+            f"медиана {_money(stats.median)}, "
+            f"от {_money(stats.minimum)} до {_money(stats.maximum)}"
+        )
+
+    histogram = base.histogram(bins)
+    peak = max(histogram.counts) or 1
+    lines += ["", f"Распределение средних зарплат ({currency}):"]
+    for position, count in enumerate(histogram.counts):
+        bar = "#" * round(30 * count / peak)
+        lines.append(
+            f"  {_money(histogram.edges[position]):>11} – "
+            f"{_money(histogram.edges[position + 1]):>11} | {count:>6} {bar}"
+        )
+    return "\n".join(lines) + "\n"
@@ -1,5 +1,6 @@
 from typing import Dict, List, Any
 from .abstract_api import AbstractAPI
+from ..utils.metrics import METRICS
 
 
 class FallbackHeadHunterAPI(AbstractAPI):
@@ -49,18 +50,23 @@ class FallbackHeadHunterAPI(AbstractAPI):
 
                 time.sleep(1)
 
-                response = requests.get(
-                    endpoint["url"],
-                    headers=self._headers,
-                    params=endpoint["params"],
-                    timeout=30,
-                )
+                METRICS.inc("api_requests_total")
+                with METRICS.timer("api_fetch_seconds"):
+                    response = requests.get(
+                        endpoint["url"],
+                        headers=self._headers,
+                        params=endpoint["params"],
+                        timeout=30,
+                    )
 
                 if response.status_code == 200:
-                    data = response.json()
+                    with METRICS.timer("api_decode_seconds"):
+                        data = response.json()
                     return data.get("items", [])
+                METRICS.inc("api_errors_total")
 
             except Exception as e:
+                METRICS.inc("api_errors_total")
                 print(f"Ошибка в альтернативном методе: {e}")
                 continue
 
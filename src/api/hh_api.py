@@ -1,8 +1,12 @@
-import requests
 import time
 import random
 from typing import Dict, List, Any
 from ..api.abstract_api import AbstractAPI
+from ..utils.metrics import METRICS
+
+# requests (вместе с urllib3, certifi и charset_normalizer) импортируется
+# при первом запросе: работа с сохраненными данными обходится без сетевого
+# стека и запускается быстрее
 
 
 class HeadHunterAPI(AbstractAPI):
@@ -21,6 +25,8 @@ class HeadHunterAPI(AbstractAPI):
         """
         Упрощенная проверка подключения
         """
+        import requests
+
         try:
             # Простой запрос для проверки доступности
             response = requests.get(
@@ -62,18 +68,22 @@ class HeadHunterAPI(AbstractAPI):
             "only_with_salary": False,
         }
 
+        import requests
+
         # Добавляем небольшую случайную задержку
         time.sleep(random.uniform(0.5, 1.5))
 
         try:
             print(f"Отправка запроса к API HH.ru: {search_query}")
 
-            response = requests.get(
-                f"{self._base_url}/vacancies",
-                headers=self._headers,
-                params=params,
-                timeout=30,
-            )
+            METRICS.inc("api_requests_total")
+            with METRICS.timer("api_fetch_seconds"):
+                response = requests.get(
+                    f"{self._base_url}/vacancies",
+                    headers=self._headers,
+                    params=params,
+                    timeout=30,
+                )
 
             print(f"Статус ответа: {response.status_code}")
 
@@ -82,21 +92,25 @@ class HeadHunterAPI(AbstractAPI):
                 print("Попытка альтернативного запроса...")
                 simple_params = {"text": search_query, "area": 113, "per_page": 20}
 
-                response = requests.get(
-                    f"{self._base_url}/vacancies",
-                    headers=self._headers,
-                    params=simple_params,
-                    timeout=30,
-                )
+                METRICS.inc("api_requests_total")
+                with METRICS.timer("api_fetch_seconds"):
+                    response = requests.get(
+                        f"{self._base_url}/vacancies",
+                        headers=self._headers,
+                        params=simple_params,
+                        timeout=30,
+                    )
                 print(f"Статус альтернативного ответа: {response.status_code}")
 
             # Проверяем успешность запроса
             if response.status_code != 200:
+                METRICS.inc("api_errors_total")
                 print(f"Ошибка API: {response.status_code}")
                 print(f"Ответ сервера: {response.text[:500]}")
                 return []
 
-            data = response.json()
+            with METRICS.timer("api_decode_seconds"):
+                data = response.json()
 
             # Проверяем структуру ответа
             if "items" not in data:
@@ -115,8 +129,10 @@ class HeadHunterAPI(AbstractAPI):
             return items
 
         except requests.exceptions.RequestException as e:
+            METRICS.inc("api_errors_total")
             print(f"Ошибка сети: {e}")
             return []
         except Exception as e:
+            METRICS.inc("api_errors_total")
             print(f"Общая ошибка: {e}")
             return []
@@ -0,0 +1,642 @@
+"""
+Пакетный режим без диалога: загрузка, выборка, экспорт и статистика
+
+Запуск из корня проекта (например, из cron):
+    python -m src.cli fetch --queries-file queries.txt --concurrency 8
+    python -m src.cli query --keyword django --salary-min 200000 --limit 50
+    python -m src.cli export vacancies.csv --export-format csv
+    python -m src.cli stats --json
+    python -m src.cli schedule saved_searches.json --concurrency 4
+
+Коды возврата:
+    0 — успешно;
+    1 — часть запросов fetch (поисков schedule) не выполнена или query
+        ничего не нашел;
+    2 — неверные аргументы;
+    3 — ни один запрос fetch (поиск schedule) не выполнен или ошибка
+        хранилища.
+"""
+import argparse
+import contextlib
+import json
+import sys
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+)
+from .api.abstract_api import AbstractAPI
+from .api.fallback_hh_api import FallbackHeadHunterAPI
+from .api.hh_api import HeadHunterAPI
+from .models.vacancy import Vacancy
+from .services.cached_search import CachedSearch
+from .storage.abstract_storage import AbstractStorage
+from .storage.codecs import FORMATS
+from .storage.json_storage import JSONStorage
+from .storage.query import ORDER_FIELDS, VacancyQuery
+from .utils.metrics import METRICS
+from .utils.render import render_vacancies
+
+if TYPE_CHECKING:
+    from .analytics.salary import SalaryFrame, SalaryStats
+
+# Модули, нужные только отдельным командам и хранилищам (пул потоков,
+# csv, аналитика с numpy, mmap и шардированное хранилище), импортируются
+# при первом использовании: query по локальному хранилищу не тратит
+# время запуска на их загрузку (см. benchmarks/bench_startup.py)
+
+EXIT_OK = 0
+EXIT_INCOMPLETE = 1
+EXIT_USAGE = 2
+EXIT_FAILURE = 3
+
+
+def _mmap_storage(path: str) -> AbstractStorage:
+    from .storage.mmap_storage import MmapJSONStorage
+
+    return MmapJSONStorage(path)
+
+
+def _sharded_storage(path: str, storage_format: str) -> AbstractStorage:
+    from .storage.sharded_storage import ShardedJSONStorage
+
+    return ShardedJSONStorage(path, storage_format=storage_format)
+
+
+# Хранилища: имя -> (путь по умолчанию, фабрика(путь, формат файла))
+BACKENDS: Dict[str, Any] = {
+    "json": (
+        "data/vacancies.json",
+        lambda path, storage_format: JSONStorage(
+            path, storage_format=storage_format
+        ),
+    ),
+    "jsonl-mmap": (
+        "data/vacancies.jsonl",
+        lambda path, storage_format: _mmap_storage(path),
+    ),
+    "sharded": (
+        "data/shards",
+        lambda path, storage_format: _sharded_storage(path, storage_format),
+    ),
+}
+
+EXPORT_FORMATS = ("json", "jsonl", "csv")
+CSV_FIELDS = (
+    "title",
+    "company",
+    "salary_from",
+    "salary_to",
+    "currency",
+    "url",
+    "requirements",
+    "description",
+)
+
+
+def read_queries(filename: str) -> List[str]:
+    """
+    Читает поисковые запросы из файла: по одному в строке
+
+    Пустые строки и строки, начинающиеся с #, пропускаются; повторы
+    удаляются. "-" — стандартный ввод.
+    """
+    if filename == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(filename, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    queries: List[str] = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#") and line not in queries:
+            queries.append(line)
+    return queries
+
+
+def fetch_query(
+    search_query: str, apis: Sequence[AbstractAPI], per_page: int
+) -> List[Vacancy]:
+    """
+    Получает вакансии по запросу, переходя к следующему API при неудаче
+
+    Raises:
+        Exception: Ошибка последнего API, если ни один не вернул данных
+            и хотя бы один завершился ошибкой
+    """
+    error: Optional[Exception] = None
+    for api in apis:
+        try:
+            hh_data = api.get_vacancies(search_query, per_page=per_page)
+        except Exception as e:  # noqa: BLE001
+            error = e
+            continue
+        if hh_data:
+            with METRICS.timer("vacancy_convert_seconds"):
+                vacancies = Vacancy.cast_to_object_list(hh_data)
+            METRICS.inc("vacancies_converted_total", len(vacancies))
+            return vacancies
+    if error is not None:
+        raise error
+    return []
+
+
+def run_fetch(
+    queries: Sequence[str],
+    cache: CachedSearch,
+    apis: Sequence[AbstractAPI],
+    concurrency: int = 4,
+    per_page: int = 50,
+    allow_empty: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Выполняет запросы параллельно и сохраняет результаты в хранилище
+
+    Запросы к API идут в пуле потоков (они ждут сеть), а запись в
+    хранилище — в вызывающем потоке по мере готовности ответов, по
+    одной транзакции на запрос.
+
+    Args:
+        queries: Поисковые запросы
+        cache: Поиск с журналом запросов поверх хранилища
+        apis: API в порядке попыток
+        concurrency: Количество одновременных запросов
+        per_page: Вакансий на запрос
+        allow_empty: Не считать пустой ответ ошибкой (API возвращает
+            пустой список и при сетевых ошибках)
+        on_result: Вызывается с итогом каждого запроса по готовности
+
+    Returns:
+        Отчет: итоги по запросам, суммарные количества и время
+    """
+    started = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+
+    def timed_fetch(search_query: str) -> Any:
+        start = time.perf_counter()
+        vacancies = fetch_query(search_query, apis, per_page)
+        return vacancies, time.perf_counter() - start
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {pool.submit(timed_fetch, query): query for query in queries}
+        for future in as_completed(futures):
+            result: Dict[str, Any] = {"query": futures[future], "status": "ok"}
+            try:
+                vacancies, seconds = future.result()
+                result["seconds"] = round(seconds, 3)
+                result["fetched"] = len(vacancies)
+                if vacancies:
+                    stored = cache.store(result["query"], vacancies, per_page)
+                    result.update(stored._asdict())
+                elif not allow_empty:
+                    result["status"] = "empty"
+            except Exception as e:  # noqa: BLE001
+                result["status"] = "error"
+                result["error"] = str(e) or type(e).__name__
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    elapsed = time.perf_counter() - started
+    fetched = sum(result.get("fetched", 0) for result in results)
+    failed = sum(result["status"] != "ok" for result in results)
+    order = {query: position for position, query in enumerate(queries)}
+    results.sort(key=lambda result: order[result["query"]])
+    return {
+        "queries": results,
+        "total": len(results),
+        "failed": failed,
+        "fetched": fetched,
+        "inserted": sum(result.get("inserted", 0) for result in results),
+        "updated": sum(result.get("updated", 0) for result in results),
+        "near_duplicates": sum(
+            result.get("near_duplicates", 0) for result in results
+        ),
+        "seconds": round(elapsed, 3),
+        "vacancies_per_second": (
+            round(fetched / elapsed, 1) if elapsed else 0.0
+        ),
+    }
+
+
+def fetch_exit_code(report: Dict[str, Any]) -> int:
+    """Код возврата fetch по отчету"""
+    if report["failed"] == 0:
+        return EXIT_OK
+    if report["failed"] < report["total"]:
+        return EXIT_INCOMPLETE
+    return EXIT_FAILURE
+
+
+# ----- Аргументы -----
+
+
+def _add_query_arguments(
+    parser: argparse.ArgumentParser, limit: Optional[int]
+) -> None:
+    """Фильтры, порядок и окно выдачи (поля VacancyQuery)"""
+    parser.add_argument(
+        "--keyword",
+        action="append",
+        default=[],
+        help="ключевое слово (можно несколько, должны встретиться все)",
+    )
+    parser.add_argument(
+        "--salary-min", type=int, help="зарплата от (salary_from)"
+    )
+    parser.add_argument(
+        "--salary-max", type=int, help="зарплата до (salary_to)"
+    )
+    parser.add_argument("--avg-min", type=float, help="средняя зарплата от")
+    parser.add_argument("--avg-max", type=float, help="средняя зарплата до")
+    parser.add_argument("--company", help="подстрока названия компании")
+    parser.add_argument(
+        "--order-by",
+        choices=[*ORDER_FIELDS, *(f"-{name}" for name in ORDER_FIELDS)],
+        help="поле сортировки, '-' — по убыванию (например, --order-by=-avg)",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=limit,
+        help=f"не больше N (по умолчанию {limit})",
+    )
+    parser.add_argument("--offset", type=int, default=0, help="пропустить N")
+
+
+def _build_query(args: argparse.Namespace) -> VacancyQuery:
+    """VacancyQuery по аргументам _add_query_arguments"""
+    return VacancyQuery(
+        keywords=tuple(args.keyword),
+        salary_min=args.salary_min,
+        salary_max=args.salary_max,
+        avg_min=args.avg_min,
+        avg_max=args.avg_max,
+        company=args.company,
+        order_by=args.order_by,
+        limit=args.limit,
+        offset=args.offset,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Разбор аргументов командной строки"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Пакетная работа с вакансиями HH.ru без диалога",
+    )
+    parser.add_argument(
+        "--storage", choices=sorted(BACKENDS), default="json", help="хранилище"
+    )
+    parser.add_argument("--path", help="файл или каталог хранилища")
+    parser.add_argument(
+        "--storage-format", choices=FORMATS, help="формат файла JSON-хранилища"
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="TARGET",
+        help="замерить этапы и выгрузить метрики: файл .prom (Prometheus), "
+        ".json или '-' (таблица в stderr)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    fetch = commands.add_parser("fetch", help="загрузить вакансии по запросам")
+    fetch.add_argument("queries", nargs="*", help="поисковые запросы")
+    fetch.add_argument(
+        "-f",
+        "--queries-file",
+        help="файл запросов, по одному в строке ('-' — stdin)",
+    )
+    fetch.add_argument("-c", "--concurrency", type=int, default=4)
+    fetch.add_argument("--per-page", type=int, default=50)
+    fetch.add_argument(
+        "--no-fallback",
+        action="store_true",
+        help="не использовать резервный API",
+    )
+    fetch.add_argument(
+        "--allow-empty", action="store_true", help="пустой ответ — не ошибка"
+    )
+    fetch.add_argument("--query-log", default="data/query_log.json")
+    fetch.add_argument("--json", action="store_true", help="отчет в JSON")
+
+    query = commands.add_parser("query", help="вывести вакансии из хранилища")
+    _add_query_arguments(query, limit=20)
+    query.add_argument(
+        "--output-format",
+        choices=("table", "full", "json", "jsonl"),
+        default="table",
+    )
+
+    export = commands.add_parser("export", help="выгрузить вакансии в файл")
+    export.add_argument("output", help="файл ('-' — stdout)")
+    export.add_argument(
+        "--export-format", choices=EXPORT_FORMATS, default="json"
+    )
+    _add_query_arguments(export, limit=None)
+
+    stats = commands.add_parser("stats", help="статистика зарплат")
+    _add_query_arguments(stats, limit=None)
+    stats.add_argument("--top-companies", type=int, default=10)
+    stats.add_argument("--json", action="store_true", help="сводки в JSON")
+
+    schedule = commands.add_parser(
+        "schedule", help="обновлять сохраненные поиски по расписанию"
+    )
+    schedule.add_argument(
+        "searches_file", help='JSON: [{"query": ..., "interval": секунд}, ...]'
+    )
+    schedule.add_argument("-c", "--concurrency", type=int, default=4)
+    schedule.add_argument(
+        "--jitter",
+        type=float,
+        default=0.1,
+        help="случайный разброс интервалов",
+    )
+    schedule.add_argument(
+        "--once",
+        action="store_true",
+        help="обновить поиски, которым пора, и выйти",
+    )
+    schedule.add_argument("--query-log", default="data/query_log.json")
+    schedule.add_argument(
+        "--json", action="store_true", help="состояние в JSON"
+    )
+    return parser
+
+
+# ----- Команды -----
+
+
+def _log(message: str) -> None:
+    """Служебное сообщение в stderr (stdout остается для данных)"""
+    print(message, file=sys.stderr)
+
+
+def _command_fetch(args: argparse.Namespace, storage: AbstractStorage) -> int:
+    queries = list(args.queries)
+    if args.queries_file:
+        queries += read_queries(args.queries_file)
+    queries = list(dict.fromkeys(queries))
+    if not queries:
+        _log("Не заданы поисковые запросы")
+        return EXIT_USAGE
+
+    apis: List[AbstractAPI] = [HeadHunterAPI()]
+    if not args.no_fallback:
+        apis.append(FallbackHeadHunterAPI())
+    cache = CachedSearch(apis[0], storage, log_filename=args.query_log)
+
+    def show(result: Dict[str, Any]) -> None:
+        if result["status"] == "error":
+            line = f"ошибка: {result['error']}"
+        else:
+            line = (
+                f"получено {result['fetched']}, "
+                f"новых {result.get('inserted', 0)}, "
+                f"обновлено {result.get('updated', 0)} "
+                f"за {result['seconds']} с"
+            )
+        _log(f"[{result['status']}] {result['query']}: {line}")
+
+    # Диагностика API печатается через print: уводим ее в stderr,
+    # чтобы stdout содержал только отчет
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_fetch(
+            queries,
+            cache,
+            apis,
+            concurrency=args.concurrency,
+            per_page=args.per_page,
+            allow_empty=args.allow_empty,
+            on_result=None if args.json else show,
+        )
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(
+            f"Запросов: {report['total']}, с ошибкой: {report['failed']}; "
+            f"вакансий: {report['fetched']} (новых {report['inserted']}, "
+            f"обновлено {report['updated']}) за {report['seconds']} с, "
+            f"{report['vacancies_per_second']} вакансий/с"
+        )
+    return fetch_exit_code(report)
+
+
+def _to_jsonl(vacancies: Sequence[Vacancy]) -> str:
+    """Вакансии в формате JSON Lines"""
+    return "".join(
+        json.dumps(vacancy.to_dict(), ensure_ascii=False) + "\n"
+        for vacancy in vacancies
+    )
+
+
+def _command_query(args: argparse.Namespace, storage: AbstractStorage) -> int:
+    vacancies = list(storage.query(_build_query(args)))
+    if args.output_format == "json":
+        print(
+            json.dumps(
+                [vacancy.to_dict() for vacancy in vacancies],
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+    elif args.output_format == "jsonl":
+        sys.stdout.write(_to_jsonl(vacancies))
+    elif vacancies:
+        sys.stdout.write(
+            render_vacancies(vacancies, compact=args.output_format == "table")
+        )
+    return EXIT_OK if vacancies else EXIT_INCOMPLETE
+
+
+def write_export(
+    vacancies: Sequence[Vacancy], out: TextIO, export_format: str
+) -> None:
+    """Записывает вакансии в формате json, jsonl или csv"""
+    if export_format == "json":
+        json.dump(
+            [vacancy.to_dict() for vacancy in vacancies],
+            out,
+            ensure_ascii=False,
+            indent=2,
+        )
+        out.write("\n")
+    elif export_format == "jsonl":
+        out.write(_to_jsonl(vacancies))
+    else:
+        import csv
+
+        writer = csv.DictWriter(
+            out, fieldnames=CSV_FIELDS, extrasaction="ignore"
+        )
+        writer.writeheader()
+        writer.writerows(vacancy.to_dict() for vacancy in vacancies)
+
+
+def _command_export(args: argparse.Namespace, storage: AbstractStorage) -> int:
+    vacancies = list(storage.query(_build_query(args)))
+    if args.output == "-":
+        write_export(vacancies, sys.stdout, args.export_format)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            write_export(vacancies, f, args.export_format)
+    _log(f"Выгружено вакансий: {len(vacancies)}")
+    return EXIT_OK
+
+
+def _stats_dict(stats: "SalaryStats") -> Dict[str, Any]:
+    return {name: round(value, 2) for name, value in stats._asdict().items()}
+
+
+def stats_payload(
+    frame: "SalaryFrame", top_companies: int = 10
+) -> Dict[str, Any]:
+    """
+    Статистика зарплат для вывода в JSON
+
+    Returns:
+        Всего вакансий, сводки по валютам и по top_companies компаниям
+        в самой частой валюте
+    """
+    by_currency = frame.by_currency()
+    companies: Dict[str, Any] = {}
+    if by_currency:
+        base = frame.where(currency=next(iter(by_currency)))
+        top = list(base.by_company().items())[:top_companies]
+        companies = {name: _stats_dict(stats) for name, stats in top}
+    return {
+        "total": len(frame),
+        "by_currency": {
+            name: _stats_dict(stats) for name, stats in by_currency.items()
+        },
+        "top_companies": companies,
+    }
+
+
+def _command_stats(args: argparse.Namespace, storage: AbstractStorage) -> int:
+    from .analytics.salary import SalaryFrame, salary_report
+
+    frame = SalaryFrame.from_storage(storage, _build_query(args))
+    if not args.json:
+        report = salary_report(frame, top_companies=args.top_companies)
+        sys.stdout.write(report)
+        return EXIT_OK
+    payload = stats_payload(frame, args.top_companies)
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return EXIT_OK
+
+
+def _command_schedule(
+    args: argparse.Namespace, storage: AbstractStorage
+) -> int:
+    from .services.scheduler import (
+        RefreshScheduler,
+        SavedSearch,
+        read_saved_searches,
+    )
+
+    searches = read_saved_searches(args.searches_file)
+    if not searches:
+        _log("Нет сохраненных поисков")
+        return EXIT_USAGE
+
+    def show(search: SavedSearch) -> None:
+        if search.last_error is None:
+            line = f"получено {search.last_fetched}"
+        else:
+            line = f"ошибка: {search.last_error}"
+        _log(f"{search.query}: {line} за {search.last_duration:.2f} с")
+
+    cache = CachedSearch(HeadHunterAPI(), storage, log_filename=args.query_log)
+    scheduler = RefreshScheduler(
+        cache, args.concurrency, args.jitter, on_result=show
+    )
+    for search in searches:
+        scheduler.add(**search)
+    # Как и в fetch, диагностика API идет в stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            if args.once:
+                scheduler.run_pending()
+                scheduler.wait()
+            else:
+                _log("Расписание запущено, Ctrl+C — остановка")
+                scheduler.run_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            scheduler.close()
+
+    status = scheduler.status()
+    if args.json:
+        print(json.dumps(status, ensure_ascii=False, indent=2))
+    failed = sum(row["consecutive_failures"] > 0 for row in status)
+    if failed == 0:
+        return EXIT_OK
+    return EXIT_INCOMPLETE if failed < len(status) else EXIT_FAILURE
+
+
+COMMANDS: Dict[str, Callable[[argparse.Namespace, AbstractStorage], int]] = {
+    "fetch": _command_fetch,
+    "query": _command_query,
+    "export": _command_export,
+    "stats": _command_stats,
+    "schedule": _command_schedule,
+}
+
+
+def open_storage(args: argparse.Namespace) -> AbstractStorage:
+    """Хранилище, выбранное аргументами --storage, --path, --storage-format"""
+    default_path, factory = BACKENDS[args.storage]
+    return factory(args.path or default_path, args.storage_format)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Точка входа пакетного режима
+
+    Returns:
+        Код возврата (EXIT_*)
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    for name in ("concurrency", "per_page", "limit", "top_companies"):
+        value = getattr(args, name, None)
+        if value is not None and value <= 0:
+            option = name.replace("_", "-")
+            parser.error(f"--{option} должно быть положительным")
+    if getattr(args, "offset", 0) < 0:
+        parser.error("--offset не может быть отрицательным")
+
+    if args.metrics:
+        METRICS.enable()
+    started = time.perf_counter()
+    storage: Optional[AbstractStorage] = None
+    try:
+        storage = open_storage(args)
+        code = COMMANDS[args.command](args, storage)
+    except (OSError, ValueError) as e:
+        _log(f"Ошибка: {e}")
+        return EXIT_FAILURE
+    finally:
+        close = getattr(storage, "close", None)
+        if close is not None:
+            close()
+        if args.metrics:
+            METRICS.export(args.metrics)
+    _log(f"Время выполнения: {time.perf_counter() - started:.3f} с")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
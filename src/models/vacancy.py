@@ -16,6 +16,7 @@ class Vacancy:
         "_description",
         "_requirements",
         "_company",
+        "_search_text",
     )
 
     def __init__(
@@ -38,6 +39,8 @@ class Vacancy:
         self._description = description
         self._requirements = requirements
         self._company = company
+        # Текст для поиска по ключевым словам, вычисляется при первом поиске
+        self._search_text: Optional[str] = None
 
     @property
     def title(self) -> str:
@@ -82,6 +85,29 @@ class Vacancy:
             return float(self._salary_to)
         return 0.0
 
+    @property
+    def search_text(self) -> str:
+        """
+        Текстовые поля вакансии одной строкой в нижнем регистре
+
+        Поля вакансии не меняются, поэтому строка строится один раз.
+        """
+        if self._search_text is None:
+            self._search_text = self.build_search_text(
+                self._title,
+                self._description,
+                self._requirements,
+                self._company,
+            )
+        return self._search_text
+
+    @staticmethod
+    def build_search_text(
+        title: str, description: str, requirements: str, company: str
+    ) -> str:
+        """Строка для поиска по ключевым словам из текстовых полей"""
+        return f"{title} {description} {requirements} {company}".lower()
+
     def _validate_title(self, title: str) -> str:
         """Валидация названия вакансии"""
         if not title or not isinstance(title, str):
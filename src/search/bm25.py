@@ -0,0 +1,210 @@
+import heapq
+import json
+import math
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from ..storage.keyword_index import tokenize
+from .stemmer import stem
+
+# Поля записи и их веса: совпадение в названии важнее, чем в описании
+FIELD_WEIGHTS = {"title": 3.0, "requirements": 1.5, "description": 1.0}
+
+_FORMAT_VERSION = 1
+
+
+def analyze(text: str) -> List[str]:
+    """Токены текста, приведенные к основам"""
+    return [stem(token) for token in tokenize(text)]
+
+
+class BM25Index:
+    """
+    Инвертированный индекс по основам слов с ранжированием BM25
+
+    Документ — запись вакансии (словарь формата Vacancy.to_dict) с
+    внешним строковым ключом. Частота термина в документе считается
+    с весами полей из FIELD_WEIGHTS (упрощенный BM25F), длина документа —
+    взвешенное число токенов.
+
+    Поиск обрабатывает термины запроса по убыванию максимально
+    возможного вклада (алгоритм MaxScore): как только оставшиеся термины
+    в сумме не могут поднять новый документ выше текущего k-го
+    результата, новые документы больше не рассматриваются, а оставшиеся
+    термины досчитываются только для уже найденных.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._keys: List[str] = []
+        self._lengths: List[float] = []
+        self._total_length = 0.0
+        # Основа -> {номер документа: взвешенная частота}
+        self._postings: Dict[str, Dict[int, float]] = {}
+
+    def __len__(self) -> int:
+        """Количество документов"""
+        return len(self._keys)
+
+    def add(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Индексирует документ
+
+        Args:
+            key: Ключ документа (возвращается при поиске)
+            data: Запись вакансии
+        """
+        doc = len(self._keys)
+        frequencies: Dict[str, float] = {}
+        length = 0.0
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in analyze(data.get(field) or ""):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+                length += weight
+
+        self._keys.append(key)
+        self._lengths.append(length)
+        self._total_length += length
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[doc] = frequency
+
+    @classmethod
+    def build(
+        cls, documents: Iterable[Tuple[str, Dict[str, Any]]], **params: float
+    ) -> "BM25Index":
+        """Строит индекс по парам (ключ, запись)"""
+        index = cls(**params)
+        for key, data in documents:
+            index.add(key, data)
+        return index
+
+    def idf(self, term: str) -> float:
+        """Обратная частота документов (вариант без отрицательных значений)"""
+        df = len(self._postings.get(term, ()))
+        return math.log(1 + (len(self._keys) - df + 0.5) / (df + 0.5))
+
+    def search(self, text: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Ищет документы по тексту запроса
+
+        Args:
+            text: Запрос (слова в любой форме)
+            top_k: Количество результатов
+
+        Returns:
+            Пары (ключ, оценка) по убыванию оценки; при равной оценке —
+            в порядке добавления
+        """
+        if top_k <= 0 or not self._keys:
+            return []
+
+        k1, b = self.k1, self.b
+        avg_length = self._total_length / len(self._keys) or 1.0
+        lengths = self._lengths
+
+        # Вклад термина не больше idf * (k1 + 1): tf / (tf + K) < 1
+        terms = sorted(
+            (
+                (self.idf(term) * (k1 + 1), term)
+                for term in set(analyze(text))
+                if term in self._postings
+            ),
+            reverse=True,
+        )
+        remaining = sum(bound for bound, _ in terms)
+
+        scores: Dict[int, float] = {}
+        for bound, term in terms:
+            # Порог: k-я лучшая оценка; документ, которого еще нет среди
+            # найденных, наберет не больше remaining
+            open_to_new = True
+            if len(scores) >= top_k:
+                threshold = heapq.nlargest(top_k, scores.values())[-1]
+                open_to_new = remaining > threshold
+            remaining -= bound
+
+            idf = bound / (k1 + 1)
+            posting = self._postings[term]
+            if open_to_new:
+                docs: Iterable[int] = posting
+            else:
+                docs = [doc for doc in scores if doc in posting]
+            for doc in docs:
+                tf = posting[doc]
+                norm = k1 * (1 - b + b * lengths[doc] / avg_length)
+                score = idf * tf * (k1 + 1) / (tf + norm)
+                scores[doc] = scores.get(doc, 0.0) + score
+
+        best = heapq.nlargest(
+            top_k, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+        return [(self._keys[doc], score) for doc, score in best]
+
+    # ----- Сохранение -----
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Сериализует индекс"""
+        return {
+            "version": _FORMAT_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "keys": self._keys,
+            "lengths": self._lengths,
+            "postings": {
+                term: [list(posting), list(posting.values())]
+                for term, posting in self._postings.items()
+            },
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "BM25Index":
+        """Восстанавливает индекс из to_payload"""
+        if payload.get("version") != _FORMAT_VERSION:
+            raise ValueError("Неизвестная версия индекса BM25")
+        index = cls(payload["k1"], payload["b"])
+        index._keys = payload["keys"]
+        index._lengths = payload["lengths"]
+        index._total_length = sum(index._lengths)
+        index._postings = {
+            term: dict(zip(docs, frequencies))
+            for term, (docs, frequencies) in payload["postings"].items()
+        }
+        return index
+
+    def save(
+        self, filename: str, signature: Optional[List[int]] = None
+    ) -> None:
+        """
+        Сохраняет индекс в файл (через временный файл и замену)
+
+        Args:
+            filename: Путь к файлу индекса
+            signature: Подпись данных, по которым построен индекс
+        """
+        payload = self.to_payload()
+        payload["signature"] = signature
+        tmp_filename = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as f:
+            f.write(
+                json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+            )
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(
+        cls, filename: str, signature: Optional[List[int]] = None
+    ) -> Optional["BM25Index"]:
+        """
+        Загружает индекс, если он построен по данным с той же подписью
+
+        Returns:
+            Индекс или None, если файла нет, он поврежден или устарел
+        """
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("signature") != signature:
+                return None
+            return cls.from_payload(payload)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
@@ -0,0 +1,110 @@
+import os
+from typing import List, Optional, Tuple
+from ..models.vacancy import Vacancy
+from ..storage.identity import record_key
+from ..storage.json_storage import JSONStorage
+from ..storage.query import VacancyQuery
+from .bm25 import BM25Index
+
+
+def rank_vacancies(
+    vacancies: List[Vacancy], text: str, top_k: int = 10
+) -> List[Tuple[Vacancy, float]]:
+    """
+    Ранжирует список вакансий по запросу BM25 (без сохранения индекса)
+
+    Args:
+        vacancies: Вакансии
+        text: Запрос
+        top_k: Количество результатов
+
+    Returns:
+        Пары (вакансия, оценка) по убыванию оценки
+    """
+    index = BM25Index.build(
+        (str(position), vacancy.to_dict())
+        for position, vacancy in enumerate(vacancies)
+    )
+    return [
+        (vacancies[int(key)], score)
+        for key, score in index.search(text, top_k)
+    ]
+
+
+class VacancySearchEngine:
+    """
+    Полнотекстовый поиск по хранилищу с ранжированием BM25
+
+    Индекс хранится рядом с файлом хранилища (*.bm25.json) вместе с
+    подписью файла данных (размер и время изменения). При открытии и
+    перед поиском подпись сверяется с текущей: индекс перестраивается,
+    только если хранилище изменилось, поэтому при запуске готовый индекс
+    просто читается с диска.
+    """
+
+    def __init__(
+        self, storage: JSONStorage, index_filename: Optional[str] = None
+    ):
+        self._storage = storage
+        self._index_filename = (
+            index_filename or storage.filename + ".bm25.json"
+        )
+        self._signature: Optional[List[int]] = None
+        self._index: Optional[BM25Index] = None
+        self.index()
+
+    def _data_signature(self) -> Optional[List[int]]:
+        """Подпись файла хранилища"""
+        try:
+            stat = os.stat(self._storage.filename)
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def index(self) -> BM25Index:
+        """
+        Актуальный индекс: из памяти, с диска или построенный заново
+
+        Returns:
+            Индекс BM25
+        """
+        signature = self._data_signature()
+        if self._index is not None and signature == self._signature:
+            return self._index
+
+        index = BM25Index.load(self._index_filename, signature)
+        if index is None:
+            # Подпись берется до чтения: если файл изменится во время
+            # построения, индекс будет перестроен при следующем поиске
+            index = BM25Index.build(
+                (record_key(data), data)
+                for data in (
+                    vacancy.to_dict()
+                    for vacancy in self._storage.query(VacancyQuery())
+                )
+            )
+            index.save(self._index_filename, signature)
+        self._index = index
+        self._signature = signature
+        return index
+
+    def search(
+        self, text: str, top_k: int = 10
+    ) -> List[Tuple[Vacancy, float]]:
+        """
+        Ищет вакансии по запросу
+
+        Args:
+            text: Запрос (слова в любой форме)
+            top_k: Количество результатов
+
+        Returns:
+            Пары (вакансия, оценка) по убыванию оценки
+        """
+        ranked = self.index().search(text, top_k)
+        vacancies = self._storage.get_by_keys(key for key, _ in ranked)
+        return [
+            (vacancy, score)
+            for vacancy, (_, score) in zip(vacancies, ranked)
+            if vacancy is not None
+        ]
@@ -0,0 +1,149 @@
+import re
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+# Стеммер русского языка по алгоритму Snowball (Porter, snowball.tartarus.org):
+# окончание ищется только в области RV — после первой гласной слова;
+# из подходящих окончаний группы выбирается самое длинное.
+
+_VOWELS = "аеиоуыэюя"
+_CYRILLIC_RE = re.compile(r"[а-я]")
+
+# Окончания первых групп допустимы только после «а» или «я»
+_AFTER_A = ("а", "я")
+
+_PERFECTIVE_GERUND_1 = ("в", "вши", "вшись")
+_PERFECTIVE_GERUND_2 = ("ив", "ивши", "ившись", "ыв", "ывши", "ывшись")
+_ADJECTIVE = (
+    "ее", "ие", "ые", "ое", "ими", "ыми", "ей", "ий", "ый", "ой", "ем", "им",
+    "ым", "ом", "его", "ого", "ему", "ому", "их", "ых", "ую", "юю", "ая",
+    "яя", "ою", "ею",
+)  # fmt: skip
+_PARTICIPLE_1 = ("ем", "нн", "вш", "ющ", "щ")
+_PARTICIPLE_2 = ("ивш", "ывш", "ующ")
+_REFLEXIVE = ("ся", "сь")
+_VERB_1 = (
+    "ла", "на", "ете", "йте", "ли", "й", "л", "ем", "н", "ло", "но", "ет",
+    "ют", "ны", "ть", "ешь", "нно",
+)  # fmt: skip
+_VERB_2 = (
+    "ила", "ыла", "ена", "ейте", "уйте", "ите", "или", "ыли", "ей", "уй",
+    "ил", "ыл", "им", "ым", "ен", "ило", "ыло", "ено", "ят", "ует", "уют",
+    "ит", "ыт", "ены", "ить", "ыть", "ишь", "ую", "ю",
+)  # fmt: skip
+_NOUN = (
+    "а", "ев", "ов", "ие", "ье", "е", "иями", "ями", "ами", "еи", "ии", "и",
+    "ией", "ей", "ой", "ий", "й", "иям", "ям", "ием", "ем", "ам", "ом", "о",
+    "у", "ах", "иях", "ях", "ы", "ь", "ию", "ью", "ю", "ия", "ья", "я",
+)  # fmt: skip
+_SUPERLATIVE = ("ейш", "ейше")
+_DERIVATIONAL = ("ост", "ость")
+
+
+def _strip(
+    word: str, endings: Sequence[str], after_a: Sequence[str] = ()
+) -> Optional[str]:
+    """
+    Удаляет самое длинное подходящее окончание
+
+    Args:
+        word: Область слова, в которой ищется окончание
+        endings: Окончания без дополнительных условий
+        after_a: Окончания, допустимые только после «а» или «я»
+
+    Returns:
+        Слово без окончания или None, если окончание не найдено
+    """
+    candidates: List[Tuple[int, bool]] = [
+        (len(ending), False) for ending in endings if word.endswith(ending)
+    ]
+    candidates += [
+        (len(ending), True) for ending in after_a if word.endswith(ending)
+    ]
+    for length, needs_a in sorted(candidates, reverse=True):
+        rest = word[:-length]
+        if not needs_a or rest.endswith(_AFTER_A):
+            return rest
+    return None
+
+
+def _region_after_vc(word: str, start: int) -> int:
+    """Начало области после первой пары «гласная, согласная» от start"""
+    for position in range(start + 1, len(word)):
+        if word[position] not in _VOWELS and word[position - 1] in _VOWELS:
+            return position + 1
+    return len(word)
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """
+    Основа русского слова
+
+    Слово должно быть в нижнем регистре, «ё» заменено на «е» (как после
+    keyword_index.normalize_text). Слова без кириллицы не изменяются.
+
+    Args:
+        word: Слово
+
+    Returns:
+        Основа слова
+    """
+    if not _CYRILLIC_RE.search(word):
+        return word
+
+    rv_start = next(
+        (
+            position + 1
+            for position, char in enumerate(word)
+            if char in _VOWELS
+        ),
+        len(word),
+    )
+    r2_start = _region_after_vc(word, _region_after_vc(word, 0))
+    prefix, rv = word[:rv_start], word[rv_start:]
+
+    # Шаг 1: деепричастие; иначе возвратная частица и затем
+    # прилагательное (с причастием), глагол или существительное
+    result = _strip(rv, _PERFECTIVE_GERUND_2, _PERFECTIVE_GERUND_1)
+    if result is None:
+        reflexive = _strip(rv, _REFLEXIVE)
+        if reflexive is not None:
+            rv = reflexive
+        adjective = _strip(rv, _ADJECTIVE)
+        if adjective is not None:
+            result = _strip(adjective, _PARTICIPLE_2, _PARTICIPLE_1)
+            if result is None:
+                result = adjective
+        else:
+            result = _strip(rv, _VERB_2, _VERB_1)
+            if result is None:
+                result = _strip(rv, _NOUN)
+        if result is None:
+            result = rv
+    rv = result
+
+    # Шаг 2: конечная «и»
+    if rv.endswith("и"):
+        rv = rv[:-1]
+
+    # Шаг 3: словообразовательный суффикс в области R2
+    r2 = max(0, r2_start - rv_start)
+    for ending in _DERIVATIONAL:
+        if rv.endswith(ending) and len(rv) - len(ending) >= r2:
+            rv = rv[: -len(ending)]
+            break
+
+    # Шаг 4: «нн» -> «н», превосходная степень или мягкий знак
+    if rv.endswith("нн"):
+        rv = rv[:-1]
+    else:
+        superlative = _strip(rv, _SUPERLATIVE)
+        if superlative is not None:
+            if superlative.endswith("нн"):
+                superlative = superlative[:-1]
+            rv = superlative
+        elif rv.endswith("ь"):
+            rv = rv[:-1]
+
+    return prefix + rv
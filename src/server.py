@@ -0,0 +1,520 @@
+"""
+Локальный HTTP-сервис запросов к хранилищу вакансий
+
+Хранилище открывается один раз, вакансии и их порядок по зарплате
+держатся в памяти, поэтому запрос не платит за загрузку файла и
+построение индексов. Ответы — JSON, только GET.
+
+Запуск из корня проекта:
+    python -m src.server --port 8080
+    curl 'http://127.0.0.1:8080/search?keyword=python&salary=150000-300000'
+
+Маршруты (ключевые слова можно повторять: keyword=python&keyword=django):
+    /search        keyword, any, exclude, salary, order=salary, limit, offset
+    /top           n, keyword, any, exclude, salary
+    /salary-range  range, limit, offset
+    /stats         top_companies
+    /health
+Отбор совпадает с filter_vacancies и get_vacancies_by_salary, топ —
+с sort_vacancies + get_top_vacancies (src/utils/helpers.py).
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import parse_qs, urlsplit
+from .cli import BACKENDS, open_storage, stats_payload
+from .models.vacancy import Vacancy
+from .storage.abstract_storage import AbstractStorage
+from .storage.codecs import FORMATS
+from .utils.helpers import sort_vacancies
+from .utils.pipeline import Query
+
+# Вакансий в ответе /search и /salary-range, если limit не задан
+DEFAULT_LIMIT = 50
+
+Params = Dict[str, List[str]]
+
+
+class Snapshot(NamedTuple):
+    """Вакансии хранилища на момент загрузки"""
+
+    vacancies: List[Vacancy]
+    # Те же вакансии по убыванию зарплаты (как sort_vacancies)
+    by_salary: List[Vacancy]
+    loaded_at: float
+
+
+def _same_vacancies(first: List[Vacancy], second: List[Vacancy]) -> bool:
+    """Списки из тех же объектов (хранилище отдало их из своего кэша)"""
+    return len(first) == len(second) and all(
+        a is b for a, b in zip(first, second)
+    )
+
+
+class VacancyService:
+    """
+    Запросы к хранилищу со снимком вакансий и кэшем ответов в памяти
+
+    Снимок перечитывается из хранилища не чаще раза в refresh_interval
+    секунд, так что изменения других процессов (например, src.cli fetch)
+    становятся видны с этой задержкой. JSONStorage отдает неизменившиеся
+    данные из своего кэша теми же объектами — тогда снимок и кэш ответов
+    сохраняются. Ответы кэшируются по параметрам запроса (LRU на
+    cache_size ответов) до смены снимка.
+
+    Методы можно вызывать из нескольких потоков: запросы выполняются
+    по неизменяемому снимку без блокировок, под блокировкой — только
+    смена снимка и обращения к кэшу. Ответы из кэша общие, изменять их
+    не следует.
+    """
+
+    def __init__(
+        self,
+        storage: AbstractStorage,
+        refresh_interval: float = 1.0,
+        cache_size: int = 256,
+    ):
+        if refresh_interval < 0:
+            raise ValueError("refresh_interval не может быть отрицательным")
+        if cache_size < 0:
+            raise ValueError("cache_size не может быть отрицательным")
+        self._storage = storage
+        self._refresh_interval = refresh_interval
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Snapshot] = None
+        self._checked_at = 0.0
+        self._responses: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]"
+        self._responses = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _now(self) -> float:
+        """Текущее время (монотонное, для проверки свежести снимка)"""
+        return time.monotonic()
+
+    def snapshot(self) -> Snapshot:
+        """Текущий снимок; перечитывает хранилище, если пора"""
+        with self._lock:
+            now = self._now()
+            if (
+                self._snapshot is None
+                or now - self._checked_at >= self._refresh_interval
+            ):
+                vacancies = self._storage.get_vacancies()
+                if self._snapshot is None or not _same_vacancies(
+                    vacancies, self._snapshot.vacancies
+                ):
+                    self._snapshot = Snapshot(
+                        vacancies, sort_vacancies(vacancies), time.time()
+                    )
+                    self._responses.clear()
+                self._checked_at = now
+            return self._snapshot
+
+    def _cached(
+        self,
+        key: Tuple[Any, ...],
+        compute: Callable[[Snapshot], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Ответ из кэша или вычисленный по текущему снимку"""
+        snapshot = self.snapshot()
+        with self._lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+                self.hits += 1
+                return response
+            self.misses += 1
+
+        response = compute(snapshot)
+        with self._lock:
+            # Пока ответ считался, снимок мог смениться
+            if self._cache_size and self._snapshot is snapshot:
+                self._responses[key] = response
+                if len(self._responses) > self._cache_size:
+                    self._responses.popitem(last=False)
+        return response
+
+    @staticmethod
+    def _select(
+        vacancies: List[Vacancy],
+        keywords: Sequence[str],
+        any_words: Sequence[str],
+        exclude_words: Sequence[str],
+        salary_range: str,
+    ) -> Query:
+        """Конвейер отбора (как filter_vacancies и get_vacancies_by_salary)"""
+        return (
+            Query(vacancies)
+            .keywords(
+                list(keywords),
+                any_words=list(any_words),
+                exclude_words=list(exclude_words),
+            )
+            .salary(salary_range)
+        )
+
+    def search(
+        self,
+        keywords: Sequence[str] = (),
+        any_words: Sequence[str] = (),
+        exclude_words: Sequence[str] = (),
+        salary_range: str = "",
+        order: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Поиск по ключевым словам и диапазону зарплат
+
+        Args:
+            keywords: Слова, которые должны встретиться все
+            any_words: Должно встретиться хотя бы одно из этих слов
+            exclude_words: Ни одно из этих слов не должно встретиться
+            salary_range: Диапазон средней зарплаты ("100000-150000",
+                "100000"); строка неверного формата не находит ничего
+            order: "salary" — по убыванию зарплаты, None — порядок хранилища
+            limit: Максимум вакансий в ответе (None — все)
+            offset: Сколько подходящих вакансий пропустить
+
+        Returns:
+            {"total": всего подходящих, "count": в ответе, "items": [...]}
+        """
+        if order not in (None, "salary"):
+            raise ValueError(f"Неизвестный порядок: {order}")
+        key = (
+            "search",
+            tuple(keywords),
+            tuple(any_words),
+            tuple(exclude_words),
+            salary_range,
+            order,
+            limit,
+            offset,
+        )
+
+        def compute(snapshot: Snapshot) -> Dict[str, Any]:
+            source = snapshot.by_salary if order else snapshot.vacancies
+            matched = self._select(
+                source, keywords, any_words, exclude_words, salary_range
+            ).to_list()
+            end = None if limit is None else offset + limit
+            return _page(len(matched), matched[offset:end])
+
+        return self._cached(key, compute)
+
+    def top(
+        self,
+        top_n: int,
+        keywords: Sequence[str] = (),
+        any_words: Sequence[str] = (),
+        exclude_words: Sequence[str] = (),
+        salary_range: str = "",
+    ) -> Dict[str, Any]:
+        """
+        Топ N подходящих вакансий по зарплате
+
+        Вакансии без зарплаты идут после всех с зарплатой, как в
+        sort_vacancies + get_top_vacancies. Снимок уже упорядочен по
+        зарплате, поэтому перебор останавливается на N-й подходящей.
+
+        Returns:
+            {"count": в ответе, "items": [...]}
+        """
+        key = (
+            "top",
+            top_n,
+            tuple(keywords),
+            tuple(any_words),
+            tuple(exclude_words),
+            salary_range,
+        )
+
+        def compute(snapshot: Snapshot) -> Dict[str, Any]:
+            matched = self._select(
+                snapshot.by_salary,
+                keywords,
+                any_words,
+                exclude_words,
+                salary_range,
+            )
+            items = list(islice(matched, max(top_n, 0)))
+            return {"count": len(items), "items": [v.to_dict() for v in items]}
+
+        return self._cached(key, compute)
+
+    def salary_range(
+        self,
+        salary_range: str,
+        limit: Optional[int] = DEFAULT_LIMIT,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """Вакансии в диапазоне зарплат (как get_vacancies_by_salary)"""
+        return self.search(
+            salary_range=salary_range, limit=limit, offset=offset
+        )
+
+    def stats(self, top_companies: int = 10) -> Dict[str, Any]:
+        """Статистика зарплат в формате src.cli stats --json"""
+
+        def compute(snapshot: Snapshot) -> Dict[str, Any]:
+            from .analytics.salary import SalaryFrame
+
+            frame = SalaryFrame.from_vacancies(snapshot.vacancies)
+            return stats_payload(frame, top_companies)
+
+        return self._cached(("stats", top_companies), compute)
+
+    def health(self) -> Dict[str, Any]:
+        """Состояние сервиса: размер снимка и работа кэша"""
+        snapshot = self.snapshot()
+        with self._lock:
+            cached = len(self._responses)
+        return {
+            "vacancies": len(snapshot.vacancies),
+            "loaded_at": snapshot.loaded_at,
+            "cache": {
+                "size": cached,
+                "hits": self.hits,
+                "misses": self.misses,
+            },
+        }
+
+
+def _page(total: int, items: List[Vacancy]) -> Dict[str, Any]:
+    return {
+        "total": total,
+        "count": len(items),
+        "items": [vacancy.to_dict() for vacancy in items],
+    }
+
+
+# ----- Разбор параметров запроса -----
+
+
+def _text_param(params: Params, name: str) -> str:
+    values = params.get(name)
+    return values[-1] if values else ""
+
+
+def _int_param(
+    params: Params, name: str, default: Optional[int], minimum: int
+) -> Optional[int]:
+    value = _text_param(params, name)
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} должно быть целым числом") from None
+    if number < minimum:
+        raise ValueError(f"{name} должно быть не меньше {minimum}")
+    return number
+
+
+def _filter_params(params: Params) -> Dict[str, Any]:
+    return {
+        "keywords": params.get("keyword", []),
+        "any_words": params.get("any", []),
+        "exclude_words": params.get("exclude", []),
+        "salary_range": _text_param(params, "salary"),
+    }
+
+
+def _route_search(service: VacancyService, params: Params) -> Dict[str, Any]:
+    return service.search(
+        **_filter_params(params),
+        order=_text_param(params, "order") or None,
+        limit=_int_param(params, "limit", DEFAULT_LIMIT, 1),
+        offset=_int_param(params, "offset", 0, 0) or 0,
+    )
+
+
+def _route_top(service: VacancyService, params: Params) -> Dict[str, Any]:
+    top_n = _int_param(params, "n", 10, 1) or 10
+    return service.top(top_n, **_filter_params(params))
+
+
+def _route_salary_range(
+    service: VacancyService, params: Params
+) -> Dict[str, Any]:
+    return service.salary_range(
+        _text_param(params, "range"),
+        limit=_int_param(params, "limit", DEFAULT_LIMIT, 1),
+        offset=_int_param(params, "offset", 0, 0) or 0,
+    )
+
+
+def _route_stats(service: VacancyService, params: Params) -> Dict[str, Any]:
+    return service.stats(_int_param(params, "top_companies", 10, 1) or 10)
+
+
+def _route_health(service: VacancyService, params: Params) -> Dict[str, Any]:
+    return service.health()
+
+
+ROUTES: Dict[str, Callable[[VacancyService, Params], Dict[str, Any]]] = {
+    "/search": _route_search,
+    "/top": _route_top,
+    "/salary-range": _route_salary_range,
+    "/stats": _route_stats,
+    "/health": _route_health,
+}
+
+
+# ----- HTTP -----
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Обработчик запросов: маршрут из ROUTES, ответ в JSON"""
+
+    server: "VacancyHTTPServer"
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        route = ROUTES.get(url.path.rstrip("/") or "/")
+        if route is None:
+            self._send(404, {"error": f"Неизвестный маршрут: {url.path}"})
+            return
+        try:
+            payload = route(self.server.service, parse_qs(url.query))
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+            return
+        self._send(200, payload)
+
+    def _send(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class VacancyHTTPServer(HTTPServer):
+    """
+    HTTP-сервер с пулом потоков
+
+    Каждое соединение обрабатывается в пуле из workers потоков: число
+    одновременно выполняемых запросов ограничено, остальные ждут
+    в очереди пула.
+    """
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        service: VacancyService,
+        workers: int = 8,
+        verbose: bool = False,
+    ):
+        super().__init__(address, _Handler)
+        self.service = service
+        self.verbose = verbose
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._pool.submit(self._process_in_pool, request, client_address)
+
+    def _process_in_pool(self, request: Any, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # noqa: BLE001
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Разбор аргументов командной строки"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server",
+        description="Локальный HTTP-сервис запросов к вакансиям",
+    )
+    parser.add_argument(
+        "--storage", choices=sorted(BACKENDS), default="json", help="хранилище"
+    )
+    parser.add_argument("--path", help="файл или каталог хранилища")
+    parser.add_argument(
+        "--storage-format", choices=FORMATS, help="формат файла при записи"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--workers", type=int, default=8, help="потоков обработки"
+    )
+    parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=1.0,
+        help="как часто проверять изменения хранилища, с",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        help="ответов в кэше (0 — без кэша)",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="выводить журнал запросов"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа сервиса"""
+    args = build_parser().parse_args(argv)
+    storage = open_storage(args)
+    service = VacancyService(storage, args.refresh_interval, args.cache_size)
+
+    started = time.perf_counter()
+    count = len(service.snapshot().vacancies)
+    elapsed = time.perf_counter() - started
+    print(
+        f"Загружено вакансий: {count} за {elapsed:.2f} с",
+        file=sys.stderr,
+    )
+    server = VacancyHTTPServer(
+        (args.host, args.port), service, args.workers, args.verbose
+    )
+    host, port = server.server_address[:2]
+    print(f"Сервис запущен: http://{host}:{port}/", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        close = getattr(storage, "close", None)
+        if close is not None:
+            close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
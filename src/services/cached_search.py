@@ -0,0 +1,259 @@
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from ..api.abstract_api import AbstractAPI
+from ..models.vacancy import Vacancy
+from ..storage.abstract_storage import AbstractStorage, UpsertResult
+from ..storage.identity import record_key
+from ..utils.metrics import METRICS
+
+
+def normalize_query(search_query: str) -> str:
+    """Приводит поисковый запрос к виду ключа кэша"""
+    return " ".join(search_query.lower().split())
+
+
+class CachedSearch:
+    """
+    Поиск вакансий с чтением через локальное хранилище
+
+    Для каждого запроса запоминается время последнего обращения к API,
+    размер страницы и ключи полученных вакансий (журнал запросов в
+    JSON-файле). Пока результаты свежее freshness секунд, поиск отдает
+    их из хранилища без сети: вакансии читаются по ключам
+    (get_by_keys), а не перебором хранилища.
+
+    Ключ кэша — только нормализованный запрос. Результаты, полученные с
+    per_page не меньше запрошенного, обрезаются до per_page; если
+    страница была меньше запрошенной и заполнена целиком, запрос
+    выполняется заново. Устаревшие результаты при background_refresh=True
+    отдаются сразу, а обновление запускается в фоновом потоке
+    (stale-while-revalidate); иначе запрос выполняется синхронно. Ошибки
+    фоновых обновлений пишутся в stderr и считаются в метрике
+    background_refresh_errors_total.
+    """
+
+    def __init__(
+        self,
+        api: AbstractAPI,
+        storage: AbstractStorage,
+        freshness: float = 600.0,
+        log_filename: str = "data/query_log.json",
+        background_refresh: bool = False,
+    ):
+        if freshness < 0:
+            raise ValueError("freshness не может быть отрицательным")
+        self._api = api
+        self._storage = storage
+        self._freshness = freshness
+        self._log_filename = log_filename
+        self._background_refresh = background_refresh
+        self._lock = threading.Lock()
+        self._refreshing: Dict[str, threading.Thread] = {}
+        self._log: Dict[str, Dict[str, Any]] = self._load_log()
+
+    def _now(self) -> float:
+        """Текущее время (в секундах от эпохи)"""
+        return time.time()
+
+    # ----- Журнал запросов -----
+
+    def _load_log(self) -> Dict[str, Dict[str, Any]]:
+        """Загружает журнал запросов"""
+        if os.path.exists(self._log_filename):
+            try:
+                with open(self._log_filename, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    return data
+            except (json.JSONDecodeError, OSError):
+                pass
+        return {}
+
+    def _save_log(self) -> None:
+        """Сохраняет журнал запросов (через временный файл и замену)"""
+        directory = os.path.dirname(self._log_filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_filename = f"{self._log_filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as f:
+            json.dump(self._log, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_filename, self._log_filename)
+
+    def age(self, search_query: str) -> Optional[float]:
+        """
+        Возраст результатов запроса в секундах
+
+        Returns:
+            Секунды с последнего обращения к API или None, если запрос
+            еще не выполнялся
+        """
+        with self._lock:
+            entry = self._log.get(normalize_query(search_query))
+        if entry is None:
+            return None
+        return max(0.0, self._now() - entry["fetched_at"])
+
+    def is_fresh(self, search_query: str) -> bool:
+        """Результаты запроса есть и не старше окна свежести"""
+        age = self.age(search_query)
+        return age is not None and age <= self._freshness
+
+    # ----- Чтение и запись результатов -----
+
+    def _cached_vacancies(
+        self, search_query: str, per_page: Optional[int] = None
+    ) -> Optional[List[Vacancy]]:
+        """
+        Результаты запроса из хранилища в порядке выдачи API
+
+        Args:
+            search_query: Поисковый запрос
+            per_page: Нужное количество вакансий (None — все сохраненные)
+
+        Returns:
+            Вакансии или None, если результатов нет или их меньше нужного
+        """
+        with self._lock:
+            entry = self._log.get(normalize_query(search_query))
+        # Записи журнала прежнего формата (без ключей) не читаются:
+        # запрос выполнится заново и запишет ключи
+        if entry is None or "keys" not in entry:
+            return None
+        keys = entry["keys"]
+        fetched_per_page = entry.get("per_page")
+        if (
+            per_page is not None
+            and fetched_per_page is not None
+            and fetched_per_page < per_page
+            and len(keys) >= fetched_per_page
+        ):
+            # Страница была меньше нужной и заполнена: результатов может
+            # быть больше
+            return None
+        if per_page is not None:
+            keys = keys[:per_page]
+
+        found = self._storage.get_by_keys(keys)
+        vacancies = [vacancy for vacancy in found if vacancy is not None]
+        if keys and not vacancies:
+            # Вакансии удалены из хранилища (например, по сроку жизни)
+            return None
+        return vacancies
+
+    def lookup(self, search_query: str) -> Optional[List[Vacancy]]:
+        """
+        Свежие результаты запроса из хранилища
+
+        Returns:
+            Вакансии или None, если результатов нет или они устарели
+        """
+        if not self.is_fresh(search_query):
+            return None
+        return self._cached_vacancies(search_query)
+
+    def store(
+        self,
+        search_query: str,
+        vacancies: List[Vacancy],
+        per_page: Optional[int] = None,
+    ) -> UpsertResult:
+        """
+        Сохраняет результаты запроса, полученные извне
+
+        Args:
+            search_query: Поисковый запрос
+            vacancies: Полученные вакансии
+            per_page: Размер страницы запроса к API (None — неизвестен,
+                результаты подходят для любого per_page)
+
+        Returns:
+            Итог записи в хранилище
+        """
+        result = self._storage.upsert_vacancies(vacancies)
+        with self._lock:
+            self._log[normalize_query(search_query)] = {
+                "fetched_at": self._now(),
+                "per_page": per_page,
+                "keys": [
+                    record_key(vacancy.to_dict()) for vacancy in vacancies
+                ],
+            }
+            self._save_log()
+        return result
+
+    def refresh(self, search_query: str, per_page: int = 50) -> List[Vacancy]:
+        """
+        Выполняет запрос к API и сохраняет результаты
+
+        Пустой ответ API (ошибка сети и т.п.) не затирает прежние
+        результаты.
+
+        Returns:
+            Полученные вакансии
+        """
+        hh_data = self._api.get_vacancies(search_query, per_page=per_page)
+        with METRICS.timer("vacancy_convert_seconds"):
+            vacancies = Vacancy.cast_to_object_list(hh_data)
+        METRICS.inc("vacancies_converted_total", len(vacancies))
+        if vacancies:
+            self.store(search_query, vacancies, per_page)
+        return vacancies
+
+    def _refresh_in_background(self, search_query: str, per_page: int) -> None:
+        """Запускает обновление запроса в фоне, если оно еще не идет"""
+        key = normalize_query(search_query)
+
+        def worker() -> None:
+            try:
+                self.refresh(search_query, per_page)
+            except Exception as e:  # noqa: BLE001
+                # stdout остается для данных (например, вывода --json)
+                METRICS.inc("background_refresh_errors_total")
+                print(
+                    f"Фоновое обновление '{search_query}' не удалось: {e}",
+                    file=sys.stderr,
+                )
+            finally:
+                with self._lock:
+                    self._refreshing.pop(key, None)
+
+        with self._lock:
+            if key in self._refreshing:
+                return
+            thread = threading.Thread(target=worker, daemon=True)
+            self._refreshing[key] = thread
+        thread.start()
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> None:
+        """Ожидает завершения фоновых обновлений"""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def search(self, search_query: str, per_page: int = 50) -> List[Vacancy]:
+        """
+        Ищет вакансии, по возможности без обращения к сети
+
+        Args:
+            search_query: Поисковый запрос
+            per_page: Количество вакансий при запросе к API
+
+        Returns:
+            Список вакансий
+        """
+        if self.is_fresh(search_query):
+            cached = self._cached_vacancies(search_query, per_page)
+            if cached is not None:
+                return cached
+        elif self._background_refresh:
+            stale = self._cached_vacancies(search_query, per_page)
+            if stale is not None:
+                self._refresh_in_background(search_query, per_page)
+                return stale
+
+        return self.refresh(search_query, per_page)
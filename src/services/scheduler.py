@@ -0,0 +1,362 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+from .cached_search import CachedSearch, normalize_query
+
+
+@dataclass
+class SavedSearch:
+    """
+    Сохраненный поиск и состояние его обновлений
+
+    Attributes:
+        query: Поисковый запрос
+        interval: Период обновления, секунд
+        per_page: Вакансий на запрос к API
+        next_run: Когда запустить следующее обновление (время эпохи)
+        due_at: Когда последнее обновление должно было начаться
+        last_started: Начало последнего обновления
+        last_success: Завершение последнего успешного обновления
+        last_duration: Длительность последнего обновления, секунд
+        last_start_delay: Задержка начала последнего обновления
+            относительно плана (ожидание свободного потока), секунд
+        last_fetched: Вакансий в последнем успешном ответе
+        last_error: Ошибка последнего неудачного обновления
+        runs: Всего обновлений
+        failures: Всего неудачных обновлений
+        consecutive_failures: Неудачных обновлений подряд
+    """
+
+    query: str
+    interval: float
+    per_page: int = 50
+    next_run: float = 0.0
+    due_at: Optional[float] = None
+    last_started: Optional[float] = None
+    last_success: Optional[float] = None
+    last_duration: Optional[float] = None
+    last_start_delay: Optional[float] = None
+    last_fetched: int = 0
+    last_error: Optional[str] = None
+    runs: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+
+
+def read_saved_searches(filename: str) -> List[Dict[str, Any]]:
+    """
+    Читает сохраненные поиски из JSON-файла
+
+    Формат: список объектов {"query": ..., "interval": секунд,
+    "per_page": ...}; per_page необязателен.
+
+    Raises:
+        ValueError: Если формат файла неверный
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError(f"{filename}: ожидается список сохраненных поисков")
+    searches = []
+    for item in data:
+        if (
+            not isinstance(item, dict)
+            or "query" not in item
+            or "interval" not in item
+        ):
+            raise ValueError(
+                f"{filename}: у поиска должны быть query и interval"
+            )
+        searches.append(
+            {
+                "query": str(item["query"]),
+                "interval": float(item["interval"]),
+                "per_page": int(item.get("per_page", 50)),
+            }
+        )
+    return searches
+
+
+class RefreshScheduler:
+    """
+    Фоновое обновление сохраненных поисков
+
+    Каждый поиск обновляется раз в свой интервал через CachedSearch.refresh
+    (запрос к API и запись в хранилище и журнал запросов). Обновления
+    выполняются в пуле из concurrency потоков; результаты каждого
+    поиска записываются в хранилище сразу по готовности, не дожидаясь
+    остальных. Поиск, обновление которого еще идет, повторно не
+    запускается.
+
+    Интервалы смещаются на случайную долю jitter (±10% по умолчанию),
+    чтобы поиски с одинаковым интервалом не обращались к API
+    одновременно. После неудачи (ошибка или пустой ответ — API
+    возвращает пустой список и при сетевых ошибках) поиск повторяется
+    через retry_delay, с удвоением при повторных неудачах, но не реже
+    своего интервала.
+
+    Для каждого поиска отслеживаются задержка запуска относительно
+    плана, возраст данных, длительность и число неудач (status).
+
+    Использование: run_pending — запустить поиски, которым пора
+    (например, из cron); run_forever — обслуживать расписание до stop.
+    """
+
+    def __init__(
+        self,
+        cache: CachedSearch,
+        concurrency: int = 4,
+        jitter: float = 0.1,
+        retry_delay: float = 60.0,
+        on_result: Optional[Callable[[SavedSearch], None]] = None,
+        seed: Optional[int] = None,
+    ):
+        if concurrency <= 0:
+            raise ValueError("concurrency должно быть положительным")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter должен быть в диапазоне [0, 1)")
+        self._cache = cache
+        self._concurrency = concurrency
+        self._jitter = jitter
+        self._retry_delay = retry_delay
+        self._on_result = on_result
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # Нормализованный запрос -> поиск; порядок — порядок добавления
+        self._searches: Dict[str, SavedSearch] = {}
+        self._running: Dict[str, "Future[None]"] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._stop = threading.Event()
+        # Будит run_forever при изменении расписания
+        self._changed = threading.Event()
+
+    def _now(self) -> float:
+        """Текущее время (в секундах от эпохи)"""
+        return time.time()
+
+    def _jittered(self, delay: float) -> float:
+        """Задержка, смещенная на случайную долю jitter"""
+        return delay * (1 + self._random.uniform(-self._jitter, self._jitter))
+
+    # ----- Реестр поисков -----
+
+    def add(
+        self, query: str, interval: float, per_page: int = 50
+    ) -> SavedSearch:
+        """
+        Добавляет поиск в расписание (или меняет интервал существующего)
+
+        Первое обновление планируется по возрасту результатов из журнала
+        запросов: свежие результаты не запрашиваются повторно сразу после
+        перезапуска. Поиски без результатов запускаются сразу.
+
+        Args:
+            query: Поисковый запрос
+            interval: Период обновления, секунд
+            per_page: Вакансий на запрос к API
+
+        Returns:
+            Сохраненный поиск
+        """
+        if interval <= 0:
+            raise ValueError("interval должен быть положительным")
+        key = normalize_query(query)
+        if not key:
+            raise ValueError("Поисковый запрос не может быть пустым")
+
+        now = self._now()
+        age = self._cache.age(query)
+        if age is None:
+            next_run = now
+        else:
+            next_run = now + max(0.0, self._jittered(interval) - age)
+        with self._lock:
+            search = self._searches.get(key)
+            if search is None:
+                search = SavedSearch(query, interval, per_page, next_run)
+                self._searches[key] = search
+            else:
+                search.interval = interval
+                search.per_page = per_page
+                search.next_run = min(search.next_run, next_run)
+        self._changed.set()
+        return search
+
+    def remove(self, query: str) -> bool:
+        """Удаляет поиск из расписания (идущее обновление не прерывается)"""
+        with self._lock:
+            removed = self._searches.pop(normalize_query(query), None)
+        self._changed.set()
+        return removed is not None
+
+    @property
+    def searches(self) -> List[SavedSearch]:
+        """Сохраненные поиски в порядке добавления"""
+        with self._lock:
+            return list(self._searches.values())
+
+    def next_due(self) -> Optional[float]:
+        """Время ближайшего запуска среди не выполняющихся поисков"""
+        with self._lock:
+            return min(
+                (
+                    search.next_run
+                    for key, search in self._searches.items()
+                    if key not in self._running
+                ),
+                default=None,
+            )
+
+    # ----- Выполнение -----
+
+    def run_pending(self) -> List["Future[None]"]:
+        """
+        Запускает обновление поисков, которым пора
+
+        Returns:
+            Future запущенных обновлений (для ожидания)
+        """
+        now = self._now()
+        started: List["Future[None]"] = []
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._concurrency, thread_name_prefix="refresh"
+                )
+            due = [
+                (key, search)
+                for key, search in self._searches.items()
+                if search.next_run <= now and key not in self._running
+            ]
+            # Сначала самые запоздавшие
+            due.sort(key=lambda item: item[1].next_run)
+            for key, search in due:
+                search.due_at = search.next_run
+                future = self._pool.submit(self._refresh, key, search)
+                self._running[key] = future
+                started.append(future)
+        return started
+
+    def _refresh(self, key: str, search: SavedSearch) -> None:
+        """Обновляет один поиск (в потоке пула)"""
+        started = self._now()
+        with self._lock:
+            search.last_started = started
+            due_at = search.due_at or started
+            search.last_start_delay = max(0.0, started - due_at)
+        error: Optional[str] = None
+        fetched = 0
+        try:
+            fetched = len(self._cache.refresh(search.query, search.per_page))
+            if not fetched:
+                error = "пустой ответ"
+        except Exception as e:  # noqa: BLE001
+            error = str(e) or type(e).__name__
+
+        finished = self._now()
+        with self._lock:
+            search.runs += 1
+            search.last_duration = finished - started
+            search.last_error = error
+            if error is None:
+                search.last_success = finished
+                search.last_fetched = fetched
+                search.consecutive_failures = 0
+                delay = search.interval
+            else:
+                search.failures += 1
+                search.consecutive_failures += 1
+                attempt = search.consecutive_failures - 1
+                backoff = self._retry_delay * 2**attempt
+                delay = min(search.interval, backoff)
+            search.next_run = finished + self._jittered(delay)
+            self._running.pop(key, None)
+        self._changed.set()
+        if self._on_result is not None:
+            self._on_result(search)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Ожидает завершения идущих обновлений"""
+        with self._lock:
+            futures = list(self._running.values())
+        for future in futures:
+            future.exception(timeout)
+
+    def run_forever(self, max_wait: float = 60.0) -> None:
+        """
+        Обслуживает расписание, пока не вызван stop
+
+        Args:
+            max_wait: Наибольшая пауза между проверками расписания, секунд
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            self._changed.clear()
+            self.run_pending()
+            next_due = self.next_due()
+            timeout = max_wait
+            if next_due is not None:
+                timeout = min(max_wait, max(0.0, next_due - self._now()))
+            self._changed.wait(timeout)
+
+    def stop(self) -> None:
+        """Останавливает run_forever (идущие обновления завершаются)"""
+        self._stop.set()
+        self._changed.set()
+
+    def close(self) -> None:
+        """Останавливает расписание и дожидается идущих обновлений"""
+        self.stop()
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    # ----- Состояние -----
+
+    def status(self) -> List[Dict[str, Any]]:
+        """
+        Состояние поисков
+
+        Returns:
+            По записи на поиск: запрос, интервал, возраст данных
+            (staleness, None — обновлений еще не было), отставание от
+            интервала (lag: насколько данные старше интервала), задержка
+            запуска, длительность и неудачи последнего обновления, время
+            до следующего запуска
+        """
+        now = self._now()
+        with self._lock:
+            rows = []
+            for key, search in self._searches.items():
+                staleness = (
+                    None
+                    if search.last_success is None
+                    else now - search.last_success
+                )
+                rows.append(
+                    {
+                        "query": search.query,
+                        "interval": search.interval,
+                        "running": key in self._running,
+                        "staleness": staleness,
+                        "lag": (
+                            None
+                            if staleness is None
+                            else max(0.0, staleness - search.interval)
+                        ),
+                        "start_delay": search.last_start_delay,
+                        "last_duration": search.last_duration,
+                        "last_fetched": search.last_fetched,
+                        "runs": search.runs,
+                        "failures": search.failures,
+                        "consecutive_failures": search.consecutive_failures,
+                        "last_error": search.last_error,
+                        "next_run_in": max(0.0, search.next_run - now),
+                    }
+                )
+        return rows
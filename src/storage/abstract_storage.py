@@ -1,6 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import List
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
 from ..models.vacancy import Vacancy
+from .identity import record_key
+from .query import VacancyQuery
+
+
+class UpsertResult(NamedTuple):
+    """
+    Итог upsert_vacancies: добавлено, обновлено, оставлено без изменений
+
+    near_duplicates — новые вакансии, не добавленные как почти
+    одинаковые с сохраненными (перепубликации под другим URL); их
+    содержимое, в том числе другая зарплата, не сохраняется.
+    """
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    near_duplicates: int = 0
 
 
 class AbstractStorage(ABC):
@@ -11,6 +29,54 @@ class AbstractStorage(ABC):
         """Добавляет вакансию в хранилище"""
         pass
 
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавляет несколько вакансий
+
+        Базовая реализация вызывает add_vacancy для каждой вакансии;
+        хранилища могут переопределить метод, чтобы сохранять один раз.
+        """
+        for vacancy in vacancies:
+            self.add_vacancy(vacancy)
+
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> UpsertResult:
+        """
+        Добавляет новые вакансии и обновляет изменившиеся
+
+        Вакансия определяется по URL: если вакансия с таким URL уже есть
+        и ее содержимое отличается (зарплата, название, описание...),
+        она заменяется; совпадающие вакансии не перезаписываются.
+
+        Базовая реализация сравнивает с полным списком get_vacancies и
+        обновляет через delete_vacancy/add_vacancy; хранилища могут
+        переопределить ее эффективнее.
+
+        Args:
+            vacancies: Вакансии
+
+        Returns:
+            Количество добавленных, обновленных и неизмененных вакансий
+        """
+        existing = {}
+        for vacancy in self.get_vacancies():
+            existing.setdefault(vacancy.url, vacancy)
+
+        inserted = updated = unchanged = 0
+        for vacancy in vacancies:
+            current = existing.get(vacancy.url)
+            if current is None:
+                self.add_vacancy(vacancy)
+                inserted += 1
+            elif current.to_dict() == vacancy.to_dict():
+                unchanged += 1
+                continue
+            else:
+                self.delete_vacancy(current)
+                self.add_vacancy(vacancy)
+                updated += 1
+            existing[vacancy.url] = vacancy
+        return UpsertResult(inserted, updated, unchanged)
+
     @abstractmethod
     def get_vacancies(self, **kwargs) -> List[Vacancy]:
         """
@@ -24,12 +90,71 @@ class AbstractStorage(ABC):
         """
         pass
 
+    def get_by_keys(self, keys: Iterable[str]) -> List[Optional[Vacancy]]:
+        """
+        Получает вакансии по ключам записей (identity.record_key)
+
+        Базовая реализация перебирает хранилище до первого совпадения
+        со всеми ключами; хранилища с индексом по ключу переопределяют
+        метод, чтобы чтение стоило O(числа ключей).
+
+        Args:
+            keys: Ключи записей
+
+        Returns:
+            Вакансии в порядке ключей; None для отсутствующих
+        """
+        keys = list(keys)
+        wanted = set(keys)
+        found: Dict[str, Vacancy] = {}
+        for vacancy in self.query(VacancyQuery()):
+            key = record_key(vacancy.to_dict())
+            if key in wanted and key not in found:
+                found[key] = vacancy
+                if len(found) == len(wanted):
+                    break
+        return [found.get(key) for key in keys]
+
     @abstractmethod
     def delete_vacancy(self, vacancy: Vacancy) -> None:
         """Удаляет вакансию из хранилища"""
         pass
 
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Удаляет несколько вакансий
+
+        Базовая реализация вызывает delete_vacancy для каждой вакансии;
+        хранилища могут переопределить метод, чтобы сохранять один раз.
+        """
+        for vacancy in vacancies:
+            self.delete_vacancy(vacancy)
+
     @abstractmethod
     def clear(self) -> None:
         """Очищает хранилище"""
         pass
+
+    def query(self, query: VacancyQuery) -> Iterator[Vacancy]:
+        """
+        Выполняет запрос с сортировкой и окном выдачи
+
+        Базовая реализация получает все подходящие вакансии через
+        get_vacancies; хранилища с индексами переопределяют метод,
+        чтобы начинать с самого селективного индекса и останавливаться
+        по достижении limit.
+
+        Args:
+            query: Запрос
+
+        Returns:
+            Итератор по вакансиям
+        """
+        vacancies = self.get_vacancies(**query.filters())
+        if query.order_field:
+            vacancies = sorted(
+                vacancies,
+                key=lambda vacancy: query.order_value(vacancy.to_dict()),
+                reverse=query.descending,
+            )
+        return islice(vacancies, query.offset, query.stop)
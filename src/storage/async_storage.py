@@ -0,0 +1,240 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+from ..models.vacancy import Vacancy
+from .abstract_storage import AbstractStorage, UpsertResult
+from .query import VacancyQuery
+
+T = TypeVar("T")
+
+
+class AbstractAsyncStorage(ABC):
+    """Абстрактный класс асинхронного хранилища данных"""
+
+    @abstractmethod
+    async def add_vacancy(self, vacancy: Vacancy) -> None:
+        """Добавляет вакансию в хранилище"""
+        pass
+
+    async def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавляет несколько вакансий
+
+        Базовая реализация вызывает add_vacancy для каждой вакансии.
+        """
+        for vacancy in vacancies:
+            await self.add_vacancy(vacancy)
+
+    @abstractmethod
+    async def upsert_vacancies(
+        self, vacancies: Iterable[Vacancy]
+    ) -> UpsertResult:
+        """Добавляет новые вакансии и обновляет изменившиеся"""
+        pass
+
+    @abstractmethod
+    async def get_vacancies(self, **kwargs) -> List[Vacancy]:
+        """
+        Получает вакансии из хранилища по критериям
+
+        Args:
+            **kwargs: Критерии фильтрации (см. AbstractStorage.get_vacancies)
+
+        Returns:
+            Список вакансий
+        """
+        pass
+
+    @abstractmethod
+    async def query(self, query: VacancyQuery) -> List[Vacancy]:
+        """Выполняет запрос с сортировкой и окном выдачи"""
+        pass
+
+    @abstractmethod
+    async def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """Удаляет вакансию из хранилища"""
+        pass
+
+    async def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Удаляет несколько вакансий
+
+        Базовая реализация вызывает delete_vacancy для каждой вакансии.
+        """
+        for vacancy in vacancies:
+            await self.delete_vacancy(vacancy)
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Очищает хранилище"""
+        pass
+
+
+class _ReadWriteLock:
+    """
+    Блокировка «читатели-писатель» для корутин
+
+    Читатели выполняются одновременно, писатель — один. Ожидающий
+    писатель не пропускает новых читателей, чтобы поток чтений не
+    откладывал запись бесконечно.
+    """
+
+    def __init__(self) -> None:
+        # Условие создается внутри цикла событий (на Python 3.8-3.9
+        # примитивы asyncio привязываются к циклу при создании)
+        self._condition: Optional[asyncio.Condition] = None
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    @asynccontextmanager
+    async def reading(self) -> AsyncIterator[None]:
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(
+                lambda: not self._writing and not self._writers_waiting
+            )
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self._readers -= 1
+                condition.notify_all()
+
+    @asynccontextmanager
+    async def writing(self) -> AsyncIterator[None]:
+        condition = self._get_condition()
+        async with condition:
+            self._writers_waiting += 1
+            try:
+                await condition.wait_for(
+                    lambda: not self._writing and not self._readers
+                )
+            finally:
+                self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            async with condition:
+                self._writing = False
+                condition.notify_all()
+
+
+class AsyncStorageAdapter(AbstractAsyncStorage):
+    """
+    Асинхронный интерфейс к синхронному хранилищу
+
+    Каждая операция целиком (фильтрация, сериализация, работа с диском)
+    выполняется в пуле потоков, поэтому цикл событий не блокируется и
+    запись может идти одновременно с сетевыми запросами. Чтения
+    выполняются параллельно друг с другом, записи — по одной и не
+    пересекаются с чтениями. Пакетные методы выполняют всю пачку одним
+    заданием пула (для JSONStorage — с одной записью файла).
+
+    Если executor не передан, создается собственный пул, который
+    закрывается в close (или при выходе из async with).
+    """
+
+    def __init__(
+        self,
+        storage: AbstractStorage,
+        executor: Optional[Executor] = None,
+        max_workers: int = 4,
+    ):
+        self._storage = storage
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="storage"
+        )
+        self._rw_lock = _ReadWriteLock()
+
+    @property
+    def storage(self) -> AbstractStorage:
+        """Обернутое синхронное хранилище"""
+        return self._storage
+
+    async def _run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+
+    async def _read(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        async with self._rw_lock.reading():
+            return await self._run(func, *args, **kwargs)
+
+    async def _write(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        async with self._rw_lock.writing():
+            return await self._run(func, *args, **kwargs)
+
+    # ----- Запись -----
+
+    async def add_vacancy(self, vacancy: Vacancy) -> None:
+        await self._write(self._storage.add_vacancy, vacancy)
+
+    async def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        await self._write(self._storage.add_vacancies, list(vacancies))
+
+    async def upsert_vacancies(
+        self, vacancies: Iterable[Vacancy]
+    ) -> UpsertResult:
+        return await self._write(
+            self._storage.upsert_vacancies, list(vacancies)
+        )
+
+    async def delete_vacancy(self, vacancy: Vacancy) -> None:
+        await self._write(self._storage.delete_vacancy, vacancy)
+
+    async def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        await self._write(self._storage.delete_vacancies, list(vacancies))
+
+    async def clear(self) -> None:
+        await self._write(self._storage.clear)
+
+    # ----- Чтение -----
+
+    async def get_vacancies(self, **kwargs) -> List[Vacancy]:
+        return await self._read(self._storage.get_vacancies, **kwargs)
+
+    async def query(self, query: VacancyQuery) -> List[Vacancy]:
+        # Итератор хранилища исчерпывается в пуле: хранилище нельзя
+        # изменять, пока он не пройден до конца
+        return await self._read(lambda: list(self._storage.query(query)))
+
+    # ----- Жизненный цикл -----
+
+    async def close(self) -> None:
+        """Дожидается операций и закрывает собственный пул потоков"""
+        if self._own_executor:
+            async with self._rw_lock.writing():
+                self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncStorageAdapter":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
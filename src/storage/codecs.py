@@ -0,0 +1,158 @@
+import gzip
+import json
+import lzma
+from typing import Any, Dict, List
+
+# Поддерживаемые форматы файла хранилища:
+# - json: JSON-массив с отступами (исходный формат, удобен для чтения)
+# - columnar: минифицированный JSON, имена полей хранятся один раз
+# - gzip, lzma: columnar, сжатый соответствующим алгоритмом
+FORMATS = ("json", "columnar", "gzip", "lzma")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_LZMA_MAGIC = b"\xfd7zXZ\x00"
+
+_COLUMNAR_MARKER = "vacancies/columnar"
+# Версия 2 добавила список отсутствующих полей (absent); в файлах
+# версии 1 отсутствующее посреди строки поле читается как None
+_COLUMNAR_VERSION = 2
+
+
+def detect_format(payload: bytes) -> str:
+    """
+    Определяет формат содержимого файла по сигнатуре
+
+    Args:
+        payload: Содержимое файла
+
+    Returns:
+        Название формата из FORMATS
+    """
+    if payload.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if payload.startswith(_LZMA_MAGIC):
+        return "lzma"
+    if payload.lstrip()[:1] == b"{":
+        return "columnar"
+    return "json"
+
+
+def _to_columnar(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Переводит записи в табличный вид: список полей и строки значений
+
+    Отсутствующие в конце строки поля не хранятся. Отсутствующие
+    посреди строки хранятся как null и перечисляются в absent:
+    [номер строки, номера полей...] — так они не превращаются при
+    чтении в поля со значением None. У однородных записей absent пуст.
+    """
+    columns: List[str] = []
+    positions: Dict[str, int] = {}
+    for data in records:
+        for key in data:
+            if key not in positions:
+                positions[key] = len(columns)
+                columns.append(key)
+
+    missing = object()
+    rows = []
+    absent: List[List[int]] = []
+    for number, data in enumerate(records):
+        row = [data.get(key, missing) for key in columns]
+        # Отсутствующие поля в конце строки не храним
+        while row and row[-1] is missing:
+            row.pop()
+        gaps = [
+            position
+            for position, value in enumerate(row)
+            if value is missing
+        ]
+        if gaps:
+            absent.append([number, *gaps])
+            row = [None if value is missing else value for value in row]
+        rows.append(row)
+    payload = {
+        "format": _COLUMNAR_MARKER,
+        "version": _COLUMNAR_VERSION,
+        "columns": columns,
+        "rows": rows,
+    }
+    if absent:
+        payload["absent"] = absent
+    return payload
+
+
+def _from_columnar(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Восстанавливает записи из табличного вида"""
+    if payload.get("format") != _COLUMNAR_MARKER:
+        raise ValueError("Неизвестный формат файла хранилища")
+    columns = payload["columns"]
+    records = [dict(zip(columns, row)) for row in payload["rows"]]
+    for number, *gaps in payload.get("absent", ()):
+        record = records[number]
+        for position in gaps:
+            del record[columns[position]]
+    return records
+
+
+def encode_records(
+    records: List[Dict[str, Any]], storage_format: str
+) -> bytes:
+    """
+    Кодирует записи в байты выбранного формата
+
+    Args:
+        records: Записи вакансий
+        storage_format: Формат из FORMATS
+
+    Returns:
+        Содержимое файла
+    """
+    if storage_format == "json":
+        text = json.dumps(records, ensure_ascii=False, indent=2)
+        return text.encode("utf-8")
+    if storage_format not in FORMATS:
+        raise ValueError(
+            f"Неизвестный формат хранилища: {storage_format}. "
+            f"Допустимые значения: {', '.join(FORMATS)}"
+        )
+
+    payload = json.dumps(
+        _to_columnar(records), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    if storage_format == "gzip":
+        # mtime=0: одинаковые данные дают одинаковый файл
+        return gzip.compress(payload, compresslevel=6, mtime=0)
+    if storage_format == "lzma":
+        return lzma.compress(payload, preset=6)
+    return payload
+
+
+def decode_records(payload: bytes) -> List[Dict[str, Any]]:
+    """
+    Декодирует содержимое файла, определяя формат автоматически
+
+    Args:
+        payload: Содержимое файла
+
+    Returns:
+        Записи вакансий
+
+    Raises:
+        ValueError: если содержимое повреждено или формат неизвестен
+    """
+    storage_format = detect_format(payload)
+    try:
+        if storage_format == "gzip":
+            payload = gzip.decompress(payload)
+        elif storage_format == "lzma":
+            payload = lzma.decompress(payload)
+    except (OSError, EOFError, lzma.LZMAError) as e:
+        raise ValueError(f"Поврежденный сжатый файл хранилища: {e}") from e
+
+    data = json.loads(payload.decode("utf-8"))
+    if isinstance(data, dict):
+        return _from_columnar(data)
+    if not isinstance(data, list):
+        raise ValueError("Неизвестный формат файла хранилища")
+    return data
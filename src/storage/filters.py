@@ -0,0 +1,90 @@
+from typing import Any, Dict, Iterable, Optional
+
+
+def _contains_keyword(data: Dict[str, Any], keyword: str) -> bool:
+    """Ищет подстроку в описании, требованиях и названии без учета регистра"""
+    keyword = keyword.lower()
+    return (
+        keyword in (data.get("description") or "").lower()
+        or keyword in (data.get("requirements") or "").lower()
+        or keyword in (data.get("title") or "").lower()
+    )
+
+
+def record_avg_salary(data: Dict[str, Any]) -> float:
+    """Средняя зарплата записи, как в Vacancy.avg_salary"""
+    salary_from = data.get("salary_from")
+    salary_to = data.get("salary_to")
+    if salary_from and salary_to:
+        return (salary_from + salary_to) / 2
+    elif salary_from:
+        return float(salary_from)
+    elif salary_to:
+        return float(salary_to)
+    return 0.0
+
+
+def match_record(
+    data: Dict[str, Any],
+    keyword: Optional[str] = None,
+    keywords: Optional[Iterable[str]] = None,
+    salary_min: Optional[int] = None,
+    salary_max: Optional[int] = None,
+    company: Optional[str] = None,
+    avg_min: Optional[float] = None,
+    avg_max: Optional[float] = None,
+    **_ignored: Any,
+) -> bool:
+    """
+    Проверяет запись вакансии на соответствие критериям get_vacancies
+
+    Семантика совпадает с фильтрами JSONStorage.get_vacancies:
+    пустые/нулевые критерии не применяются.
+
+    Args:
+        data: Словарь вакансии (формат Vacancy.to_dict)
+        keyword: Ключевое слово в описании, требованиях или названии
+        keywords: Несколько ключевых слов, должны встретиться все
+        salary_min: Минимальная зарплата (по salary_from)
+        salary_max: Максимальная зарплата (по salary_to)
+        company: Подстрока названия компании
+        avg_min: Минимальная средняя зарплата
+        avg_max: Максимальная средняя зарплата
+        **_ignored: Прочие критерии не относятся к записи и пропускаются
+
+    Returns:
+        True, если запись проходит все заданные фильтры
+    """
+    if keyword and not _contains_keyword(data, keyword):
+        return False
+
+    if keywords and not all(
+        _contains_keyword(data, word) for word in keywords if word
+    ):
+        return False
+
+    if salary_min:
+        salary_from = data.get("salary_from")
+        if not salary_from or salary_from < salary_min:
+            return False
+
+    if salary_max:
+        salary_to = data.get("salary_to")
+        if not salary_to or salary_to > salary_max:
+            return False
+
+    if company:
+        if company.lower() not in (data.get("company") or "").lower():
+            return False
+
+    if avg_min is not None or avg_max is not None:
+        # Как в get_vacancies_by_salary: вакансии без зарплаты не подходят
+        avg_salary = record_avg_salary(data)
+        if avg_salary <= 0:
+            return False
+        if avg_min is not None and avg_salary < avg_min:
+            return False
+        if avg_max is not None and avg_salary > avg_max:
+            return False
+
+    return True
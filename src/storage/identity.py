@@ -0,0 +1,86 @@
+import hashlib
+import json
+from typing import Any, Dict
+
+# Разделитель частей ключа: не встречается ни в URL, ни в названиях
+_KEY_SEPARATOR = "\x1f"
+
+# Поля вакансии, от которых зависит хэш содержимого (Vacancy.to_dict);
+# служебные поля хранилища в хэш не входят
+CONTENT_FIELDS = (
+    "title",
+    "url",
+    "salary_from",
+    "salary_to",
+    "currency",
+    "description",
+    "requirements",
+    "company",
+)
+
+
+def record_key(data: Dict[str, Any]) -> str:
+    """
+    Возвращает ключ записи вакансии
+
+    Ключ совпадает с критерием дубликата в хранилищах: URL + название.
+
+    Args:
+        data: Словарь вакансии (формат Vacancy.to_dict)
+
+    Returns:
+        Строковый ключ записи
+    """
+    return f"{data.get('url', '')}{_KEY_SEPARATOR}{data.get('title', '')}"
+
+
+def key_url(key: str) -> str:
+    """
+    URL вакансии из ключа записи (см. record_key)
+
+    Args:
+        key: Ключ записи
+
+    Returns:
+        URL
+    """
+    return key.split(_KEY_SEPARATOR, 1)[0]
+
+
+def key_hash(key: str) -> int:
+    """
+    Стабильный 64-битный хэш ключа
+
+    В отличие от встроенного hash() не зависит от PYTHONHASHSEED,
+    поэтому может сохраняться на диск и использоваться разными процессами.
+
+    Args:
+        key: Ключ записи
+
+    Returns:
+        Знаковое 64-битное целое
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def content_hash(data: Dict[str, Any]) -> str:
+    """
+    Хэш содержимого вакансии
+
+    Меняется при изменении любого поля вакансии (зарплаты, описания и
+    т.д.) и не зависит от служебных полей хранилища.
+
+    Args:
+        data: Словарь вакансии (формат Vacancy.to_dict)
+
+    Returns:
+        Шестнадцатеричная строка
+    """
+    canonical = json.dumps(
+        [data.get(field) for field in CONTENT_FIELDS],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16)
+    return digest.hexdigest()
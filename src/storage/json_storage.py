@@ -1,17 +1,161 @@
+import heapq
 import json
 import os
-from typing import List, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import chain, islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from ..models.vacancy import Vacancy
-from .abstract_storage import AbstractStorage
+from ..utils.metrics import METRICS
+from .abstract_storage import AbstractStorage, UpsertResult
+from .codecs import FORMATS, decode_records, detect_format, encode_records
+from .identity import content_hash, record_key
+from .keyword_index import KeywordIndex
+from .locking import FileLock
+from .near_duplicates import (
+    DEFAULT_THRESHOLD,
+    NearDuplicateIndex,
+    find_near_duplicates,
+)
+from .query import VacancyQuery
+from .salary_index import SalaryIndexes
+
+# Журнал индекса ключевых слов сливается с индексом, когда перерастает
+# половину индекса, но не раньше, чем достигнет этого размера, байт
+INDEX_LOG_MIN_SIZE = 1 << 16
 
 
 class JSONStorage(AbstractStorage):
-    """Класс для работы с JSON-файлом"""
+    """
+    Класс для работы с JSON-файлом
+
+    Файл можно использовать из нескольких процессов: чтение идет под
+    разделяемой блокировкой, запись — под исключительной. Перед чтением
+    хранилище проверяет поколение и подпись файла и перечитывает данные,
+    только если их изменил другой процесс. Запись сначала подтягивает
+    чужие изменения, затем применяет свою операцию поверх них и атомарно
+    заменяет файл.
+
+    Формат файла (см. storage.codecs) определяется при загрузке
+    автоматически; storage_format задает формат для записи. Если он не
+    указан, сохраняется формат существующего файла, для нового — json.
+
+    Каждая запись хранит время первого (fetched_at) и последнего
+    (last_seen) получения. Если задан ttl, записи, не встречавшиеся
+    дольше ttl секунд, перестают выдаваться сразу, а удаляются из файла
+    постепенно: каждая операция записи попутно удаляет не больше
+    evict_batch просроченных записей (полная очистка — evict_expired).
+
+    Результаты get_vacancies кэшируются (LRU на cache_size запросов,
+    0 — без кэша). Любое изменение данных в памяти увеличивает поколение,
+    и кэш сбрасывается целиком при следующем обращении. Вакансии из
+    кэша общие для повторных вызовов, изменять их не следует.
+
+    Если задан near_duplicate_threshold, при добавлении отбрасываются
+    и почти одинаковые вакансии (перепубликации под другим URL или с
+    немного измененным названием, см. storage.near_duplicates), а не
+    только точные совпадения URL и названия. Пакетная проверка уже
+    сохраненных записей — near_duplicate_clusters и
+    remove_near_duplicates.
+    """
 
-    def __init__(self, filename: str = "data/vacancies.json"):
+    def __init__(
+        self,
+        filename: str = "data/vacancies.json",
+        storage_format: Optional[str] = None,
+        ttl: Optional[float] = None,
+        evict_batch: int = 100,
+        cache_size: int = 128,
+        near_duplicate_threshold: Optional[float] = None,
+    ):
+        if storage_format is not None and storage_format not in FORMATS:
+            raise ValueError(
+                f"Неизвестный формат хранилища: {storage_format}. "
+                f"Допустимые значения: {', '.join(FORMATS)}"
+            )
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl должен быть положительным")
+        if cache_size < 0:
+            raise ValueError("cache_size не может быть отрицательным")
         self._filename = filename
+        self._storage_format = storage_format
+        self._ttl = ttl
+        self._evict_batch = evict_batch
+        # Куча (last_seen, id) для поиска просроченных записей; элементы
+        # удаленных и обновленных записей отбрасываются при извлечении
+        self._expiry_heap: List[Tuple[float, int]] = []
+        self._index_filename = filename + ".index.json"
+        # Журнал дописываемых изменений индекса поверх _index_filename
+        self._index_log_filename = filename + ".index.log"
+        # Записи на диске индекса адресуются номерами (слотами): при
+        # полной записи — позициями в файле данных, новые записи
+        # получают следующие номера. Идентификатор -> слот записей,
+        # отраженных в индексе на диске (None — индекс на диске устарел
+        # и переписывается целиком), и следующий свободный слот
+        self._index_slots: Optional[Dict[int, int]] = None
+        self._index_next_slot = 0
+        # Несохраненные изменения индекса: записи, чьи токены нужно
+        # дописать, прежние токены измененных и удаленных записей по
+        # слотам и слоты удаленных записей
+        self._index_added: Set[int] = set()
+        self._index_removed: List[Tuple[int, Tuple[str, str, str]]] = []
+        self._index_dropped: List[int] = []
+        # Размеры файлов индекса и журнала; подпись файла данных,
+        # которой соответствует индекс на диске
+        self._index_signature: Optional[List[int]] = None
+        self._index_size = 0
+        self._index_log_size = 0
         self._ensure_directory()
-        self._vacancies: List[Dict[str, Any]] = self._load_from_file()
+        self._lock = threading.RLock()
+        # Есть несохраненные изменения (попутное удаление просроченных)
+        self._dirty = False
+        self._evicted = 0
+        self._file_lock = FileLock(filename + ".lock")
+        # Поколение и подпись файла на момент последней загрузки/записи
+        self._loaded_state: Optional[Tuple[int, Optional[List[int]]]] = None
+        # Метаданные файлов данных и блокировки, при которых загруженные
+        # данные заведомо актуальны (быстрая проверка без блокировки)
+        self._stat_state: Optional[Tuple[Tuple[int, int, int], ...]] = None
+        # Записи по внутренним идентификаторам; порядок словаря —
+        # порядок добавления, идентификаторы возрастают
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self._ids_by_key: Dict[str, int] = {}
+        self._next_id = 0
+        self._keyword_index = KeywordIndex()
+        self._salary_indexes = SalaryIndexes()
+        # Индекс почти одинаковых вакансий (только при заданном пороге)
+        self._near_duplicates: Optional[NearDuplicateIndex[int]] = (
+            None
+            if near_duplicate_threshold is None
+            else NearDuplicateIndex(near_duplicate_threshold)
+        )
+        # Поколение данных в памяти: растет при каждом изменении записей
+        self._generation = 0
+        # Кэш get_vacancies: запрос -> (вакансии, момент устаревания по ttl)
+        self._cache_size = cache_size
+        self._result_cache: (
+            "OrderedDict[VacancyQuery, Tuple[List[Vacancy], float]]"
+        ) = OrderedDict()
+        self._cache_generation = 0
+        with self._file_lock.shared() as fd:
+            self._reload(fd)
+
+    @property
+    def filename(self) -> str:
+        """Путь к файлу данных"""
+        return self._filename
 
     def _ensure_directory(self) -> None:
         """Создает директорию для файла, если она не существует"""
@@ -20,41 +164,598 @@ class JSONStorage(AbstractStorage):
             os.makedirs(directory)
 
     def _load_from_file(self) -> List[Dict[str, Any]]:
-        """Загружает данные из JSON-файла"""
+        """Загружает данные из файла, определяя его формат"""
         if os.path.exists(self._filename):
             try:
-                with open(self._filename, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
+                with open(self._filename, "rb") as f:
+                    payload = f.read()
+                if self._storage_format is None and payload:
+                    self._storage_format = detect_format(payload)
+                return decode_records(payload)
+            except (ValueError, FileNotFoundError):
                 return []
         return []
 
     def _save_to_file(self) -> None:
-        """Сохраняет данные в JSON-файл"""
-        with open(self._filename, "w", encoding="utf-8") as f:
-            json.dump(self._vacancies, f, ensure_ascii=False, indent=2)
+        """Сохраняет данные в файл (через временный файл и замену)"""
+        payload = encode_records(
+            list(self._records.values()), self._storage_format or "json"
+        )
+        tmp_filename = f"{self._filename}.{os.getpid()}.tmp"
+        with open(tmp_filename, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_filename, self._filename)
+        self._save_index()
+
+    # ----- Срок жизни записей -----
+
+    def _now(self) -> float:
+        """Текущее время (в секундах от эпохи)"""
+        return time.time()
+
+    def _expiry_cutoff(self) -> Optional[float]:
+        """Записи с last_seen раньше этого момента просрочены"""
+        if self._ttl is None:
+            return None
+        return self._now() - self._ttl
+
+    @staticmethod
+    def _is_live(data: Dict[str, Any], cutoff: Optional[float]) -> bool:
+        """Запись не просрочена"""
+        return cutoff is None or data.get("last_seen", cutoff) >= cutoff
+
+    def _track_expiry(self, doc_id: int, data: Dict[str, Any]) -> None:
+        """Добавляет запись в кучу сроков жизни"""
+        if self._ttl is not None:
+            heapq.heappush(self._expiry_heap, (data["last_seen"], doc_id))
+
+    def _rebuild_expiry_heap(self) -> None:
+        """
+        Строит кучу сроков жизни; записям без отметки ставит текущее время
+        """
+        self._expiry_heap = []
+        if self._ttl is None:
+            return
+        now = self._now()
+        for doc_id, data in self._records.items():
+            data.setdefault("fetched_at", now)
+            data.setdefault("last_seen", now)
+            self._expiry_heap.append((data["last_seen"], doc_id))
+        heapq.heapify(self._expiry_heap)
+
+    def _evict_expired(self, limit: Optional[int]) -> int:
+        """
+        Удаляет из памяти до limit просроченных записей
+
+        Returns:
+            Количество удаленных записей
+        """
+        cutoff = self._expiry_cutoff()
+        evicted = 0
+        while self._expiry_heap and (limit is None or evicted < limit):
+            last_seen, doc_id = self._expiry_heap[0]
+            if last_seen >= cutoff:
+                break
+            heapq.heappop(self._expiry_heap)
+            data = self._records.get(doc_id)
+            # Устаревший элемент кучи: запись удалена или обновлена
+            if data is None or data.get("last_seen") != last_seen:
+                continue
+            self._remove(doc_id)
+            evicted += 1
+        return evicted
+
+    def evict_expired(self) -> int:
+        """
+        Удаляет все просроченные записи и сохраняет файл
+
+        Returns:
+            Количество удаленных записей
+        """
+        if self._ttl is None:
+            return 0
+        with self._write_transaction():
+            # Часть записей могла быть удалена при входе в транзакцию
+            evicted = self._evicted + self._evict_expired(None)
+            self._dirty = self._dirty or bool(evicted)
+        return evicted
+
+    # ----- Согласование с другими процессами -----
+
+    def _disk_state(self, fd: int) -> Tuple[int, Optional[List[int]]]:
+        """Поколение из файла блокировки и подпись файла данных"""
+        return FileLock.read_generation(fd), self._file_signature()
+
+    def _stat(self) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        Inode, размер и время изменения файлов данных и блокировки
+
+        Запись заменяет файл данных новым (новый inode) и меняет
+        поколение в файле блокировки, поэтому при совпадении метаданных
+        файлы не менялись.
+        """
+        state = []
+        for filename in (self._filename, self._file_lock.filename):
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                state.append((0, -1, 0))
+            else:
+                state.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+        return tuple(state)
+
+    def _reload(self, fd: int) -> None:
+        """Загружает данные с диска (под блокировкой файла)"""
+        state = self._disk_state(fd)
+        self._load_records(self._load_from_file())
+        self._loaded_state = state
+        self._stat_state = self._stat()
+
+    def _refresh(self) -> None:
+        """
+        Перечитывает данные, если файл изменился после загрузки
+
+        Сначала метаданные файлов сравниваются с запомненными — без
+        блокировок и чтения файлов. Только если они отличаются, поколение
+        и подпись проверяются под разделяемой блокировкой файла.
+        """
+        if self._stat_state is not None and self._stat() == self._stat_state:
+            return
+        with self._lock, self._file_lock.shared() as fd:
+            if self._disk_state(fd) != self._loaded_state:
+                self._reload(fd)
+            else:
+                self._stat_state = self._stat()
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[int]:
+        """
+        Контекст операции записи
+
+        Держит исключительную блокировку и перед операцией подтягивает
+        изменения других процессов, чтобы они не потерялись при записи.
+        Попутно удаляет порцию просроченных записей; если операция сама
+        ничего не сохранила, изменения сохраняются после нее.
+
+        Yields:
+            Дескриптор файла блокировки для _commit
+        """
+        with self._lock, self._file_lock.exclusive() as fd:
+            if self._disk_state(fd) != self._loaded_state:
+                self._reload(fd)
+            self._evicted = (
+                self._evict_expired(self._evict_batch) if self._ttl else 0
+            )
+            self._dirty = bool(self._evicted)
+            yield fd
+            if self._dirty:
+                self._commit(fd)
+
+    @METRICS.timed("storage_commit_seconds")
+    def _commit(self, fd: int) -> None:
+        """Сохраняет данные и увеличивает поколение (внутри транзакции)"""
+        self._save_to_file()
+        FileLock.write_generation(fd, FileLock.read_generation(fd) + 1)
+        self._loaded_state = self._disk_state(fd)
+        self._stat_state = self._stat()
+        self._dirty = False
+
+    # ----- Внутреннее состояние и индексы -----
+
+    def _load_records(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Заполняет хранилище записями, прочитанными из файла
+
+        Записи и индексы создаются заново, а не изменяются на месте:
+        итераторы query, начатые до перезагрузки (например, в другом
+        потоке), дочитывают прежний снимок.
+        """
+        self._generation += 1
+        self._records = {}
+        self._ids_by_key = {}
+        self._next_id = 0
+        for data in records:
+            if isinstance(data, dict) and not self._is_duplicate(data):
+                self._insert(data, index=False)
+
+        self._reset_index_changes(None)
+        keyword_index = self._load_index()
+        if keyword_index is None:
+            keyword_index = KeywordIndex()
+            for doc_id, data in self._records.items():
+                keyword_index.add(doc_id, self._index_texts(data))
+        self._keyword_index = keyword_index
+        self._salary_indexes = SalaryIndexes()
+        self._salary_indexes.rebuild(self._records)
+        if self._near_duplicates is not None:
+            self._near_duplicates.clear()
+            for doc_id, data in self._records.items():
+                self._near_duplicates.add(doc_id, data)
+        self._rebuild_expiry_heap()
+
+    def _insert(self, data: Dict[str, Any], index: bool = True) -> int:
+        """Добавляет запись, индексирует ее и возвращает идентификатор"""
+        doc_id = self._next_id
+        self._next_id += 1
+        self._generation += 1
+        self._records[doc_id] = data
+        self._ids_by_key[record_key(data)] = doc_id
+        if index:
+            self._keyword_index.add(doc_id, self._index_texts(data))
+            if self._index_slots is not None:
+                self._index_added.add(doc_id)
+            self._salary_indexes.add(doc_id, data)
+            if self._near_duplicates is not None:
+                self._near_duplicates.add(doc_id, data)
+            self._track_expiry(doc_id, data)
+        return doc_id
+
+    def _replace(self, doc_id: int, data: Dict[str, Any]) -> None:
+        """Заменяет запись на месте, сохраняя ее позицию"""
+        old = self._records[doc_id]
+        self._generation += 1
+        del self._ids_by_key[record_key(old)]
+        self._keyword_index.remove(doc_id, self._index_texts(old))
+        if self._index_slots is not None:
+            slot = self._index_slots.get(doc_id)
+            if slot is not None:
+                self._index_removed.append((slot, self._index_texts(old)))
+            self._index_added.add(doc_id)
+        self._salary_indexes.remove(doc_id, old)
+
+        self._records[doc_id] = data
+        self._ids_by_key[record_key(data)] = doc_id
+        self._keyword_index.add(doc_id, self._index_texts(data))
+        self._salary_indexes.add(doc_id, data)
+        if self._near_duplicates is not None:
+            self._near_duplicates.add(doc_id, data)
+        self._track_expiry(doc_id, data)
+
+    def _remove(self, doc_id: int) -> None:
+        """Удаляет запись и ее вхождения в индексе"""
+        data = self._records.pop(doc_id)
+        self._generation += 1
+        del self._ids_by_key[record_key(data)]
+        self._keyword_index.remove(doc_id, self._index_texts(data))
+        if self._index_slots is not None:
+            slot = self._index_slots.pop(doc_id, None)
+            if slot is not None:
+                self._index_removed.append((slot, self._index_texts(data)))
+                self._index_dropped.append(slot)
+            self._index_added.discard(doc_id)
+        self._salary_indexes.remove(doc_id, data)
+        if self._near_duplicates is not None:
+            self._near_duplicates.remove(doc_id)
+
+    @staticmethod
+    def _index_texts(data: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Поля записи, по которым работает фильтр keyword"""
+        return (
+            data.get("title") or "",
+            data.get("description") or "",
+            data.get("requirements") or "",
+        )
+
+    def _file_signature(self) -> Optional[List[int]]:
+        """Размер и время изменения файла данных"""
+        try:
+            stat = os.stat(self._filename)
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _reset_index_changes(
+        self, slots: Optional[Dict[int, int]], next_slot: int = 0
+    ) -> None:
+        """Задает слоты индекса на диске и забывает несохраненные изменения"""
+        self._index_slots = slots
+        self._index_next_slot = next_slot
+        self._index_added = set()
+        self._index_removed = []
+        self._index_dropped = []
+
+    def _save_index(self) -> None:
+        """
+        Сохраняет индекс ключевых слов рядом с файлом данных
+
+        Изменения с прошлого сохранения дописываются в журнал одной
+        строкой: токены новых и измененных записей, прежние токены
+        измененных и удаленных записей и слоты удаленных — запись стоит
+        O(изменений), а не O(индекса). Когда журнал перерастает половину
+        индекса (но не меньше INDEX_LOG_MIN_SIZE), а также если индекс
+        на диске устарел, индекс переписывается целиком, а журнал
+        удаляется.
+        """
+        signature = self._file_signature()
+        try:
+            log_limit = max(INDEX_LOG_MIN_SIZE, self._index_size // 2)
+            if (
+                self._index_slots is None
+                or self._index_log_size > log_limit
+            ):
+                self._write_full_index(signature)
+            else:
+                self._append_index_log(signature)
+        except OSError:
+            # Индекс — только ускорение: при следующей загрузке он
+            # будет перестроен по данным
+            self._reset_index_changes(None)
+
+    def _write_full_index(self, signature: Optional[List[int]]) -> None:
+        """Переписывает индекс целиком и удаляет журнал"""
+        # Журнал удаляется первым: без него индекс с чужой подписью
+        # просто не загрузится и будет перестроен
+        if os.path.exists(self._index_log_filename):
+            os.unlink(self._index_log_filename)
+        self._index_log_size = 0
+        positions = {doc_id: pos for pos, doc_id in enumerate(self._records)}
+        payload = {
+            "signature": signature,
+            "slots": len(positions),
+            "keywords": self._keyword_index.to_payload(positions),
+        }
+        # dumps, а не dump: потоковый json.dump не использует
+        # C-ускоритель и на больших индексах в разы медленнее
+        text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        with open(self._index_filename, "w", encoding="utf-8") as f:
+            f.write(text)
+        self._index_size = os.path.getsize(self._index_filename)
+        self._index_signature = signature
+        self._reset_index_changes(positions, len(positions))
+
+    def _append_index_log(self, signature: Optional[List[int]]) -> None:
+        """Дописывает в журнал изменения индекса с прошлого сохранения"""
+        slots = self._index_slots
+        assert slots is not None
+        # Идентификаторы возрастают в порядке файла данных, поэтому
+        # слоты новых записей тоже идут в порядке файла
+        for doc_id in sorted(self._index_added):
+            if doc_id not in slots:
+                slots[doc_id] = self._index_next_slot
+                self._index_next_slot += 1
+        entry: Dict[str, Any] = {
+            "base": self._index_signature,
+            "signature": signature,
+            "slots": self._index_next_slot,
+            "keywords": KeywordIndex.payload_for(
+                (slots[doc_id], self._index_texts(self._records[doc_id]))
+                for doc_id in sorted(self._index_added)
+            ),
+        }
+        if self._index_removed:
+            entry["removed"] = KeywordIndex.payload_for(self._index_removed)
+            entry["dropped"] = self._index_dropped
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+        with open(self._index_log_filename, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        self._index_log_size = os.path.getsize(self._index_log_filename)
+        self._index_signature = signature
+        self._index_added = set()
+        self._index_removed = []
+        self._index_dropped = []
+
+    def _load_index(self) -> Optional[KeywordIndex]:
+        """
+        Загружает индекс, если он построен по текущему файлу данных
+
+        Живые слоты в порядке возрастания соответствуют записям файла
+        данных по порядку. Слоты удаленных записей отображаются в -1:
+        их токены выбывают из индекса при применении удалений.
+        """
+        try:
+            with open(self._index_filename, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            signature = payload.get("signature")
+            slot_count = payload["slots"]
+            entries = []
+            log_size = 0
+            if os.path.exists(self._index_log_filename):
+                with open(
+                    self._index_log_filename, "r", encoding="utf-8"
+                ) as f:
+                    for line in f:
+                        entry = json.loads(line)
+                        # Строки, оставшиеся от прежнего индекса
+                        if entry.get("base") != signature:
+                            continue
+                        entries.append(entry)
+                        signature = entry.get("signature")
+                        slot_count = entry["slots"]
+                log_size = os.path.getsize(self._index_log_filename)
+            if signature != self._file_signature():
+                return None
+
+            dropped = {
+                slot for entry in entries for slot in entry.get("dropped", ())
+            }
+            live = [slot for slot in range(slot_count) if slot not in dropped]
+            if len(live) != len(self._records):
+                return None
+            ids = [-1] * slot_count
+            for slot, doc_id in zip(live, self._records):
+                ids[slot] = doc_id
+            index = KeywordIndex.from_payload(payload["keywords"], ids)
+            for entry in entries:
+                index.remove_payload(entry.get("removed", {}), ids)
+                index.merge_payload(entry["keywords"], ids)
+            self._index_size = os.path.getsize(self._index_filename)
+        except (OSError, ValueError, KeyError, IndexError, AttributeError):
+            return None
+        self._index_log_size = log_size
+        self._index_signature = signature
+        self._reset_index_changes(
+            {doc_id: slot for slot, doc_id in zip(live, self._records)},
+            slot_count,
+        )
+        return index
+
+    # ----- AbstractStorage -----
 
     def _vacancy_to_dict(self, vacancy: Vacancy) -> Dict[str, Any]:
         """Конвертирует вакансию в словарь для хранения"""
-        return vacancy.to_dict()
+        data = vacancy.to_dict()
+        data["content_hash"] = content_hash(data)
+        now = self._now()
+        data["fetched_at"] = now
+        data["last_seen"] = now
+        return data
 
     def _is_duplicate(self, vacancy_dict: Dict[str, Any]) -> bool:
         """Проверяет, есть ли дубликат вакансии"""
-        for existing in self._vacancies:
-            if existing.get("url") == vacancy_dict.get("url") and existing.get(
-                "title"
-            ) == vacancy_dict.get("title"):
-                return True
-        return False
+        return record_key(vacancy_dict) in self._ids_by_key
+
+    def _find_near_duplicate(
+        self, vacancy_dict: Dict[str, Any]
+    ) -> Optional[int]:
+        """
+        Идентификатор непросроченной почти одинаковой записи
+
+        Returns:
+            Идентификатор или None, если проверка выключена или
+            похожей записи нет
+        """
+        if self._near_duplicates is None:
+            return None
+        found = self._near_duplicates.find(vacancy_dict)
+        if found is None:
+            return None
+        doc_id = found[0]
+        if not self._is_live(self._records[doc_id], self._expiry_cutoff()):
+            return None
+        return doc_id
+
+    def _add(self, vacancy_dict: Dict[str, Any]) -> bool:
+        """
+        Добавляет вакансию, если ее нет ни точно, ни почти одинаковой
+
+        Просроченная, но еще не удаленная запись с тем же ключом
+        заменяется новой: иначе вакансия осталась бы невидимой до
+        удаления.
+
+        Returns:
+            True, если запись добавлена или заменена
+        """
+        doc_id = self._ids_by_key.get(record_key(vacancy_dict))
+        if doc_id is not None:
+            if self._is_live(self._records[doc_id], self._expiry_cutoff()):
+                return False
+            self._replace(doc_id, vacancy_dict)
+            return True
+        if self._find_near_duplicate(vacancy_dict) is not None:
+            return False
+        self._insert(vacancy_dict)
+        return True
 
     def add_vacancy(self, vacancy: Vacancy) -> None:
         """Добавляет вакансию в файл, если ее нет"""
         vacancy_dict = self._vacancy_to_dict(vacancy)
 
-        if not self._is_duplicate(vacancy_dict):
-            self._vacancies.append(vacancy_dict)
-            self._save_to_file()
+        with self._write_transaction() as fd:
+            if self._add(vacancy_dict):
+                self._commit(fd)
+
+    @METRICS.timed("storage_add_seconds")
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """Добавляет вакансии одной транзакцией с одной записью файла"""
+        vacancy_dicts = [
+            self._vacancy_to_dict(vacancy) for vacancy in vacancies
+        ]
+
+        with self._write_transaction() as fd:
+            added = False
+            for vacancy_dict in vacancy_dicts:
+                added = self._add(vacancy_dict) or added
+            if added:
+                self._commit(fd)
+
+    @METRICS.timed("storage_upsert_seconds")
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> UpsertResult:
+        """
+        Добавляет новые вакансии и обновляет изменившиеся на месте
+
+        Вакансия определяется по URL, изменения — по сохраненному хэшу
+        содержимого. Если ничего не добавлено и не изменено, файл не
+        перезаписывается. При включенной проверке почти одинаковых
+        вакансий новая вакансия, похожая на сохраненную, не добавляется
+        (сохраненная запись не меняется) и учитывается отдельно, в
+        near_duplicates.
+
+        Args:
+            vacancies: Вакансии
+
+        Returns:
+            Количество добавленных, обновленных, неизмененных и почти
+            одинаковых вакансий
+        """
+        vacancy_dicts = [
+            self._vacancy_to_dict(vacancy) for vacancy in vacancies
+        ]
+
+        with self._write_transaction() as fd:
+            ids_by_url: Dict[str, int] = {}
+            for doc_id, data in self._records.items():
+                ids_by_url.setdefault(data.get("url"), doc_id)
+
+            inserted = updated = unchanged = near_duplicates = 0
+            for vacancy_dict in vacancy_dicts:
+                doc_id = ids_by_url.get(vacancy_dict["url"])
+                if doc_id is None:
+                    similar_id = self._find_near_duplicate(vacancy_dict)
+                    if similar_id is not None:
+                        near_duplicates += 1
+                        self._touch(similar_id, vacancy_dict["last_seen"])
+                        continue
+                    doc_id = self._insert(vacancy_dict)
+                    ids_by_url[vacancy_dict["url"]] = doc_id
+                    inserted += 1
+                    continue
 
+                current = self._records[doc_id]
+                current_hash = current.get("content_hash") or content_hash(
+                    current
+                )
+                if current_hash == vacancy_dict["content_hash"]:
+                    unchanged += 1
+                    self._touch(doc_id, vacancy_dict["last_seen"])
+                    continue
+
+                vacancy_dict["fetched_at"] = current.get(
+                    "fetched_at", vacancy_dict["fetched_at"]
+                )
+
+                # Другая запись с тем же URL и названием мешает замене
+                other_id = self._ids_by_key.get(record_key(vacancy_dict))
+                if other_id is not None and other_id != doc_id:
+                    self._remove(other_id)
+                self._replace(doc_id, vacancy_dict)
+                updated += 1
+
+            if inserted or updated:
+                self._commit(fd)
+
+        METRICS.inc("vacancies_inserted_total", inserted)
+        METRICS.inc("vacancies_updated_total", updated)
+        METRICS.inc("vacancies_near_duplicates_total", near_duplicates)
+        return UpsertResult(inserted, updated, unchanged, near_duplicates)
+
+    def _touch(self, doc_id: int, now: float) -> None:
+        """
+        Отмечает, что неизмененная запись снова получена
+
+        Чтобы повторные загрузки не переписывали файл, отметка обновляется
+        только при включенном ttl и только если прошло больше половины ttl.
+        """
+        data = self._records[doc_id]
+        if self._ttl is None:
+            return
+        if now - data.get("last_seen", now) <= self._ttl / 2:
+            return
+        data["last_seen"] = now
+        self._generation += 1
+        self._track_expiry(doc_id, data)
+        self._dirty = True
+
+    @METRICS.timed("storage_get_seconds")
     def get_vacancies(self, **kwargs) -> List[Vacancy]:
         """
         Получает вакансии по критериям
@@ -62,66 +763,353 @@ class JSONStorage(AbstractStorage):
         Args:
             **kwargs: Критерии фильтрации:
                 - keyword: ключевое слово в описании
+                - keywords: список ключевых слов (должны встретиться все)
                 - salary_min: минимальная зарплата
                 - salary_max: максимальная зарплата
+                - avg_min, avg_max: диапазон средней зарплаты
                 - company: название компании
+                - order_by, limit, offset: порядок и окно (см. VacancyQuery)
+
+        Повторный запрос отдается из кэша результатов: проверка
+        актуальности — сравнение метаданных файлов (см. _refresh), затем
+        копирование списка. Копия нужна, чтобы изменения списка
+        вызывающим кодом не портили кэш; она стоит O(числа строк)
+        (порядка 20 мкс на 5 тыс. строк, см. метрику get_all в
+        benchmarks/bench_storage.py).
 
         Returns:
             Список вакансий
         """
-        filtered_data = self._vacancies.copy()
+        query = VacancyQuery.from_kwargs(**kwargs)
+        if not self._cache_size:
+            return list(self.query(query))
 
-        # Фильтрация по ключевому слову
-        if keyword := kwargs.get("keyword"):
-            filtered_data = [
-                v
-                for v in filtered_data
-                if keyword.lower() in v.get("description", "").lower()
-                or keyword.lower() in v.get("requirements", "").lower()
-                or keyword.lower() in v.get("title", "").lower()
-            ]
+        with self._lock:
+            self._refresh()
+            vacancies = self._cache_get(query)
+            if vacancies is None:
+                rows = list(self._execute_rows(query))
+                vacancies = [Vacancy.from_dict(data) for data in rows]
+                self._cache_put(query, vacancies, rows)
+            return list(vacancies)
 
-        # Фильтрация по зарплате
-        if salary_min := kwargs.get("salary_min"):
-            filtered_data = [
-                v
-                for v in filtered_data
-                if v.get("salary_from") and v.get("salary_from") >= salary_min
-            ]
+    # ----- Кэш результатов get_vacancies -----
 
-        if salary_max := kwargs.get("salary_max"):
-            filtered_data = [
-                v
-                for v in filtered_data
-                if v.get("salary_to") and v.get("salary_to") <= salary_max
-            ]
+    def _cache_get(self, query: VacancyQuery) -> Optional[List[Vacancy]]:
+        """Результат запроса из кэша или None"""
+        if self._cache_generation != self._generation:
+            self._result_cache.clear()
+            self._cache_generation = self._generation
+            return None
+        entry = self._result_cache.get(query)
+        if entry is None:
+            return None
+        vacancies, expires_at = entry
+        if self._ttl is not None and self._now() - self._ttl > expires_at:
+            # Одна из вакансий результата просрочена
+            del self._result_cache[query]
+            return None
+        self._result_cache.move_to_end(query)
+        return vacancies
+
+    def _cache_put(
+        self,
+        query: VacancyQuery,
+        vacancies: List[Vacancy],
+        rows: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Кладет результат в кэш, вытесняя самый давно использованный
+
+        Результат остается верным, пока не просрочена ни одна из его
+        записей: просрочка остальных записей его не меняет.
+        """
+        expires_at = min(
+            (data.get("last_seen", float("inf")) for data in rows),
+            default=float("inf"),
+        )
+        self._result_cache[query] = (vacancies, expires_at)
+        if len(self._result_cache) > self._cache_size:
+            self._result_cache.popitem(last=False)
+
+    def query(self, query: VacancyQuery) -> Iterator[Vacancy]:
+        """
+        Выполняет запрос по плану, выбранному по индексам
+
+        Записи перебираются лениво: вакансии создаются только для строк
+        внутри окна offset/limit, перебор останавливается на limit.
+        План строится под блокировкой, итератор привязан к записям и
+        индексам на момент вызова: перезагрузка файла из другого потока
+        его не затрагивает. Изменять хранилище, пока итератор не
+        исчерпан, нельзя.
+
+        Args:
+            query: Запрос
+
+        Returns:
+            Итератор по вакансиям в требуемом порядке
+        """
+        with self._lock:
+            self._refresh()
+            return self._execute(query)
+
+    def _execute(self, query: VacancyQuery) -> Iterator[Vacancy]:
+        """Лениво выполняет запрос по загруженным данным"""
+        return map(Vacancy.from_dict, self._execute_rows(query))
+
+    def _execute_rows(self, query: VacancyQuery) -> Iterator[Dict[str, Any]]:
+        """Лениво отбирает записи запроса в окне offset/limit"""
+        cutoff = self._expiry_cutoff()
+        records = self._records
+        rows = (records[doc_id] for doc_id in self._plan(query))
+        matched = (
+            data
+            for data in rows
+            if self._is_live(data, cutoff) and query.matches(data)
+        )
+        return islice(matched, query.offset, query.stop)
+
+    def _index_sources(
+        self, query: VacancyQuery
+    ) -> List[Tuple[int, Callable[[], Iterable[int]]]]:
+        """
+        Индексы, которые могут сузить перебор
+
+        Returns:
+            Пары (оценка числа кандидатов, функция получения кандидатов)
+        """
+        sources = []
+
+        if query.all_keywords:
+            keyword_ids = self._keyword_index.lookup(query.all_keywords)
+            if keyword_ids is not None:
+                sources.append((len(keyword_ids), lambda: keyword_ids))
+
+        for field, low, high in (
+            ("salary_from", query.salary_min or None, None),
+            ("salary_to", None, query.salary_max or None),
+            ("avg", query.avg_min, query.avg_max),
+        ):
+            if low is None and high is None:
+                continue
+            index = self._salary_indexes[field]
+            sources.append(
+                (
+                    index.count_range(low, high),
+                    lambda index=index, low=low, high=high: index.range(
+                        low, high
+                    ),
+                )
+            )
+        return sources
+
+    def _plan(self, query: VacancyQuery) -> Iterable[int]:
+        """
+        Выбирает порядок перебора идентификаторов записей
+
+        Индексы дают надмножество ответа, остальные критерии проверяет
+        VacancyQuery.matches, поэтому достаточно одного источника:
+        - без сортировки — самый узкий индекс (или все записи);
+        - сортировка по зарплате — обход зарплатного индекса по порядку,
+          если до limit придется просмотреть меньше строк, чем дает самый
+          узкий индекс; иначе кандидаты сортируются;
+        - прочие сортировки — сортировка кандидатов.
+        """
+        sources = self._index_sources(query)
+        best = min(sources, key=lambda source: source[0]) if sources else None
 
-        # Фильтрация по компании
-        if company := kwargs.get("company"):
-            filtered_data = [
-                v
-                for v in filtered_data
-                if company.lower() in v.get("company", "").lower()
+        order_field = query.order_field
+        if order_field is None:
+            return self._records.keys() if best is None else sorted(best[1]())
+
+        if order_field in SalaryIndexes.FIELDS:
+            if best is None:
+                return self._walk_salary_index(order_field, query.descending)
+            if query.stop is not None:
+                # Ожидаемое число строк до limit при обходе индекса:
+                # stop / доля подходящих = stop * N / best
+                estimate = best[0]
+                if estimate * estimate > query.stop * len(self._records):
+                    return self._walk_salary_index(
+                        order_field, query.descending
+                    )
+
+        doc_ids = self._records.keys() if best is None else sorted(best[1]())
+        return sorted(
+            doc_ids,
+            key=lambda doc_id: query.order_value(self._records[doc_id]),
+            reverse=query.descending,
+        )
+
+    def _walk_salary_index(
+        self, field: str, descending: bool
+    ) -> Iterator[int]:
+        """
+        Перебирает записи в порядке зарплатного индекса
+
+        Вакансии без зарплаты в индекс не входят; они считаются нулевыми
+        и идут в конце при убывании и в начале при возрастании.
+        """
+        index = self._salary_indexes[field]
+        unsalaried = (
+            doc_id
+            for doc_id, data in self._records.items()
+            if not index.indexes(data)
+        )
+        if descending:
+            return chain(index.descending(), unsalaried)
+        return chain(unsalaried, index.range())
+
+    def top_by_salary(self, top_n: int, field: str = "avg") -> List[Vacancy]:
+        """
+        Возвращает топ N вакансий по зарплате обходом индекса
+
+        Args:
+            top_n: Количество вакансий
+            field: Поле зарплаты: salary_from, salary_to или avg
+
+        Returns:
+            Вакансии по убыванию зарплаты (без вакансий без зарплаты)
+        """
+        with self._lock:
+            self._refresh()
+            cutoff = self._expiry_cutoff()
+            live = (
+                data
+                for data in map(
+                    self._records.__getitem__,
+                    self._salary_indexes[field].descending(),
+                )
+                if self._is_live(data, cutoff)
+            )
+            return [
+                Vacancy.from_dict(data)
+                for data in islice(live, max(top_n, 0))
             ]
 
-        # Конвертация в объекты Vacancy
-        return [Vacancy.from_dict(data) for data in filtered_data]
+    def get_by_keys(self, keys: Iterable[str]) -> List[Optional[Vacancy]]:
+        """
+        Получает вакансии по ключам записей (identity.record_key)
+
+        Args:
+            keys: Ключи записей
+
+        Returns:
+            Вакансии в порядке ключей; None для отсутствующих и
+            просроченных записей
+        """
+        self._refresh()
+        with self._lock:
+            cutoff = self._expiry_cutoff()
+            result: List[Optional[Vacancy]] = []
+            for key in keys:
+                doc_id = self._ids_by_key.get(key)
+                data = None if doc_id is None else self._records[doc_id]
+                if data is not None and self._is_live(data, cutoff):
+                    result.append(Vacancy.from_dict(data))
+                else:
+                    result.append(None)
+            return result
 
     def delete_vacancy(self, vacancy: Vacancy) -> None:
         """Удаляет вакансию из файла"""
         vacancy_dict = self._vacancy_to_dict(vacancy)
 
-        self._vacancies = [
-            v
-            for v in self._vacancies
-            if not (
-                v.get("url") == vacancy_dict.get("url")
-                and v.get("title") == vacancy_dict.get("title")
-            )
-        ]
-        self._save_to_file()
+        with self._write_transaction() as fd:
+            doc_id = self._ids_by_key.get(record_key(vacancy_dict))
+            if doc_id is not None:
+                self._remove(doc_id)
+            self._commit(fd)
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """Удаляет вакансии одной транзакцией с одной записью файла"""
+        keys = [record_key(vacancy.to_dict()) for vacancy in vacancies]
+
+        with self._write_transaction() as fd:
+            removed = False
+            for key in keys:
+                doc_id = self._ids_by_key.get(key)
+                if doc_id is not None:
+                    self._remove(doc_id)
+                    removed = True
+            if removed:
+                self._commit(fd)
 
     def clear(self) -> None:
         """Очищает файл"""
-        self._vacancies = []
-        self._save_to_file()
+        with self._write_transaction() as fd:
+            self._records = {}
+            self._ids_by_key = {}
+            self._generation += 1
+            self._index_slots = None
+            self._keyword_index.clear()
+            self._salary_indexes.clear()
+            if self._near_duplicates is not None:
+                self._near_duplicates.clear()
+            self._commit(fd)
+
+    # ----- Почти одинаковые вакансии -----
+
+    def _near_duplicate_groups(
+        self, threshold: Optional[float]
+    ) -> List[List[int]]:
+        """Группы идентификаторов почти одинаковых непросроченных записей"""
+        cutoff = self._expiry_cutoff()
+        index = self._near_duplicates
+        if index is not None and threshold in (None, index.threshold):
+            groups = index.clusters()
+        else:
+            groups = find_near_duplicates(
+                self._records.items(), threshold or DEFAULT_THRESHOLD
+            )
+        live_groups = []
+        for group in groups:
+            live = [
+                doc_id
+                for doc_id in group
+                if self._is_live(self._records[doc_id], cutoff)
+            ]
+            if len(live) > 1:
+                live_groups.append(live)
+        return live_groups
+
+    def near_duplicate_clusters(
+        self, threshold: Optional[float] = None
+    ) -> List[List[Vacancy]]:
+        """
+        Находит группы почти одинаковых вакансий среди сохраненных
+
+        Args:
+            threshold: Порог сходства (по умолчанию — порог хранилища
+                или near_duplicates.DEFAULT_THRESHOLD)
+
+        Returns:
+            Группы из двух и более вакансий в порядке добавления
+        """
+        self._refresh()
+        with self._lock:
+            return [
+                [Vacancy.from_dict(self._records[doc_id]) for doc_id in group]
+                for group in self._near_duplicate_groups(threshold)
+            ]
+
+    def remove_near_duplicates(self, threshold: Optional[float] = None) -> int:
+        """
+        Удаляет почти одинаковые вакансии, оставляя в каждой группе
+        добавленную первой
+
+        Args:
+            threshold: Порог сходства, как в near_duplicate_clusters
+
+        Returns:
+            Количество удаленных записей
+        """
+        with self._write_transaction() as fd:
+            removed = 0
+            for group in self._near_duplicate_groups(threshold):
+                for doc_id in group[1:]:
+                    self._remove(doc_id)
+                    removed += 1
+            if removed:
+                self._commit(fd)
+        return removed
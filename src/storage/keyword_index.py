@@ -0,0 +1,279 @@
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# \w в Python 3 распознает буквы любых алфавитов, включая кириллицу
+_TOKEN_RE = re.compile(r"\w+")
+
+# Длина n-грамм, по которым ищутся токены словаря, содержащие подстроку
+_GRAM_SIZE = 3
+
+
+def normalize_text(text: str) -> str:
+    """Приводит текст к нижнему регистру и заменяет «ё» на «е»"""
+    return text.lower().replace("ё", "е")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Разбивает текст на токены
+
+    Токен — максимальная последовательность буквенно-цифровых символов
+    (Unicode), нормализованная через normalize_text.
+
+    Args:
+        text: Исходный текст
+
+    Returns:
+        Список токенов в порядке появления
+    """
+    if not text:
+        return []
+    return _TOKEN_RE.findall(normalize_text(text))
+
+
+class KeywordIndex:
+    """
+    Инвертированный индекс: токен -> множество идентификаторов записей
+
+    Индекс отвечает на вопрос «в каких записях может встретиться
+    подстрока», то есть возвращает надмножество точного ответа.
+    Каждый токен ключевого слова обязан быть подстрокой какого-то токена
+    записи, поэтому кандидаты — объединение списков всех токенов
+    словаря, содержащих токен запроса. Точное совпадение подстроки
+    проверяет вызывающий код, но только на кандидатах.
+
+    Токены словаря, содержащие токен запроса, ищутся по триграммам:
+    пересечение множеств токенов для всех триграмм запроса, и только
+    на оставшихся проверяется вхождение подстроки. Индекс триграмм
+    строится при первом поиске; токены запроса короче триграммы
+    сравниваются со всем словарем.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[int]] = {}
+        # Триграмма -> токены словаря, в которые она входит
+        self._grams: Optional[Dict[str, Set[str]]] = None
+
+    def __len__(self) -> int:
+        """Размер словаря"""
+        return len(self._postings)
+
+    def add(self, doc_id: int, texts: Iterable[str]) -> None:
+        """Индексирует тексты записи"""
+        for token in self._doc_tokens(texts):
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                self._add_grams(token)
+            posting.add(doc_id)
+
+    def remove(self, doc_id: int, texts: Iterable[str]) -> None:
+        """Удаляет запись из списков токенов ее текстов"""
+        for token in self._doc_tokens(texts):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[token]
+                self._remove_grams(token)
+
+    def clear(self) -> None:
+        """Очищает индекс"""
+        self._postings.clear()
+        self._grams = None
+
+    @staticmethod
+    def _token_grams(token: str) -> Set[str]:
+        """Триграммы токена"""
+        return {
+            token[start : start + _GRAM_SIZE]
+            for start in range(len(token) - _GRAM_SIZE + 1)
+        }
+
+    def _add_grams(self, token: str) -> None:
+        """Добавляет новый токен словаря в индекс триграмм"""
+        if self._grams is None:
+            return
+        for gram in self._token_grams(token):
+            self._grams.setdefault(gram, set()).add(token)
+
+    def _remove_grams(self, token: str) -> None:
+        """Удаляет токен, выбывший из словаря, из индекса триграмм"""
+        if self._grams is None:
+            return
+        for gram in self._token_grams(token):
+            tokens = self._grams.get(gram)
+            if tokens is None:
+                continue
+            tokens.discard(token)
+            if not tokens:
+                del self._grams[gram]
+
+    def _vocab_matches(self, token: str) -> Iterable[str]:
+        """Токены словаря, содержащие данный как подстроку"""
+        if len(token) < _GRAM_SIZE:
+            return [vocab for vocab in self._postings if token in vocab]
+        if self._grams is None:
+            self._grams = {}
+            for vocab in self._postings:
+                self._add_grams(vocab)
+        sets = []
+        for gram in self._token_grams(token):
+            tokens = self._grams.get(gram)
+            if tokens is None:
+                return []
+            sets.append(tokens)
+        sets.sort(key=len)
+        survivors = sets[0].intersection(*sets[1:])
+        # Триграммы могут стоять в токене словаря в другом порядке
+        return [vocab for vocab in survivors if token in vocab]
+
+    @staticmethod
+    def _doc_tokens(texts: Iterable[str]) -> Set[str]:
+        """Уникальные токены всех текстов записи"""
+        tokens: Set[str] = set()
+        for text in texts:
+            tokens.update(tokenize(text))
+        return tokens
+
+    def _token_candidates(self, token: str) -> Set[int]:
+        """Записи, в которых есть токен, содержащий данный как подстроку"""
+        matched = [
+            self._postings[vocab] for vocab in self._vocab_matches(token)
+        ]
+        if len(matched) == 1:
+            return matched[0]
+        return set().union(*matched)
+
+    def candidates(self, keyword: str) -> Optional[Set[int]]:
+        """
+        Кандидаты для одного ключевого слова
+
+        Args:
+            keyword: Ключевое слово (подстрока)
+
+        Returns:
+            Множество идентификаторов или None, если в ключевом слове
+            нет токенов и индекс не может сузить поиск
+        """
+        return self.lookup([keyword])
+
+    def lookup(self, keywords: Iterable[str]) -> Optional[Set[int]]:
+        """
+        Кандидаты для запроса «все ключевые слова» (AND)
+
+        Списки пересекаются, начиная с самого короткого.
+
+        Args:
+            keywords: Ключевые слова
+
+        Returns:
+            Множество идентификаторов или None, если ни одно ключевое
+            слово не содержит токенов
+        """
+        tokens = {token for keyword in keywords for token in tokenize(keyword)}
+        if not tokens:
+            return None
+
+        postings = sorted(
+            (self._token_candidates(token) for token in tokens), key=len
+        )
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
+
+    def to_payload(self, positions: Dict[int, int]) -> Dict[str, List[int]]:
+        """
+        Сериализует индекс для сохранения на диск
+
+        Args:
+            positions: Отображение идентификатора записи в ее позицию
+                в файле данных
+
+        Returns:
+            Словарь токен -> отсортированный список позиций
+        """
+        return {
+            token: sorted(positions[doc_id] for doc_id in posting)
+            for token, posting in self._postings.items()
+        }
+
+    @classmethod
+    def payload_for(
+        cls, docs: Iterable[Tuple[int, Iterable[str]]]
+    ) -> Dict[str, List[int]]:
+        """
+        Список позиций по токенам для части записей (в формате to_payload)
+
+        Args:
+            docs: Пары (позиция в файле данных, тексты записи)
+
+        Returns:
+            Словарь токен -> возрастающий список позиций
+        """
+        payload: Dict[str, List[int]] = {}
+        for position, texts in docs:
+            for token in cls._doc_tokens(texts):
+                payload.setdefault(token, []).append(position)
+        return payload
+
+    def merge_payload(
+        self, payload: Dict[str, List[int]], ids: List[int]
+    ) -> None:
+        """
+        Добавляет в индекс записи из payload_for
+
+        Args:
+            payload: Словарь токен -> список позиций
+            ids: Идентификаторы записей по позициям в файле данных
+        """
+        for token, positions in payload.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                self._add_grams(token)
+            posting.update(ids[position] for position in positions)
+
+    def remove_payload(
+        self, payload: Dict[str, List[int]], ids: List[int]
+    ) -> None:
+        """
+        Удаляет из списков токенов записи из payload_for
+
+        Args:
+            payload: Словарь токен -> список позиций
+            ids: Идентификаторы записей по позициям в файле данных
+        """
+        for token, positions in payload.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.difference_update(ids[position] for position in positions)
+            if not posting:
+                del self._postings[token]
+                self._remove_grams(token)
+
+    @classmethod
+    def from_payload(
+        cls, payload: Dict[str, List[int]], ids: List[int]
+    ) -> "KeywordIndex":
+        """
+        Восстанавливает индекс, сохраненный через to_payload
+
+        Args:
+            payload: Словарь токен -> список позиций
+            ids: Идентификаторы записей по позициям в файле данных
+
+        Returns:
+            Индекс
+        """
+        index = cls()
+        index._postings = {
+            token: {ids[position] for position in positions}
+            for token, positions in payload.items()
+        }
+        return index
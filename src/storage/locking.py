@@ -0,0 +1,108 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    Рекомендательная блокировка хранилища между процессами
+
+    Блокируется отдельный файл *.lock рядом с данными, поэтому файл
+    данных можно атомарно заменять через os.replace. В файле блокировки
+    хранится номер поколения данных: писатель увеличивает его при каждом
+    сохранении, а читатели по нему понимают, что данные нужно перечитать.
+
+    На POSIX используется flock с разделяемым режимом для чтения и
+    исключительным для записи. На Windows (msvcrt) обе блокировки
+    исключительные.
+
+    Блокировки не реентерабельны: вложенный захват в том же процессе
+    приведет к взаимоблокировке.
+    """
+
+    # Интервал повторных попыток захвата на Windows
+    _RETRY_INTERVAL = 0.05
+
+    def __init__(self, lock_filename: str):
+        self._lock_filename = lock_filename
+
+    @property
+    def filename(self) -> str:
+        return self._lock_filename
+
+    @contextmanager
+    def shared(self) -> Iterator[int]:
+        """
+        Разделяемая блокировка для чтения
+
+        Yields:
+            Дескриптор файла блокировки
+        """
+        with self._locked(exclusive=False) as fd:
+            yield fd
+
+    @contextmanager
+    def exclusive(self) -> Iterator[int]:
+        """
+        Исключительная блокировка для записи
+
+        Yields:
+            Дескриптор файла блокировки
+        """
+        with self._locked(exclusive=True) as fd:
+            yield fd
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[int]:
+        fd = os.open(self._lock_filename, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            self._acquire(fd, exclusive)
+            try:
+                yield fd
+            finally:
+                self._release(fd)
+        finally:
+            os.close(fd)
+
+    def _acquire(self, fd: int, exclusive: bool) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            return
+        while True:  # pragma: no cover - Windows
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                time.sleep(self._RETRY_INTERVAL)
+
+    def _release(self, fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            return
+        os.lseek(fd, 0, os.SEEK_SET)  # pragma: no cover - Windows
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)  # pragma: no cover
+
+    @staticmethod
+    def read_generation(fd: int) -> int:
+        """Читает номер поколения из захваченного файла блокировки"""
+        os.lseek(fd, 0, os.SEEK_SET)
+        content = os.read(fd, 32).strip()
+        try:
+            return int(content)
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def write_generation(fd: int, generation: int) -> None:
+        """Записывает номер поколения (нужна исключительная блокировка)"""
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, str(generation).encode("ascii"))
@@ -0,0 +1,331 @@
+import json
+import mmap
+import os
+import struct
+from array import array
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from ..models.vacancy import Vacancy
+from .abstract_storage import AbstractStorage
+from .filters import match_record
+from .identity import key_hash, record_key
+from .query import VacancyQuery
+
+# Заголовок индекса: сигнатура, версия и размер файла данных,
+# который покрыт индексом (для проверки актуальности)
+_INDEX_MAGIC = b"VIDX"
+_INDEX_VERSION = 1
+_INDEX_HEADER = struct.Struct("<4sIq")
+# Запись индекса: смещение строки в файле данных и хэш ключа
+_INDEX_ENTRY = struct.Struct("<qq")
+# Смещение удаленной записи
+_DELETED = -1
+
+
+class MmapJSONStorage(AbstractStorage):
+    """
+    Хранилище в формате JSON Lines с отображением файла в память
+
+    Каждая вакансия хранится отдельной строкой минифицированного JSON.
+    Рядом с файлом данных лежит бинарный индекс (файл *.idx) из пар
+    «смещение строки, хэш ключа». Оба файла отображаются в память через
+    mmap, поэтому открытие хранилища не читает и не разбирает данные:
+    записи декодируются только при выдаче из iter_vacancies.
+    """
+
+    def __init__(self, filename: str = "data/vacancies.jsonl"):
+        self._filename = filename
+        self._index_filename = filename + ".idx"
+        self._ensure_directory()
+
+        self._data_map: Optional[mmap.mmap] = None
+        self._index_map: Optional[mmap.mmap] = None
+        self._entries: Optional[memoryview] = None
+        # Хэш ключа -> номер записи в индексе; строится лениво при записи
+        self._slots_by_hash: Optional[Dict[int, List[int]]] = None
+
+        if not os.path.exists(self._filename):
+            open(self._filename, "wb").close()
+        if not self._index_is_valid():
+            self._rebuild_index()
+        self._open_maps()
+
+    def _ensure_directory(self) -> None:
+        """Создает директорию для файла, если она не существует"""
+        directory = os.path.dirname(self._filename)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+    # ----- Отображение файлов в память -----
+
+    def _open_maps(self) -> None:
+        """Отображает файл данных и индекс в память (только чтение)"""
+        self._close_maps()
+        self._data_map = self._map_file(self._filename)
+        self._index_map = self._map_file(self._index_filename)
+        if self._index_map is not None and len(self._index_map) > (
+            _INDEX_HEADER.size
+        ):
+            self._entries = memoryview(self._index_map)[
+                _INDEX_HEADER.size :
+            ].cast("q")
+
+    def _close_maps(self) -> None:
+        """Освобождает отображения перед изменением файлов"""
+        if self._entries is not None:
+            self._entries.release()
+            self._entries = None
+        for mapped in (self._data_map, self._index_map):
+            if mapped is not None:
+                mapped.close()
+        self._data_map = None
+        self._index_map = None
+
+    @staticmethod
+    def _map_file(filename: str) -> Optional[mmap.mmap]:
+        """Отображает файл в память; для пустого файла возвращает None"""
+        if not os.path.exists(filename) or os.path.getsize(filename) == 0:
+            return None
+        with open(filename, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        """Закрывает отображения файлов"""
+        self._close_maps()
+
+    # ----- Индекс -----
+
+    def _index_is_valid(self) -> bool:
+        """Проверяет, что индекс существует и покрывает весь файл данных"""
+        if not os.path.exists(self._index_filename):
+            return False
+        try:
+            with open(self._index_filename, "rb") as f:
+                header = f.read(_INDEX_HEADER.size)
+            magic, version, covered = _INDEX_HEADER.unpack(header)
+        except (OSError, struct.error):
+            return False
+        return (
+            magic == _INDEX_MAGIC
+            and version == _INDEX_VERSION
+            and covered == os.path.getsize(self._filename)
+        )
+
+    def _rebuild_index(self) -> None:
+        """Восстанавливает индекс полным проходом по файлу данных"""
+        entries = array("q")
+        offset = 0
+        with open(self._filename, "rb") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        data = None
+                    if isinstance(data, dict):
+                        entries.append(offset)
+                        entries.append(key_hash(record_key(data)))
+                offset += len(line)
+
+        with open(self._index_filename, "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, offset))
+            entries.tofile(f)
+
+    def _write_index_header(self, covered: int) -> None:
+        """Обновляет размер покрытого индексом файла данных"""
+        with open(self._index_filename, "r+b") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, covered))
+
+    def __len__(self) -> int:
+        """Количество живых записей"""
+        return sum(
+            1
+            for slot in range(self._slot_count())
+            if self._entries[2 * slot] != _DELETED
+        )
+
+    def _slot_count(self) -> int:
+        """Количество записей индекса, включая удаленные"""
+        return 0 if self._entries is None else len(self._entries) // 2
+
+    def _hash_slots(self) -> Dict[int, List[int]]:
+        """Таблица хэш -> номера записей; нужна только операциям записи"""
+        if self._slots_by_hash is None:
+            table: Dict[int, List[int]] = {}
+            for slot in range(self._slot_count()):
+                if self._entries[2 * slot] != _DELETED:
+                    key_hash_value = self._entries[2 * slot + 1]
+                    table.setdefault(key_hash_value, []).append(slot)
+            self._slots_by_hash = table
+        return self._slots_by_hash
+
+    def _find_slot(self, key: str) -> Optional[int]:
+        """Ищет номер записи по ключу (с проверкой коллизий хэша)"""
+        for slot in self._hash_slots().get(key_hash(key), []):
+            if record_key(self._read_record(slot)) == key:
+                return slot
+        return None
+
+    # ----- Чтение записей -----
+
+    def _read_record(self, slot: int) -> Dict[str, Any]:
+        """Декодирует запись по номеру в индексе"""
+        offset = self._entries[2 * slot]
+        end = self._data_map.find(b"\n", offset)
+        if end == -1:
+            end = len(self._data_map)
+        return json.loads(self._data_map[offset:end])
+
+    def _iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Лениво перебирает живые записи в порядке добавления"""
+        for slot in range(self._slot_count()):
+            if self._entries[2 * slot] != _DELETED:
+                yield self._read_record(slot)
+
+    def iter_vacancies(self, **kwargs) -> Iterator[Vacancy]:
+        """
+        Лениво выдает вакансии, подходящие под критерии
+
+        Args:
+            **kwargs: Критерии фильтрации, как в get_vacancies
+
+        Yields:
+            Объекты Vacancy, декодированные по мере перебора
+        """
+        for data in self._iter_records():
+            if match_record(data, **kwargs):
+                yield Vacancy.from_dict(data)
+
+    def query(self, query: VacancyQuery) -> Iterator[Vacancy]:
+        """
+        Выполняет запрос; без сортировки — потоково с остановкой на limit
+
+        Args:
+            query: Запрос
+
+        Returns:
+            Итератор по вакансиям
+        """
+        if query.order_field:
+            return super().query(query)
+        matched = (
+            data for data in self._iter_records() if query.matches(data)
+        )
+        return (
+            Vacancy.from_dict(data)
+            for data in islice(matched, query.offset, query.stop)
+        )
+
+    def get_by_keys(self, keys: Iterable[str]) -> List[Optional[Vacancy]]:
+        """
+        Получает вакансии по ключам записей через хэш-таблицу индекса
+
+        Returns:
+            Вакансии в порядке ключей; None для отсутствующих
+        """
+        result: List[Optional[Vacancy]] = []
+        for key in keys:
+            slot = self._find_slot(key)
+            result.append(
+                None
+                if slot is None
+                else Vacancy.from_dict(self._read_record(slot))
+            )
+        return result
+
+    # ----- AbstractStorage -----
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """Дописывает вакансию в конец файла, если ее нет"""
+        vacancy_dict = vacancy.to_dict()
+        key = record_key(vacancy_dict)
+        if self._find_slot(key) is not None:
+            return
+
+        line = json.dumps(
+            vacancy_dict, ensure_ascii=False, separators=(",", ":")
+        )
+        payload = line.encode("utf-8") + b"\n"
+
+        self._close_maps()
+        with open(self._filename, "ab") as f:
+            offset = f.tell()
+            f.write(payload)
+        with open(self._index_filename, "ab") as f:
+            f.write(_INDEX_ENTRY.pack(offset, key_hash(key)))
+        self._write_index_header(offset + len(payload))
+        self._open_maps()
+
+        slot = self._slot_count() - 1
+        self._hash_slots().setdefault(key_hash(key), []).append(slot)
+
+    def get_vacancies(self, **kwargs) -> List[Vacancy]:
+        """
+        Получает вакансии по критериям
+
+        Args:
+            **kwargs: Критерии фильтрации:
+                - keyword: ключевое слово в описании
+                - salary_min: минимальная зарплата
+                - salary_max: максимальная зарплата
+                - company: название компании
+                - order_by, limit, offset: порядок и окно (см. VacancyQuery)
+
+        Returns:
+            Список вакансий
+        """
+        return list(self.query(VacancyQuery.from_kwargs(**kwargs)))
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Удаляет вакансию
+
+        Строка в файле данных затирается пробелами той же длины,
+        а запись индекса помечается удаленной: файл не переписывается.
+        """
+        key = record_key(vacancy.to_dict())
+        slot = self._find_slot(key)
+        if slot is None:
+            return
+
+        offset = self._entries[2 * slot]
+        end = self._data_map.find(b"\n", offset)
+        if end == -1:
+            end = len(self._data_map)
+
+        self._close_maps()
+        with open(self._filename, "r+b") as f:
+            f.seek(offset)
+            f.write(b" " * (end - offset))
+        with open(self._index_filename, "r+b") as f:
+            f.seek(_INDEX_HEADER.size + slot * _INDEX_ENTRY.size)
+            f.write(struct.pack("<q", _DELETED))
+        self._open_maps()
+
+        slots = self._hash_slots()[key_hash(key)]
+        slots.remove(slot)
+
+    def clear(self) -> None:
+        """Очищает хранилище"""
+        self._close_maps()
+        open(self._filename, "wb").close()
+        with open(self._index_filename, "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, 0))
+        self._slots_by_hash = None
+        self._open_maps()
+
+    def compact(self) -> None:
+        """Переписывает файлы без удаленных записей"""
+        records = list(self._iter_records())
+        tmp_filename = self._filename + ".tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as f:
+            for data in records:
+                f.write(
+                    json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+                )
+                f.write("\n")
+        self._close_maps()
+        os.replace(tmp_filename, self._filename)
+        self._rebuild_index()
+        self._slots_by_hash = None
+        self._open_maps()
@@ -0,0 +1,309 @@
+import hashlib
+import random
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from .keyword_index import tokenize
+
+K = TypeVar("K", bound=Hashable)
+
+# Поля, по которым сравниваются вакансии: перепубликация обычно меняет
+# URL и немного название, но не требования и не компанию
+SHINGLE_FIELDS = ("title", "requirements", "company")
+
+# Оценка сходства по Жаккару, начиная с которой вакансии считаются
+# почти одинаковыми
+DEFAULT_THRESHOLD = 0.8
+
+Signature = Tuple[int, ...]
+
+
+def shingles(data: Dict[str, Any], size: int = 2) -> Set[str]:
+    """
+    Шинглы записи: последовательности из size соседних слов
+
+    Args:
+        data: Запись вакансии (формат Vacancy.to_dict)
+        size: Число слов в шингле
+
+    Returns:
+        Множество шинглов; для текста короче size — один шингл из всех слов
+    """
+    tokens: List[str] = []
+    for field in SHINGLE_FIELDS:
+        tokens.extend(tokenize(data.get(field) or ""))
+    if len(tokens) <= size:
+        return {" ".join(tokens)} if tokens else set()
+    return {
+        " ".join(tokens[start : start + size])
+        for start in range(len(tokens) - size + 1)
+    }
+
+
+def _shingle_hash(shingle: str) -> int:
+    """Стабильный 64-битный хэш шингла"""
+    digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class _UnionFind:
+    """Система непересекающихся множеств для сборки кластеров"""
+
+    def __init__(self) -> None:
+        self.parent: Dict[Any, Any] = {}
+
+    def find(self, item: Any) -> Any:
+        parent = self.parent.setdefault(item, item)
+        if parent != item:
+            parent = self.parent[item] = self.find(parent)
+        return parent
+
+    def union(self, first: Any, second: Any) -> None:
+        self.parent[self.find(second)] = self.find(first)
+
+
+class NearDuplicateIndex(Generic[K]):
+    """
+    Индекс почти одинаковых вакансий: MinHash и LSH
+
+    Для каждой записи строится подпись MinHash из num_perm позиций по
+    шинглам полей SHINGLE_FIELDS. Вместо num_perm хэш-функций на каждый
+    шингл используется одна (one permutation hashing): хэш шингла
+    определяет позицию подписи, в которой сохраняется минимум. Пустые
+    позиции заполняются значением из другой позиции, выбранной по
+    фиксированной для номера позиции псевдослучайной последовательности
+    (оптимальное уплотнение, Shrivastava, 2017). Подпись строится за
+    один проход по шинглам вместо num_perm проходов, а доля совпадающих
+    позиций двух подписей, как и в классическом MinHash, оценивает
+    сходство множеств шинглов по Жаккару.
+
+    Подпись делится на bands полос; записи с одинаковой полосой
+    попадают в одну корзину. Кандидаты на дубликат — только соседи по
+    корзинам, поэтому поиск для одной записи не зависит от размера
+    индекса, а кластеризация всего индекса линейна по числу записей.
+    Кандидаты проверяются оценкой сходства по полной подписи.
+
+    При 64 позициях и 16 полосах по 4 пары со сходством 0.8 становятся
+    кандидатами с вероятностью выше 99.9%.
+
+    Записи без слов в сравниваемых полях не индексируются.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 2,
+        seed: int = 1,
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError("Порог сходства должен быть в диапазоне (0, 1]")
+        if bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm должно делиться на число полос")
+        self.threshold = threshold
+        self._num_perm = num_perm
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._shingle_size = shingle_size
+        rng = random.Random(seed)
+        # Порядок просмотра позиций для заполнения каждой пустой позиции
+        self._probes = []
+        for _ in range(num_perm):
+            probe = list(range(num_perm))
+            rng.shuffle(probe)
+            self._probes.append(probe)
+        # Ключ -> подпись; порядок словаря — порядок добавления
+        self._signatures: Dict[K, Signature] = {}
+        # Ключ -> порядковый номер добавления (для выбора при равном сходстве)
+        self._sequence: Dict[K, int] = {}
+        self._added = 0
+        # Хэш (номер полосы, значения полосы) -> ключи записей
+        self._buckets: Dict[int, Set[K]] = {}
+
+    def __len__(self) -> int:
+        """Количество проиндексированных записей"""
+        return len(self._signatures)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._signatures
+
+    def signature(self, data: Dict[str, Any]) -> Optional[Signature]:
+        """
+        Подпись MinHash записи
+
+        Returns:
+            Кортеж из num_perm чисел или None, если сравнивать нечего
+        """
+        hashes = [
+            _shingle_hash(item)
+            for item in shingles(data, self._shingle_size)
+        ]
+        if not hashes:
+            return None
+        size = self._num_perm
+        minimums: List[Optional[int]] = [None] * size
+        for value in hashes:
+            rest, position = divmod(value, size)
+            current = minimums[position]
+            if current is None or rest < current:
+                minimums[position] = rest
+
+        signature = list(minimums)
+        for position, value in enumerate(minimums):
+            if value is not None:
+                continue
+            for source in self._probes[position]:
+                if minimums[source] is not None:
+                    signature[position] = minimums[source]
+                    break
+        return tuple(signature)  # type: ignore[arg-type]
+
+    def _band_keys(self, signature: Signature) -> List[int]:
+        """Ключи корзин подписи — по одному на полосу"""
+        rows = self._rows
+        return [
+            hash((band, signature[band * rows : (band + 1) * rows]))
+            for band in range(self._bands)
+        ]
+
+    def similarity(self, first: Signature, second: Signature) -> float:
+        """Оценка сходства по Жаккару: доля совпадающих позиций подписей"""
+        return sum(a == b for a, b in zip(first, second)) / self._num_perm
+
+    def add(self, key: K, data: Dict[str, Any]) -> None:
+        """
+        Индексирует запись (запись с тем же ключом заменяется)
+
+        Args:
+            key: Ключ записи
+            data: Запись вакансии
+        """
+        if key in self._signatures:
+            self.remove(key)
+        signature = self.signature(data)
+        if signature is None:
+            return
+        self._signatures[key] = signature
+        self._sequence[key] = self._added
+        self._added += 1
+        for bucket in self._band_keys(signature):
+            self._buckets.setdefault(bucket, set()).add(key)
+
+    def remove(self, key: K) -> None:
+        """Удаляет запись из индекса (если она есть)"""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        del self._sequence[key]
+        for bucket in self._band_keys(signature):
+            members = self._buckets.get(bucket)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._buckets[bucket]
+
+    def clear(self) -> None:
+        """Очищает индекс"""
+        self._signatures.clear()
+        self._sequence.clear()
+        self._buckets.clear()
+
+    def find(self, data: Dict[str, Any]) -> Optional[Tuple[K, float]]:
+        """
+        Ищет в индексе самую похожую на запись вакансию
+
+        Args:
+            data: Запись вакансии (в индекс не добавляется)
+
+        Returns:
+            Пара (ключ, оценка сходства) или None, если нет записи
+            со сходством не ниже порога; при равном сходстве — запись,
+            добавленная раньше
+        """
+        signature = self.signature(data)
+        if signature is None:
+            return None
+        candidates: Set[K] = set()
+        for bucket in self._band_keys(signature):
+            candidates.update(self._buckets.get(bucket, ()))
+
+        best: Optional[Tuple[float, int, K]] = None
+        for key in candidates:
+            score = self.similarity(signature, self._signatures[key])
+            if score < self.threshold:
+                continue
+            rank = (score, -self._sequence[key], key)
+            if best is None or rank[:2] > best[:2]:
+                best = rank
+        return None if best is None else (best[2], best[0])
+
+    def clusters(self) -> List[List[K]]:
+        """
+        Группы почти одинаковых записей
+
+        Пары из общих корзин с оценкой сходства не ниже порога
+        объединяются транзитивно. Пары, уже попавшие в одну группу,
+        повторно не проверяются.
+
+        Returns:
+            Группы из двух и более ключей; ключи внутри группы и группы —
+            в порядке добавления записей
+        """
+        groups = _UnionFind()
+        signatures = self._signatures
+        for members in self._buckets.values():
+            if len(members) < 2:
+                continue
+            # Представители корзины — записи, не похожие друг на друга;
+            # каждая запись сравнивается только с ними
+            representatives: List[K] = []
+            for key in members:
+                for representative in representatives:
+                    if groups.find(key) == groups.find(representative):
+                        break
+                    score = self.similarity(
+                        signatures[key], signatures[representative]
+                    )
+                    if score >= self.threshold:
+                        groups.union(representative, key)
+                        break
+                else:
+                    representatives.append(key)
+
+        clusters: Dict[Any, List[K]] = {}
+        for key in signatures:
+            if key in groups.parent:
+                clusters.setdefault(groups.find(key), []).append(key)
+        return [cluster for cluster in clusters.values() if len(cluster) > 1]
+
+
+def find_near_duplicates(
+    records: Iterable[Tuple[K, Dict[str, Any]]],
+    threshold: float = DEFAULT_THRESHOLD,
+    **params: int,
+) -> List[List[K]]:
+    """
+    Пакетный поиск групп почти одинаковых вакансий
+
+    Args:
+        records: Пары (ключ, запись вакансии)
+        threshold: Порог сходства по Жаккару
+        **params: Параметры NearDuplicateIndex (num_perm, bands, ...)
+
+    Returns:
+        Группы ключей, как в NearDuplicateIndex.clusters
+    """
+    index: NearDuplicateIndex[K] = NearDuplicateIndex(threshold, **params)
+    for key, data in records:
+        index.add(key, data)
+    return index.clusters()
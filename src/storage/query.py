@@ -0,0 +1,121 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Optional, Tuple
+from .filters import match_record, record_avg_salary
+
+# Поля, по которым можно упорядочить выдачу; "-" перед именем — по убыванию
+ORDER_FIELDS = ("salary_from", "salary_to", "avg", "title", "company")
+
+# Критерии фильтрации (передаются в match_record)
+_FILTER_FIELDS = (
+    "keyword",
+    "keywords",
+    "salary_min",
+    "salary_max",
+    "avg_min",
+    "avg_max",
+    "company",
+)
+
+
+@dataclass(frozen=True)
+class VacancyQuery:
+    """
+    Запрос к хранилищу: фильтры, порядок и окно выдачи
+
+    Хранилища получают запрос целиком и сами выбирают план выполнения:
+    с какого индекса начать перебор и когда остановиться.
+
+    Attributes:
+        keyword: Ключевое слово в описании, требованиях или названии
+        keywords: Несколько ключевых слов, должны встретиться все
+        salary_min: Минимальная зарплата (по salary_from)
+        salary_max: Максимальная зарплата (по salary_to)
+        avg_min: Минимальная средняя зарплата
+        avg_max: Максимальная средняя зарплата
+        company: Подстрока названия компании
+        order_by: Поле сортировки из ORDER_FIELDS, "-" — по убыванию
+        limit: Максимальное количество результатов (None — без ограничения)
+        offset: Сколько подходящих результатов пропустить
+    """
+
+    keyword: Optional[str] = None
+    keywords: Tuple[str, ...] = field(default_factory=tuple)
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    avg_min: Optional[float] = None
+    avg_max: Optional[float] = None
+    company: Optional[str] = None
+    order_by: Optional[str] = None
+    limit: Optional[int] = None
+    offset: int = 0
+
+    def __post_init__(self) -> None:
+        # Список ключевых слов храним кортежем, чтобы запрос был хэшируемым
+        object.__setattr__(self, "keywords", tuple(self.keywords or ()))
+        if self.order_by and self.order_by.lstrip("-") not in ORDER_FIELDS:
+            raise ValueError(
+                f"Неизвестное поле сортировки: {self.order_by}. "
+                f"Допустимые значения: {', '.join(ORDER_FIELDS)}"
+            )
+        if self.limit is not None and self.limit < 0:
+            raise ValueError("limit не может быть отрицательным")
+        if self.offset < 0:
+            raise ValueError("offset не может быть отрицательным")
+
+    @classmethod
+    def from_kwargs(cls, **kwargs: Any) -> "VacancyQuery":
+        """
+        Создает запрос из именованных критериев get_vacancies
+
+        Неизвестные критерии игнорируются, как и раньше в get_vacancies.
+        """
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in kwargs.items() if k in known})
+
+    def filters(self) -> Dict[str, Any]:
+        """Заданные критерии фильтрации"""
+        result = {}
+        for name in _FILTER_FIELDS:
+            value = getattr(self, name)
+            if value is not None and value != ():
+                result[name] = value
+        return result
+
+    def matches(self, data: Dict[str, Any]) -> bool:
+        """Проверяет запись на соответствие всем фильтрам"""
+        return match_record(data, **self.filters())
+
+    @property
+    def all_keywords(self) -> Tuple[str, ...]:
+        """Все ключевые слова запроса (keyword и keywords)"""
+        if self.keyword:
+            return self.keywords + (self.keyword,)
+        return self.keywords
+
+    @property
+    def order_field(self) -> Optional[str]:
+        """Поле сортировки без префикса направления"""
+        return self.order_by.lstrip("-") if self.order_by else None
+
+    @property
+    def descending(self) -> bool:
+        """Сортировка по убыванию"""
+        return bool(self.order_by and self.order_by.startswith("-"))
+
+    @property
+    def stop(self) -> Optional[int]:
+        """Граница окна выдачи для itertools.islice"""
+        return None if self.limit is None else self.offset + self.limit
+
+    def order_value(self, data: Dict[str, Any]) -> Any:
+        """
+        Ключ сортировки записи
+
+        Вакансии без зарплаты считаются нулевыми, как в sort_vacancies.
+        """
+        order_field = self.order_field
+        if order_field == "avg":
+            return record_avg_salary(data)
+        if order_field in ("salary_from", "salary_to"):
+            return data.get(order_field) or 0
+        return (data.get(order_field) or "").lower()
@@ -0,0 +1,172 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from .filters import record_avg_salary
+
+_NEG_INF = float("-inf")
+_POS_INF = float("inf")
+
+
+class SortedSalaryIndex:
+    """
+    Отсортированный индекс одного зарплатного поля
+
+    Хранит пары (значение, идентификатор записи) в порядке возрастания.
+    Вставка и удаление выполняются через bisect без полной пересортировки,
+    диапазонные запросы — двумя бинарными поисками.
+    Записи без зарплаты (None или 0) в индекс не попадают.
+    """
+
+    def __init__(self, value_getter: Callable[[Dict[str, Any]], Any]):
+        self._value_getter = value_getter
+        self._entries: List[Tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _value(self, data: Dict[str, Any]) -> Optional[float]:
+        value = self._value_getter(data)
+        return value if value else None
+
+    def indexes(self, data: Dict[str, Any]) -> bool:
+        """Попадает ли запись в индекс (указана ли зарплата)"""
+        return self._value(data) is not None
+
+    def add(self, doc_id: int, data: Dict[str, Any]) -> None:
+        """Добавляет запись в индекс"""
+        value = self._value(data)
+        if value is not None:
+            insort(self._entries, (value, doc_id))
+
+    def remove(self, doc_id: int, data: Dict[str, Any]) -> None:
+        """Удаляет запись из индекса"""
+        value = self._value(data)
+        if value is None:
+            return
+        position = bisect_left(self._entries, (value, doc_id))
+        if (
+            position < len(self._entries)
+            and self._entries[position] == (value, doc_id)
+        ):
+            del self._entries[position]
+
+    def clear(self) -> None:
+        """Очищает индекс"""
+        self._entries.clear()
+
+    def rebuild(self, records: Dict[int, Dict[str, Any]]) -> None:
+        """Строит индекс заново одной сортировкой (при загрузке)"""
+        entries = []
+        for doc_id, data in records.items():
+            value = self._value(data)
+            if value is not None:
+                entries.append((value, doc_id))
+        entries.sort()
+        self._entries = entries
+
+    def _bounds(
+        self, low: Optional[float], high: Optional[float]
+    ) -> Tuple[int, int]:
+        """Границы среза для диапазона [low, high]"""
+        start = (
+            0 if low is None else bisect_left(self._entries, (low, _NEG_INF))
+        )
+        end = (
+            len(self._entries)
+            if high is None
+            else bisect_right(self._entries, (high, _POS_INF))
+        )
+        return start, max(start, end)
+
+    def count_range(
+        self, low: Optional[float] = None, high: Optional[float] = None
+    ) -> int:
+        """Количество записей в диапазоне без их перебора"""
+        start, end = self._bounds(low, high)
+        return end - start
+
+    def range(
+        self, low: Optional[float] = None, high: Optional[float] = None
+    ) -> Iterator[int]:
+        """
+        Идентификаторы записей со значением в диапазоне [low, high]
+
+        Args:
+            low: Нижняя граница (включительно), None — без ограничения
+            high: Верхняя граница (включительно), None — без ограничения
+
+        Yields:
+            Идентификаторы в порядке возрастания значения
+        """
+        start, end = self._bounds(low, high)
+        for position in range(start, end):
+            yield self._entries[position][1]
+
+    def descending(self) -> Iterator[int]:
+        """
+        Идентификаторы в порядке убывания значения
+
+        При равных значениях записи идут в порядке добавления, как при
+        устойчивой сортировке sorted(..., reverse=True).
+
+        Yields:
+            Идентификаторы записей
+        """
+        end = len(self._entries)
+        while end > 0:
+            value = self._entries[end - 1][0]
+            start = bisect_left(self._entries, (value, _NEG_INF), 0, end)
+            for position in range(start, end):
+                yield self._entries[position][1]
+            end = start
+
+    def top(self, n: int) -> List[int]:
+        """Идентификаторы n записей с наибольшим значением"""
+        result = []
+        if n <= 0:
+            return result
+        for doc_id in self.descending():
+            result.append(doc_id)
+            if len(result) >= n:
+                break
+        return result
+
+
+class SalaryIndexes:
+    """Набор отсортированных индексов по salary_from, salary_to и средней"""
+
+    FIELDS = ("salary_from", "salary_to", "avg")
+
+    def __init__(self) -> None:
+        self._indexes: Dict[str, SortedSalaryIndex] = {
+            "salary_from": SortedSalaryIndex(lambda d: d.get("salary_from")),
+            "salary_to": SortedSalaryIndex(lambda d: d.get("salary_to")),
+            "avg": SortedSalaryIndex(record_avg_salary),
+        }
+
+    def __getitem__(self, field: str) -> SortedSalaryIndex:
+        if field not in self._indexes:
+            raise ValueError(
+                f"Неизвестное поле зарплаты: {field}. "
+                f"Допустимые значения: {', '.join(self.FIELDS)}"
+            )
+        return self._indexes[field]
+
+    def add(self, doc_id: int, data: Dict[str, Any]) -> None:
+        """Добавляет запись во все индексы"""
+        for index in self._indexes.values():
+            index.add(doc_id, data)
+
+    def remove(self, doc_id: int, data: Dict[str, Any]) -> None:
+        """Удаляет запись из всех индексов"""
+        for index in self._indexes.values():
+            index.remove(doc_id, data)
+
+    def clear(self) -> None:
+        """Очищает все индексы"""
+        for index in self._indexes.values():
+            index.clear()
+
+    def rebuild(self, records: Dict[int, Dict[str, Any]]) -> None:
+        """Строит все индексы заново по записям"""
+        for index in self._indexes.values():
+            index.rebuild(records)
@@ -0,0 +1,239 @@
+import heapq
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import replace
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from ..models.vacancy import Vacancy
+from .abstract_storage import AbstractStorage, UpsertResult
+from .identity import key_hash, key_url
+from .json_storage import JSONStorage
+from .query import VacancyQuery
+
+# Описание раскладки хранилища (число шардов) и число шардов по умолчанию
+_MANIFEST_NAME = "shards.json"
+DEFAULT_SHARDS = 4
+
+# Хранилища шардов в процессах пула: открываются один раз на процесс,
+# дальше JSONStorage сам перечитывает файл, если его изменили
+_worker_storages: Dict[str, JSONStorage] = {}
+
+
+def _scan_shard(filename: str, query: VacancyQuery) -> List[Dict[str, Any]]:
+    """
+    Выполняет частичный запрос к одному шарду (в процессе пула)
+
+    Returns:
+        Подходящие записи в порядке запроса, не больше query.limit
+    """
+    storage = _worker_storages.get(filename)
+    if storage is None:
+        # Кэш результатов не нужен: запросы к шарду не повторяются
+        storage = JSONStorage(filename, cache_size=0)
+        _worker_storages[filename] = storage
+    return [vacancy.to_dict() for vacancy in storage.query(query)]
+
+
+class ShardedJSONStorage(AbstractStorage):
+    """
+    Хранилище из нескольких JSON-файлов (шардов) с параллельным поиском
+
+    Вакансия попадает в шард по хэшу URL — идентичности, по которой
+    работает upsert_vacancies, поэтому обновление вакансии всегда идет
+    в тот же шард. Запись затрагивает только свой шард.
+
+    Запрос рассылается по шардам в пул процессов: каждый процесс
+    фильтрует свой шард и возвращает не больше offset + limit записей
+    в нужном порядке, а родитель сливает частичные результаты и
+    применяет окно выдачи. Так полнотекстовый перебор масштабируется
+    по ядрам. При workers=0 шарды перебираются в текущем процессе.
+
+    Число шардов фиксируется в файле shards.json при создании.
+    """
+
+    def __init__(
+        self,
+        directory: str = "data/shards",
+        shards: Optional[int] = None,
+        storage_format: Optional[str] = None,
+        workers: Optional[int] = None,
+    ):
+        if shards is not None and shards <= 0:
+            raise ValueError("Число шардов должно быть положительным")
+        if workers is not None and workers < 0:
+            raise ValueError("workers не может быть отрицательным")
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._shard_count = self._load_manifest(shards)
+        self._storage_format = storage_format
+        self._filenames = [
+            os.path.join(directory, f"shard-{number:03d}.json")
+            for number in range(self._shard_count)
+        ]
+        self._workers = (
+            min(self._shard_count, os.cpu_count() or 1)
+            if workers is None
+            else workers
+        )
+        # Хранилища шардов в этом процессе создаются при первом обращении
+        self._shards: Dict[int, JSONStorage] = {}
+        self._executor: Optional[Executor] = None
+
+    def _load_manifest(self, shards: Optional[int]) -> int:
+        """Читает число шардов из shards.json или создает его"""
+        manifest = os.path.join(self._directory, _MANIFEST_NAME)
+        if os.path.exists(manifest):
+            with open(manifest, "r", encoding="utf-8") as f:
+                stored = json.load(f)["shards"]
+            if shards is not None and shards != stored:
+                raise ValueError(
+                    f"Хранилище {self._directory} разбито на {stored} шардов, "
+                    f"а не на {shards}"
+                )
+            return stored
+
+        count = shards or DEFAULT_SHARDS
+        with open(manifest, "w", encoding="utf-8") as f:
+            json.dump({"shards": count}, f)
+        return count
+
+    @property
+    def shard_count(self) -> int:
+        return self._shard_count
+
+    def shard_of(self, vacancy: Vacancy) -> int:
+        """Номер шарда вакансии"""
+        return key_hash(vacancy.url) % self._shard_count
+
+    def _shard(self, number: int) -> JSONStorage:
+        """Хранилище шарда в текущем процессе"""
+        storage = self._shards.get(number)
+        if storage is None:
+            storage = JSONStorage(
+                self._filenames[number], self._storage_format
+            )
+            self._shards[number] = storage
+        return storage
+
+    def _group(self, vacancies: Iterable[Vacancy]) -> Dict[int, List[Vacancy]]:
+        """Раскладывает вакансии по шардам"""
+        groups: Dict[int, List[Vacancy]] = {}
+        for vacancy in vacancies:
+            groups.setdefault(self.shard_of(vacancy), []).append(vacancy)
+        return groups
+
+    # ----- Запись -----
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """Добавляет вакансию в ее шард"""
+        self._shard(self.shard_of(vacancy)).add_vacancy(vacancy)
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """Добавляет вакансии, сохраняя каждый шард один раз"""
+        for number, group in self._group(vacancies).items():
+            self._shard(number).add_vacancies(group)
+
+    def upsert_vacancies(self, vacancies: Iterable[Vacancy]) -> UpsertResult:
+        """Добавляет и обновляет вакансии пошардово"""
+        totals = [0] * len(UpsertResult._fields)
+        for number, group in self._group(vacancies).items():
+            result = self._shard(number).upsert_vacancies(group)
+            totals = [total + count for total, count in zip(totals, result)]
+        return UpsertResult(*totals)
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """Удаляет вакансию из ее шарда"""
+        self._shard(self.shard_of(vacancy)).delete_vacancy(vacancy)
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """Удаляет вакансии, сохраняя каждый шард один раз"""
+        for number, group in self._group(vacancies).items():
+            self._shard(number).delete_vacancies(group)
+
+    def clear(self) -> None:
+        """Очищает все шарды"""
+        for number in range(self._shard_count):
+            self._shard(number).clear()
+
+    # ----- Чтение -----
+
+    def get_vacancies(self, **kwargs) -> List[Vacancy]:
+        """
+        Получает вакансии по критериям (см. JSONStorage.get_vacancies)
+
+        Returns:
+            Список вакансий
+        """
+        return list(self.query(VacancyQuery.from_kwargs(**kwargs)))
+
+    def get_by_keys(self, keys: Iterable[str]) -> List[Optional[Vacancy]]:
+        """
+        Получает вакансии по ключам записей из их шардов
+
+        Returns:
+            Вакансии в порядке ключей; None для отсутствующих
+        """
+        keys = list(keys)
+        groups: Dict[int, List[Tuple[int, str]]] = {}
+        for position, key in enumerate(keys):
+            number = key_hash(key_url(key)) % self._shard_count
+            groups.setdefault(number, []).append((position, key))
+
+        result: List[Optional[Vacancy]] = [None] * len(keys)
+        for number, group in groups.items():
+            found = self._shard(number).get_by_keys(key for _, key in group)
+            for (position, _), vacancy in zip(group, found):
+                result[position] = vacancy
+        return result
+
+    def query(self, query: VacancyQuery) -> Iterator[Vacancy]:
+        """
+        Выполняет запрос параллельно по всем шардам
+
+        Без сортировки результаты идут по шардам по порядку, внутри
+        шарда — в порядке добавления.
+
+        Args:
+            query: Запрос
+
+        Returns:
+            Итератор по вакансиям в требуемом порядке
+        """
+        # Каждому шарду нужно не больше offset + limit записей
+        partial = replace(query, offset=0, limit=query.stop)
+        partials = self._scan(partial)
+
+        if query.order_field is None:
+            merged: Iterable[Dict[str, Any]] = (
+                data for rows in partials for data in rows
+            )
+        else:
+            merged = heapq.merge(
+                *partials, key=query.order_value, reverse=query.descending
+            )
+        return map(Vacancy.from_dict, islice(merged, query.offset, query.stop))
+
+    def _scan(self, query: VacancyQuery) -> List[List[Dict[str, Any]]]:
+        """Частичные результаты запроса по каждому шарду"""
+        if self._workers == 0 or self._shard_count == 1:
+            return [
+                [
+                    vacancy.to_dict()
+                    for vacancy in self._shard(number).query(query)
+                ]
+                for number in range(self._shard_count)
+            ]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        futures = [
+            self._executor.submit(_scan_shard, filename, query)
+            for filename in self._filenames
+        ]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Останавливает пул процессов"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -1,43 +1,145 @@
-from typing import List
+from typing import Callable, List, Optional, Tuple
 from ..models.vacancy import Vacancy
+from .matcher import KeywordMatcher
+from .metrics import METRICS
+from .render import write_vacancies
 
+# Условие отбора вакансии
+Predicate = Callable[[Vacancy], bool]
 
+
+def keyword_predicate(
+    filter_words: Optional[List[str]],
+    any_words: Optional[List[str]] = None,
+    exclude_words: Optional[List[str]] = None,
+) -> Optional[Predicate]:
+    """
+    Условие по ключевым словам в текстовых полях вакансии
+
+    Args:
+        filter_words: Слова, которые должны встретиться все
+        any_words: Слова, из которых должно встретиться хотя бы одно
+        exclude_words: Слова, которых не должно быть
+
+    Returns:
+        Условие или None, если непустых ключевых слов нет
+    """
+    # Пустые строки и пробелы в ключевых словах отбрасываются
+    matcher = KeywordMatcher(filter_words, any_words, exclude_words)
+    if matcher.is_empty:
+        return None
+    return matcher
+
+
+def salary_predicate(salary_range: str) -> Optional[Predicate]:
+    """
+    Условие «средняя зарплата в диапазоне» (см. get_vacancies_by_salary)
+
+    Args:
+        salary_range: Диапазон зарплат в формате "100000-150000" или "100000"
+
+    Returns:
+        Условие или None для пустой строки; для строки неверного
+        формата — условие, которому не подходит ни одна вакансия
+    """
+    if not salary_range or salary_range.isspace():
+        return None
+
+    try:
+        min_salary, max_salary = parse_salary_range(salary_range)
+    except ValueError:
+        # Ошибка преобразования в число или неверный формат
+        return lambda vacancy: False
+
+    def in_range(vacancy: Vacancy) -> bool:
+        avg_salary = vacancy.avg_salary
+        # Проверяем, что вакансия имеет зарплату и она попадает в диапазон
+        return avg_salary > 0 and min_salary <= avg_salary <= max_salary
+
+    return in_range
+
+
+def salary_sort_key(vacancy: Vacancy) -> float:
+    """
+    Ключ сортировки по убыванию зарплаты
+
+    Вакансии без зарплаты (0) оказываются после всех вакансий
+    с зарплатой, а устойчивая сортировка сохраняет их исходный порядок.
+    """
+    return -vacancy.avg_salary
+
+
+@METRICS.timed("filter_keywords_seconds")
 def filter_vacancies(
-    vacancies: List[Vacancy], filter_words: List[str]
+    vacancies: List[Vacancy],
+    filter_words: List[str],
+    *,
+    any_words: Optional[List[str]] = None,
+    exclude_words: Optional[List[str]] = None,
 ) -> List[Vacancy]:
     """
     Фильтрует вакансии по ключевым словам
 
+    Слова ищутся без учета регистра в названии, описании, требованиях
+    и названии компании.
+
     Args:
         vacancies: Список вакансий
-        filter_words: Список ключевых слов
+        filter_words: Список ключевых слов (должны встретиться все)
+        any_words: Должно встретиться хотя бы одно из этих слов
+        exclude_words: Ни одно из этих слов не должно встретиться
 
     Returns:
         Отфильтрованный список вакансий
     """
-    if not filter_words:
+    if not filter_words and not any_words and not exclude_words:
         return vacancies
 
-    # Очищаем ключевые слова от пустых строк и пробелов
-    clean_words = [word.strip().lower() for word in filter_words if word.strip()]
-    if not clean_words:
+    matches = keyword_predicate(filter_words, any_words, exclude_words)
+    if matches is None:
         return vacancies
 
-    filtered = []
-    for vacancy in vacancies:
-        # Объединяем все текстовые поля для поиска
-        vacancy_text = (
-            f"{vacancy.title} {vacancy.description} "
-            f"{vacancy.requirements} {vacancy.company}"
-        ).lower()
+    return [vacancy for vacancy in vacancies if matches(vacancy)]
 
-        # Проверяем, содержатся ли все ключевые слова
-        if all(word in vacancy_text for word in clean_words):
-            filtered.append(vacancy)
 
-    return filtered
+def parse_salary_range(salary_range: str) -> Tuple[int, float]:
+    """
+    Разбирает строку диапазона зарплат
 
+    Args:
+        salary_range: Диапазон в формате "100000-150000" или "100000"
 
+    Returns:
+        Кортеж (минимум, максимум); для одного числа максимум — inf
+
+    Raises:
+        ValueError: если строка не соответствует формату
+    """
+    # Удаляем лишние пробелы
+    salary_range = salary_range.strip()
+
+    if "-" in salary_range:
+        # Разделяем на части
+        parts = [part.strip() for part in salary_range.split("-")]
+
+        # Должно быть ровно 2 непустые части
+        if len(parts) != 2 or not parts[0] or not parts[1]:
+            raise ValueError(f"Неверный формат диапазона: {salary_range}")
+
+        min_salary = int(parts[0])
+        max_salary = int(parts[1])
+
+        # Если min > max, меняем местами
+        if min_salary > max_salary:
+            min_salary, max_salary = max_salary, min_salary
+
+        return min_salary, max_salary
+
+    # Одно число
+    return int(salary_range), float("inf")
+
+
+@METRICS.timed("filter_salary_seconds")
 def get_vacancies_by_salary(
     vacancies: List[Vacancy], salary_range: str
 ) -> List[Vacancy]:
@@ -57,49 +159,15 @@ def get_vacancies_by_salary(
     - Два числа через дефис: диапазон зарплат
     - Любой другой формат: пустой список
     """
+    in_range = salary_predicate(salary_range)
     # Если строка пустая или состоит только из пробелов, возвращаем все вакансии
-    if not salary_range or salary_range.isspace():
+    if in_range is None:
         return vacancies
 
-    # Удаляем лишние пробелы
-    salary_range = salary_range.strip()
-
-    try:
-        if "-" in salary_range:
-            # Разделяем на части
-            parts = [part.strip() for part in salary_range.split("-")]
-
-            # Должно быть ровно 2 непустые части
-            if len(parts) != 2 or not parts[0] or not parts[1]:
-                return []
-
-            min_salary = int(parts[0])
-            max_salary = int(parts[1])
-
-            # Если min > max, меняем местами
-            if min_salary > max_salary:
-                min_salary, max_salary = max_salary, min_salary
-
-        else:
-            # Одно число
-            min_salary = int(salary_range)
-            max_salary = float("inf")
-
-    except ValueError:
-        # Ошибка преобразования в число
-        return []
-
-    # Фильтрация вакансий
-    filtered = []
-    for vacancy in vacancies:
-        avg_salary = vacancy.avg_salary
-        # Проверяем, что вакансия имеет зарплату и она попадает в диапазон
-        if avg_salary > 0 and min_salary <= avg_salary <= max_salary:
-            filtered.append(vacancy)
-
-    return filtered
+    return [vacancy for vacancy in vacancies if in_range(vacancy)]
 
 
+@METRICS.timed("sort_seconds")
 def sort_vacancies(vacancies: List[Vacancy]) -> List[Vacancy]:
     """
     Сортирует вакансии по убыванию зарплаты
@@ -110,17 +178,9 @@ def sort_vacancies(vacancies: List[Vacancy]) -> List[Vacancy]:
     Returns:
         Отсортированный список вакансий
     """
-    # Сначала фильтруем вакансии без зарплаты
-    vacancies_with_salary = [v for v in vacancies if v.avg_salary > 0]
-    vacancies_without_salary = [v for v in vacancies if v.avg_salary == 0]
-
-    # Сортируем вакансии с зарплатой
-    sorted_with_salary = sorted(
-        vacancies_with_salary, key=lambda v: v.avg_salary, reverse=True
-    )
-
-    # Возвращаем отсортированные вакансии с зарплатой, затем без зарплаты
-    return sorted_with_salary + vacancies_without_salary
+    # Один проход устойчивой сортировки: вакансии с зарплатой по убыванию,
+    # затем без зарплаты в исходном порядке
+    return sorted(vacancies, key=salary_sort_key)
 
 
 def get_top_vacancies(vacancies: List[Vacancy], top_n: int) -> List[Vacancy]:
@@ -140,20 +200,15 @@ def get_top_vacancies(vacancies: List[Vacancy], top_n: int) -> List[Vacancy]:
     return vacancies[: min(top_n, len(vacancies))]
 
 
-def print_vacancies(vacancies: List[Vacancy]) -> None:
+def print_vacancies(vacancies: List[Vacancy], compact: bool = False) -> None:
     """
     Выводит вакансии в читаемом формате
 
+    Весь текст форматируется заранее и выводится одной записью в
+    sys.stdout, а не отдельным print на каждую строку.
+
     Args:
         vacancies: Список вакансий для вывода
+        compact: Компактная таблица вместо подробных блоков
     """
-    if not vacancies:
-        print("Вакансии не найдены")
-        return
-
-    for i, vacancy in enumerate(vacancies, 1):
-        print(f"\n{'='*60}")
-        print(f"Вакансия #{i}")
-        print(f"{'='*60}")
-        print(vacancy)
-        print()
+    write_vacancies(vacancies, compact=compact)
@@ -0,0 +1,132 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional
+from ..models.vacancy import Vacancy
+
+# С этого числа слов один проход регулярного выражения быстрее отдельных
+# проверок `in` (каждая из которых проходит текст заново)
+_REGEX_MIN_WORDS = 8
+
+
+def _clean(words: Optional[Iterable[str]]) -> List[str]:
+    """Непустые ключевые слова в нижнем регистре без повторов"""
+    result: List[str] = []
+    for word in words or ():
+        word = word.strip().lower()
+        if word and word not in result:
+            result.append(word)
+    return result
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Регулярное выражение «любое из слов» в виде префиксного дерева
+
+    Слова с общим префиксом делят одну ветку: "java|javascript|jq"
+    превращается в "j(?:ava(?:script)?|q)". Движку не приходится
+    перебирать все альтернативы в каждой позиции текста, поэтому
+    время поиска почти не растет с числом слов.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = []
+        single_chars = []
+        for char in sorted(key for key in node if key):
+            rest = build(node[char])
+            if rest:
+                branches.append(re.escape(char) + rest)
+            else:
+                single_chars.append(re.escape(char))
+        if single_chars:
+            branches.append(
+                single_chars[0]
+                if len(single_chars) == 1
+                else "[" + "".join(single_chars) + "]"
+            )
+        if not branches:
+            return ""
+        if len(branches) == 1:
+            pattern = branches[0]
+        else:
+            pattern = f"(?:{'|'.join(branches)})"
+        # Слово может закончиться в этом узле: продолжение необязательно
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    return build(trie)
+
+
+class _AnyWord:
+    """Проверка «в тексте есть хотя бы одно из слов»"""
+
+    def __init__(self, words: List[str]):
+        self._words = words
+        self._search = (
+            re.compile(_trie_pattern(words)).search
+            if len(words) >= _REGEX_MIN_WORDS
+            else None
+        )
+
+    def __call__(self, text: str) -> bool:
+        if self._search is not None:
+            return self._search(text) is not None
+        return any(word in text for word in self._words)
+
+
+class KeywordMatcher:
+    """
+    Проверка текста на набор ключевых слов
+
+    Условие: в тексте есть все слова all_words, хотя бы одно из
+    any_words (если они заданы) и ни одного из exclude_words. Слова
+    ищутся как подстроки без учета регистра, как в filter_vacancies.
+
+    Матчер компилируется один раз на запрос. Большие списки any_words
+    и exclude_words собираются в регулярное выражение-префиксное дерево
+    и проверяются одним проходом по тексту. Для all_words отдельные
+    проверки `in` выгоднее: проверка прекращается на первом
+    отсутствующем слове, поэтому более длинные (обычно более редкие)
+    слова проверяются первыми.
+    """
+
+    def __init__(
+        self,
+        all_words: Optional[Iterable[str]] = None,
+        any_words: Optional[Iterable[str]] = None,
+        exclude_words: Optional[Iterable[str]] = None,
+    ):
+        self._all = sorted(_clean(all_words), key=len, reverse=True)
+        any_list = _clean(any_words)
+        exclude_list = _clean(exclude_words)
+        self._any = _AnyWord(any_list) if any_list else None
+        self._exclude = _AnyWord(exclude_list) if exclude_list else None
+
+    @property
+    def is_empty(self) -> bool:
+        """Условие не задано: подходит любой текст"""
+        return not self._all and self._any is None and self._exclude is None
+
+    def matches(self, text: str) -> bool:
+        """
+        Проверяет текст в нижнем регистре
+
+        Args:
+            text: Текст (например, Vacancy.search_text)
+
+        Returns:
+            True, если текст удовлетворяет условию
+        """
+        for word in self._all:
+            if word not in text:
+                return False
+        if self._any is not None and not self._any(text):
+            return False
+        return self._exclude is None or not self._exclude(text)
+
+    def __call__(self, vacancy: Vacancy) -> bool:
+        """Проверяет вакансию по ее тексту для поиска"""
+        return self.matches(vacancy.search_text)
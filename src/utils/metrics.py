@@ -0,0 +1,321 @@
+"""
+Метрики этапов обработки: счетчики, таймеры и гистограммы
+
+Горячие участки кода (запрос к API, разбор JSON, преобразование в
+Vacancy, запись в хранилище, фильтрация) замеряются через общий реестр
+METRICS. По умолчанию он выключен: таймер возвращает общий пустой
+контекст, счетчик сразу выходит — цена замера сводится к проверке
+флага. Включение и выгрузка:
+
+    METRICS.enable()
+    ...
+    METRICS.export("metrics.prom")   # текстовый формат Prometheus
+    METRICS.export("metrics.json")   # JSON
+    METRICS.export("-")              # сводная таблица в stderr
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Границы интервалов гистограмм по умолчанию, секунд
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """
+    Распределение значений по интервалам
+
+    counts[i] — число значений не больше buckets[i] и больше предыдущей
+    границы; последний элемент counts — значения больше всех границ.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value: float) -> None:
+        """Учитывает значение"""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Оценка квантиля по интервалам
+
+        Внутри интервала значения считаются распределенными равномерно
+        (как histogram_quantile в Prometheus); результат ограничен
+        наблюдавшимися минимумом и максимумом.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                low = self.buckets[index - 1] if index else self.min
+                high = (
+                    self.buckets[index]
+                    if index < len(self.buckets)
+                    else self.max
+                )
+                value = low + (high - low) * (rank - seen) / count
+                return min(max(value, self.min), self.max)
+            seen += count
+        return self.max
+
+
+class _Timer:
+    """Замер длительности блока with в гистограмму"""
+
+    __slots__ = ("_registry", "_name", "_started")
+
+    def __init__(self, registry: "MetricsRegistry", name: str):
+        self._registry = registry
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._registry.observe(self._name, time.perf_counter() - self._started)
+
+
+class _NullTimer:
+    """Таймер выключенного реестра: ничего не замеряет"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик
+
+    Счетчики (inc) только растут; гистограммы (observe, timer, timed)
+    хранят распределение значений — для таймеров в секундах. Имена
+    метрик задаются в стиле Prometheus: счетчики с суффиксом _total,
+    длительности — _seconds. Обновления потокобезопасны.
+    """
+
+    def __init__(
+        self, enabled: bool = False, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.enabled = enabled
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._histograms: Dict[str, Histogram] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Удаляет накопленные значения"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    # ----- Запись -----
+
+    def inc(self, name: str, value: float = 1) -> None:
+        """Увеличивает счетчик"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """Добавляет значение в гистограмму"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(self._buckets)
+            histogram.observe(value)
+
+    def timer(self, name: str) -> Any:
+        """
+        Контекст замера длительности блока:
+
+            with METRICS.timer("storage_commit_seconds"):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        """Декоратор: замеряет длительность каждого вызова функции"""
+
+        def decorator(func: F) -> F:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - started)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    # ----- Чтение -----
+
+    def counter(self, name: str) -> float:
+        """Значение счетчика (0, если он не увеличивался)"""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def histogram(self, name: str) -> Optional[Histogram]:
+        """Гистограмма по имени или None"""
+        with self._lock:
+            return self._histograms.get(name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Счетчики и сводки гистограмм (для JSON)"""
+        with self._lock:
+            counters = dict(sorted(self._counters.items()))
+            histograms = sorted(self._histograms.items())
+            return {
+                "counters": counters,
+                "histograms": {
+                    name: {
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "mean": histogram.mean,
+                        "p50": histogram.quantile(0.5),
+                        "p95": histogram.quantile(0.95),
+                        "max": histogram.max,
+                        "buckets": dict(
+                            zip(
+                                [*map(str, histogram.buckets), "+Inf"],
+                                histogram.counts,
+                            )
+                        ),
+                    }
+                    for name, histogram in histograms
+                },
+            }
+
+    def to_prometheus(self, prefix: str = "hh_") -> str:
+        """Текстовый формат Prometheus (например, для textfile collector)"""
+        lines: List[str] = []
+        with self._lock:
+            for name, value in sorted(self._counters.items()):
+                lines.append(f"# TYPE {prefix}{name} counter")
+                lines.append(f"{prefix}{name} {value:g}")
+            for name, histogram in sorted(self._histograms.items()):
+                full_name = prefix + name
+                lines.append(f"# TYPE {full_name} histogram")
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(
+                        f'{full_name}_bucket{{le="{bound:g}"}} {cumulative}'
+                    )
+                lines.append(
+                    f'{full_name}_bucket{{le="+Inf"}} {histogram.count}'
+                )
+                lines.append(f"{full_name}_sum {histogram.sum:.6f}")
+                lines.append(f"{full_name}_count {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def summary_table(self) -> str:
+        """Сводная таблица за запуск: длительности в мс и счетчики"""
+        data = self.to_dict()
+        lines = [
+            f"{'метрика':<32} {'вызовов':>8} {'всего, мс':>10} {'сред.':>8} "
+            f"{'p95':>8} {'макс.':>8}"
+        ]
+        for name, row in data["histograms"].items():
+            lines.append(
+                f"{name:<32} {row['count']:>8} {row['sum'] * 1000:>10.1f} "
+                f"{row['mean'] * 1000:>8.2f} {row['p95'] * 1000:>8.2f} "
+                f"{row['max'] * 1000:>8.2f}"
+            )
+        for name, value in data["counters"].items():
+            lines.append(f"{name:<32} {value:>8g}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, target: str) -> None:
+        """
+        Выгружает метрики
+
+        Args:
+            target: "-" — сводная таблица в stderr; файл *.json — JSON;
+                другой файл — текстовый формат Prometheus. Файл
+                заменяется атомарно (через временный файл).
+        """
+        if target == "-":
+            sys.stderr.write(self.summary_table())
+            return
+        if target.endswith(".json"):
+            text = json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+            text += "\n"
+        else:
+            text = self.to_prometheus()
+        directory = os.path.dirname(target)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_filename = f"{target}.{os.getpid()}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_filename, target)
+
+
+# Общий реестр приложения (выключен, пока не вызван enable)
+METRICS = MetricsRegistry()
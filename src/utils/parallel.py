@@ -0,0 +1,211 @@
+import math
+import os
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+from ..models.vacancy import Vacancy
+from .helpers import (
+    filter_vacancies,
+    get_vacancies_by_salary,
+    parse_salary_range,
+)
+from .matcher import KeywordMatcher
+
+T = TypeVar("T")
+
+# Меньше этого числа вакансий пересылка в процессы дороже самой фильтрации
+PARALLEL_THRESHOLD = 50_000
+
+# Частей на процесс: мелкие части выравнивают нагрузку между процессами
+_CHUNKS_PER_WORKER = 4
+
+_KeywordLists = Tuple[List[str], Optional[List[str]], Optional[List[str]]]
+
+# Текстовых полей на вакансию в пересылаемой части (см. _pack_texts)
+_TEXT_FIELDS = 4
+
+
+def _pack_texts(chunk: List[Vacancy]) -> List[str]:
+    """
+    Текстовые поля вакансий части одним плоским списком
+
+    По четыре строки на вакансию: название, описание, требования,
+    компания. Плоский список сериализуется быстрее списка кортежей.
+    """
+    return [
+        field
+        for vacancy in chunk
+        for field in (
+            vacancy.title,
+            vacancy.description,
+            vacancy.requirements,
+            vacancy.company,
+        )
+    ]
+
+
+def _match_chunk(fields: List[str], words: _KeywordLists) -> List[int]:
+    """
+    Номера вакансий части, подходящих по ключевым словам (в процессе)
+
+    Строка для поиска (Vacancy.search_text) собирается и приводится к
+    нижнему регистру здесь, в процессе пула, а не в родительском.
+    """
+    matcher = KeywordMatcher(*words)
+    build = Vacancy.build_search_text
+    return [
+        position
+        for position, start in enumerate(range(0, len(fields), _TEXT_FIELDS))
+        if matcher.matches(build(*fields[start : start + _TEXT_FIELDS]))
+    ]
+
+
+def _salary_chunk(
+    salaries: "array[float]", low: float, high: float
+) -> List[int]:
+    """Номера средних зарплат части, попадающих в диапазон (в процессе)"""
+    return [
+        position
+        for position, salary in enumerate(salaries)
+        if salary > 0 and low <= salary <= high
+    ]
+
+
+def _run_chunks(
+    vacancies: List[Vacancy],
+    pack: Callable[[List[Vacancy]], T],
+    worker: Callable[..., List[int]],
+    args: tuple,
+    workers: int,
+    executor: Optional[Executor],
+) -> List[Vacancy]:
+    """
+    Делит список на части, фильтрует их в пуле и собирает результат
+
+    В процессы уходит не Vacancy, а компактное представление части
+    (pack); обратно приходят номера подходящих вакансий внутри части.
+    Части собираются в исходном порядке.
+    """
+    chunk_size = max(
+        1, math.ceil(len(vacancies) / (workers * _CHUNKS_PER_WORKER))
+    )
+    chunks = [
+        vacancies[start : start + chunk_size]
+        for start in range(0, len(vacancies), chunk_size)
+    ]
+
+    def collect(pool: Executor) -> List[Vacancy]:
+        futures = [pool.submit(worker, pack(chunk), *args) for chunk in chunks]
+        result = []
+        for chunk, future in zip(chunks, futures):
+            result.extend(chunk[position] for position in future.result())
+        return result
+
+    if executor is not None:
+        return collect(executor)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return collect(pool)
+
+
+def _resolve_workers(workers: Optional[int]) -> int:
+    """Количество процессов: по умолчанию — число ядер"""
+    if workers is None:
+        return os.cpu_count() or 1
+    return workers
+
+
+def parallel_filter_vacancies(
+    vacancies: Sequence[Vacancy],
+    filter_words: List[str],
+    *,
+    any_words: Optional[List[str]] = None,
+    exclude_words: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    threshold: int = PARALLEL_THRESHOLD,
+    executor: Optional[Executor] = None,
+) -> List[Vacancy]:
+    """
+    filter_vacancies для больших списков с фильтрацией в пуле процессов
+
+    В процессы передаются только текстовые поля вакансий; строки для
+    поиска (Vacancy.search_text) строятся в процессах.
+    Если вакансий меньше threshold или процесс один, используется
+    обычный filter_vacancies.
+
+    Args:
+        vacancies: Список вакансий
+        filter_words: Ключевые слова (должны встретиться все)
+        any_words: Должно встретиться хотя бы одно из этих слов
+        exclude_words: Ни одно из этих слов не должно встретиться
+        workers: Количество процессов (по умолчанию — число ядер)
+        threshold: Минимальный размер списка для параллельной обработки
+        executor: Готовый пул процессов (иначе создается на время вызова)
+
+    Returns:
+        Отфильтрованный список вакансий в исходном порядке
+    """
+    vacancies = list(vacancies)
+    workers = _resolve_workers(workers)
+    matcher = KeywordMatcher(filter_words, any_words, exclude_words)
+    if len(vacancies) < threshold or workers <= 1 or matcher.is_empty:
+        return filter_vacancies(
+            vacancies,
+            filter_words,
+            any_words=any_words,
+            exclude_words=exclude_words,
+        )
+
+    return _run_chunks(
+        vacancies,
+        _pack_texts,
+        _match_chunk,
+        ((filter_words, any_words, exclude_words),),
+        workers,
+        executor,
+    )
+
+
+def parallel_get_vacancies_by_salary(
+    vacancies: Sequence[Vacancy],
+    salary_range: str,
+    *,
+    workers: Optional[int] = None,
+    threshold: int = PARALLEL_THRESHOLD,
+    executor: Optional[Executor] = None,
+) -> List[Vacancy]:
+    """
+    get_vacancies_by_salary для больших списков с фильтрацией в пуле
+
+    В процессы передаются только средние зарплаты — массивом array("d").
+    Если вакансий меньше threshold или процесс один, используется
+    обычный get_vacancies_by_salary.
+
+    Args:
+        vacancies: Список вакансий
+        salary_range: Диапазон зарплат в формате "100000-150000" или "100000"
+        workers: Количество процессов (по умолчанию — число ядер)
+        threshold: Минимальный размер списка для параллельной обработки
+        executor: Готовый пул процессов (иначе создается на время вызова)
+
+    Returns:
+        Отфильтрованный список вакансий в исходном порядке
+    """
+    vacancies = list(vacancies)
+    workers = _resolve_workers(workers)
+    if len(vacancies) < threshold or workers <= 1:
+        return get_vacancies_by_salary(vacancies, salary_range)
+    if not salary_range or salary_range.isspace():
+        return vacancies
+    try:
+        low, high = parse_salary_range(salary_range)
+    except ValueError:
+        return []
+
+    return _run_chunks(
+        vacancies,
+        lambda chunk: array("d", (vacancy.avg_salary for vacancy in chunk)),
+        _salary_chunk,
+        (low, high),
+        workers,
+        executor,
+    )
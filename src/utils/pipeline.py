@@ -0,0 +1,101 @@
+import heapq
+from typing import Callable, Iterable, Iterator, List, Optional
+from ..models.vacancy import Vacancy
+from .helpers import (
+    Predicate,
+    keyword_predicate,
+    salary_predicate,
+    salary_sort_key,
+)
+from .metrics import METRICS
+
+
+class Query:
+    """
+    Ленивый конвейер отбора вакансий в оперативной памяти
+
+    Методы отбора не проходят по вакансиям, а только добавляют условие
+    и возвращают новый конвейер; все условия проверяются за один проход
+    при выдаче результата, без промежуточных списков:
+
+        Query(vacancies).keywords(["python"]).salary("100000-200000").top(10)
+
+    Условия совпадают с filter_vacancies, get_vacancies_by_salary и
+    sort_vacancies + get_top_vacancies. top(n) отбирает n лучших
+    ограниченной кучей за O(n log k) вместо полной сортировки.
+
+    Не путать с storage.query.VacancyQuery — запросом к хранилищу.
+    """
+
+    def __init__(
+        self,
+        vacancies: Iterable[Vacancy],
+        predicates: Optional[List[Predicate]] = None,
+    ):
+        self._vacancies = vacancies
+        self._predicates: List[Predicate] = predicates or []
+
+    def where(self, predicate: Callable[[Vacancy], bool]) -> "Query":
+        """Добавляет произвольное условие"""
+        return Query(self._vacancies, self._predicates + [predicate])
+
+    def keywords(
+        self,
+        filter_words: List[str],
+        *,
+        any_words: Optional[List[str]] = None,
+        exclude_words: Optional[List[str]] = None,
+    ) -> "Query":
+        """Вакансии по ключевым словам (как filter_vacancies)"""
+        matches = keyword_predicate(filter_words, any_words, exclude_words)
+        return self if matches is None else self.where(matches)
+
+    def salary(self, salary_range: str) -> "Query":
+        """Вакансии в диапазоне зарплат (как get_vacancies_by_salary)"""
+        in_range = salary_predicate(salary_range)
+        return self if in_range is None else self.where(in_range)
+
+    def with_salary(self) -> "Query":
+        """Только вакансии с указанной зарплатой"""
+        return self.where(lambda vacancy: vacancy.avg_salary > 0)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        # Цепочка ленивых filter: каждая вакансия проходит все условия
+        # по очереди за один общий проход по источнику
+        result: Iterator[Vacancy] = iter(self._vacancies)
+        for predicate in self._predicates:
+            result = filter(predicate, result)
+        return result
+
+    @METRICS.timed("filter_query_seconds")
+    def to_list(self) -> List[Vacancy]:
+        """Все подходящие вакансии в исходном порядке"""
+        return list(self)
+
+    def count(self) -> int:
+        """Количество подходящих вакансий"""
+        return sum(1 for _ in self)
+
+    @METRICS.timed("filter_query_seconds")
+    def sorted(self) -> List[Vacancy]:
+        """Подходящие вакансии по убыванию зарплаты (как sort_vacancies)"""
+        return sorted(self, key=salary_sort_key)
+
+    @METRICS.timed("filter_query_seconds")
+    def top(self, top_n: int) -> List[Vacancy]:
+        """
+        Топ N подходящих вакансий по убыванию зарплаты
+
+        Равные по зарплате вакансии идут в исходном порядке, вакансии
+        без зарплаты — после всех с зарплатой, как в sort_vacancies.
+
+        Args:
+            top_n: Количество вакансий
+
+        Returns:
+            Не больше top_n вакансий
+        """
+        if top_n <= 0:
+            return []
+        # nsmallest устойчива и держит кучу не больше top_n элементов
+        return heapq.nsmallest(top_n, self, key=salary_sort_key)
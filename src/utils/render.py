@@ -0,0 +1,177 @@
+import sys
+from typing import Callable, Iterable, Optional, Sequence, TextIO
+from ..models.vacancy import Vacancy
+
+_SEPARATOR = "=" * 60
+
+# Ширина колонок компактной таблицы (номер, название, компания, зарплата)
+_TABLE_WIDTHS = (5, 40, 24, 24)
+
+EMPTY_MESSAGE = "Вакансии не найдены\n"
+
+
+def format_vacancy(number: int, vacancy: Vacancy) -> str:
+    """Подробный блок вакансии — тот же текст, что выводил print_vacancies"""
+    return f"\n{_SEPARATOR}\nВакансия #{number}\n{_SEPARATOR}\n{vacancy}\n\n"
+
+
+def _cell(text: str, width: int) -> str:
+    """Текст ячейки, обрезанный и дополненный пробелами до ширины"""
+    text = " ".join(text.split())
+    if len(text) > width:
+        text = text[: width - 1] + "…"
+    return text.ljust(width)
+
+
+def table_header() -> str:
+    """Заголовок компактной таблицы"""
+    number, title, company, salary = _TABLE_WIDTHS
+    header = " | ".join(
+        (
+            _cell("№", number),
+            _cell("Вакансия", title),
+            _cell("Компания", company),
+            _cell("Зарплата", salary),
+        )
+    )
+    return f"{header.rstrip()}\n{'-' * len(header)}\n"
+
+
+def format_table_row(number: int, vacancy: Vacancy) -> str:
+    """Строка компактной таблицы для вакансии"""
+    widths = _TABLE_WIDTHS
+    row = " | ".join(
+        (
+            str(number).rjust(widths[0]),
+            _cell(vacancy.title, widths[1]),
+            _cell(vacancy.company, widths[2]),
+            _cell(vacancy.get_salary_display(), widths[3]),
+        )
+    )
+    return row.rstrip() + "\n"
+
+
+def render_vacancies(
+    vacancies: Iterable[Vacancy], compact: bool = False, start: int = 1
+) -> str:
+    """
+    Форматирует вакансии в одну строку для вывода одной записью
+
+    Args:
+        vacancies: Вакансии (форматируются только те, что переданы)
+        compact: Компактная таблица вместо подробных блоков
+        start: Номер первой вакансии
+
+    Returns:
+        Текст для вывода
+    """
+    if compact:
+        rows = [table_header()]
+        rows.extend(
+            format_table_row(number, vacancy)
+            for number, vacancy in enumerate(vacancies, start)
+        )
+    else:
+        rows = [
+            format_vacancy(number, vacancy)
+            for number, vacancy in enumerate(vacancies, start)
+        ]
+    return "".join(rows)
+
+
+def write_vacancies(
+    vacancies: Sequence[Vacancy],
+    out: Optional[TextIO] = None,
+    compact: bool = False,
+) -> None:
+    """
+    Выводит вакансии одной буферизованной записью
+
+    Args:
+        vacancies: Список вакансий
+        out: Поток вывода (по умолчанию sys.stdout)
+        compact: Компактная таблица вместо подробных блоков
+    """
+    out = out or sys.stdout
+    if not vacancies:
+        out.write(EMPTY_MESSAGE)
+    else:
+        out.write(render_vacancies(vacancies, compact))
+    out.flush()
+
+
+class Pager:
+    """
+    Постраничный вывод списка вакансий
+
+    Форматируется только видимая страница: для списка из тысяч вакансий
+    просмотр первой страницы стоит столько же, сколько для двадцати.
+    Каждая страница выводится одной записью в поток.
+    """
+
+    def __init__(
+        self,
+        vacancies: Sequence[Vacancy],
+        page_size: int = 20,
+        compact: bool = False,
+    ):
+        if page_size <= 0:
+            raise ValueError("Размер страницы должен быть положительным")
+        self._vacancies = vacancies
+        self.page_size = page_size
+        self.compact = compact
+
+    @property
+    def pages(self) -> int:
+        """Количество страниц"""
+        return -(-len(self._vacancies) // self.page_size)
+
+    def render_page(self, page: int) -> str:
+        """
+        Текст страницы (нумерация страниц с нуля)
+
+        Args:
+            page: Номер страницы
+
+        Returns:
+            Текст страницы со строкой «Страница X из Y»
+        """
+        if not 0 <= page < self.pages:
+            raise IndexError("Нет такой страницы")
+        start = page * self.page_size
+        visible = self._vacancies[start : start + self.page_size]
+        text = render_vacancies(visible, self.compact, start + 1)
+        return f"{text}\nСтраница {page + 1} из {self.pages}\n"
+
+    def show(
+        self,
+        out: Optional[TextIO] = None,
+        ask: Callable[[str], str] = input,
+    ) -> int:
+        """
+        Выводит страницы по одной, спрашивая перед каждой следующей
+
+        Args:
+            out: Поток вывода (по умолчанию sys.stdout)
+            ask: Функция запроса ответа пользователя (по умолчанию input)
+
+        Returns:
+            Количество показанных страниц
+        """
+        out = out or sys.stdout
+        if not self._vacancies:
+            out.write(EMPTY_MESSAGE)
+            out.flush()
+            return 0
+
+        shown = 0
+        for page in range(self.pages):
+            out.write(self.render_page(page))
+            out.flush()
+            shown += 1
+            if page + 1 < self.pages:
+                answer = ask("Enter — следующая страница, q — выход: ")
+                if answer.strip().lower() in ("q", "й"):
+                    break
+        return shown
+
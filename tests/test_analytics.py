@@ -0,0 +1,183 @@
+import os
+import statistics
+import sys
+
+import pytest
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.analytics import salary  # noqa: E402
+from src.analytics.salary import (  # noqa: E402
+    NO_COMPANY,
+    SalaryFrame,
+    SalaryStats,
+    salary_report,
+)
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.storage.query import VacancyQuery  # noqa: E402
+
+BACKENDS = ["python"]
+if salary.np is not None:
+    BACKENDS.append("numpy")
+
+
+@pytest.fixture(params=BACKENDS, autouse=True)
+def backend(request, monkeypatch):
+    """Каждый тест выполняется с numpy (если установлен) и без него"""
+    monkeypatch.setattr(salary, "HAS_NUMPY", request.param == "numpy")
+    return request.param
+
+
+def sample_vacancies():
+    rows = [
+        ("Яндекс", 100000, None, "RUR"),
+        ("Яндекс", 150000, 250000, "RUR"),
+        ("Яндекс", None, None, "RUR"),
+        ("Сбер", 120000, None, "RUR"),
+        ("Сбер", None, 90000, "RUR"),
+        ("", 300000, None, "RUR"),
+        ("EPAM", 3000, 5000, "USD"),
+    ]
+    return [
+        Vacancy(
+            title=f"Вакансия {i}",
+            url=f"https://hh.ru/vacancy/{i}",
+            salary_from=salary_from,
+            salary_to=salary_to,
+            currency=currency,
+            company=company,
+        )
+        for i, (company, salary_from, salary_to, currency) in enumerate(rows)
+    ]
+
+
+def expected_stats(values, total):
+    """Сводка, посчитанная через statistics"""
+    values = sorted(values)
+    quantiles = statistics.quantiles(values, n=10, method="inclusive")
+    return SalaryStats(
+        total,
+        len(values),
+        statistics.fmean(values),
+        statistics.median(values),
+        quantiles[0],
+        quantiles[-1],
+        values[0],
+        values[-1],
+    )
+
+
+class TestStats:
+    def test_overall(self):
+        """Тест: сводка по всем вакансиям, без зарплаты — только в total"""
+        frame = SalaryFrame.from_vacancies(sample_vacancies())
+        rur = [100000, 200000, 120000, 90000, 300000]
+        assert frame.where(currency="RUR").stats() == pytest.approx(
+            expected_stats(rur, 6)
+        )
+        assert frame.stats().total == 7
+        assert frame.stats().count == 6
+
+    def test_matches_statistics_on_random_data(self):
+        """Тест: перцентили совпадают с statistics.quantiles"""
+        import random
+
+        rng = random.Random(7)
+        values = [rng.randint(30, 500) * 1000.0 for _ in range(501)]
+        frame = SalaryFrame(values, ["A"] * len(values), ["RUR"] * len(values))
+        assert frame.stats() == pytest.approx(expected_stats(values, len(values)))
+
+    def test_empty(self):
+        """Тест: пустая таблица"""
+        frame = SalaryFrame.from_vacancies([])
+        assert len(frame) == 0
+        assert frame.stats() == SalaryStats()
+        assert frame.by_company() == {}
+
+    def test_no_salaries(self):
+        """Тест: ни в одной вакансии нет зарплаты"""
+        frame = SalaryFrame([0.0, 0.0], ["A", "B"], ["RUR", "RUR"])
+        assert frame.stats() == SalaryStats(total=2)
+
+    def test_mismatched_columns(self):
+        """Тест: колонки разной длины"""
+        with pytest.raises(ValueError):
+            SalaryFrame([1.0], ["A", "B"], ["RUR"])
+
+
+class TestGroups:
+    def test_by_company(self):
+        """Тест: группировка по компаниям, сортировка по числу зарплат"""
+        frame = SalaryFrame.from_vacancies(sample_vacancies())
+        groups = frame.where(currency="RUR").by_company()
+        assert list(groups) == ["Яндекс", "Сбер", NO_COMPANY]
+        assert groups["Яндекс"] == pytest.approx(
+            expected_stats([100000, 200000], 3)
+        )
+        assert groups["Сбер"].median == 105000
+
+    def test_min_count(self):
+        """Тест: компании с малым числом зарплат отбрасываются"""
+        frame = SalaryFrame.from_vacancies(sample_vacancies())
+        assert list(frame.by_company(min_count=2)) == ["Яндекс", "Сбер"]
+
+    def test_by_currency(self):
+        """Тест: группировка по валютам"""
+        groups = SalaryFrame.from_vacancies(sample_vacancies()).by_currency()
+        assert list(groups) == ["RUR", "USD"]
+        assert groups["USD"].mean == 4000
+        assert groups["RUR"].total == 6
+
+    def test_where_company_and_missing(self):
+        """Тест: отбор по компании и по отсутствующему значению"""
+        frame = SalaryFrame.from_vacancies(sample_vacancies())
+        assert len(frame.where(company="Сбер")) == 2
+        assert len(frame.where(currency="EUR")) == 0
+        assert frame.where() is frame
+
+
+class TestHistogram:
+    def test_counts(self):
+        """Тест: интервалы равной ширины, правая граница включена"""
+        frame = SalaryFrame(
+            [10.0, 20.0, 20.0, 35.0, 50.0, 0.0], ["A"] * 6, ["RUR"] * 6
+        )
+        histogram = frame.histogram(bins=4)
+        assert histogram.edges == [10.0, 20.0, 30.0, 40.0, 50.0]
+        assert histogram.counts == [1, 2, 1, 1]
+
+    def test_explicit_range(self):
+        """Тест: значения вне заданного диапазона не учитываются"""
+        frame = SalaryFrame([5.0, 15.0, 25.0, 100.0], ["A"] * 4, ["RUR"] * 4)
+        assert frame.histogram(bins=2, low=10, high=30).counts == [1, 1]
+
+    def test_single_value_and_invalid_bins(self):
+        """Тест: одно значение и неверное число интервалов"""
+        frame = SalaryFrame([100.0], ["A"], ["RUR"])
+        assert sum(frame.histogram(bins=3).counts) == 1
+        with pytest.raises(ValueError):
+            frame.histogram(bins=0)
+
+
+class TestIntegration:
+    def test_from_storage(self, tmp_path):
+        """Тест: таблица по хранилищу и по запросу"""
+        storage = JSONStorage(str(tmp_path / "vacancies.json"))
+        storage.add_vacancies(sample_vacancies())
+        assert len(SalaryFrame.from_storage(storage)) == 7
+        frame = SalaryFrame.from_storage(storage, VacancyQuery(company="Яндекс"))
+        assert frame.stats().count == 2
+
+    def test_report(self):
+        """Тест: текстовый отчет"""
+        report = salary_report(SalaryFrame.from_vacancies(sample_vacancies()))
+        assert "RUR: 5 с зарплатой" in report
+        assert "Яндекс: 2" in report
+        assert "#" in report
+
+    def test_report_without_salaries(self):
+        """Тест: отчет, когда зарплаты не указаны"""
+        report = salary_report(SalaryFrame([0.0], ["A"], ["RUR"]))
+        assert "не указана зарплата" in report
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.abstract_storage import AbstractStorage, UpsertResult  # noqa: E402
+from src.storage.async_storage import AsyncStorageAdapter  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.storage.query import VacancyQuery  # noqa: E402
+
+
+def vacancies(count):
+    return [
+        Vacancy(f"Developer {i}", f"https://hh.ru/vacancy/{i}", salary_from=1000 * i)
+        for i in range(1, count + 1)
+    ]
+
+
+class SlowStorage(AbstractStorage):
+    """Хранилище с медленными операциями, отслеживающее параллельность"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active_reads = 0
+        self.active_writes = 0
+        self.max_reads = 0
+        self.overlaps = 0
+        self._lock = threading.Lock()
+
+    def _enter(self, write: bool) -> None:
+        with self._lock:
+            if write:
+                self.active_writes += 1
+            else:
+                self.active_reads += 1
+                self.max_reads = max(self.max_reads, self.active_reads)
+            if self.active_writes and (self.active_reads or self.active_writes > 1):
+                self.overlaps += 1
+        time.sleep(self.delay)
+        with self._lock:
+            if write:
+                self.active_writes -= 1
+            else:
+                self.active_reads -= 1
+
+    def add_vacancy(self, vacancy):
+        self._enter(write=True)
+
+    def get_vacancies(self, **kwargs):
+        self._enter(write=False)
+        return []
+
+    def delete_vacancy(self, vacancy):
+        self._enter(write=True)
+
+    def clear(self):
+        self._enter(write=True)
+
+
+class TestAsyncStorage:
+    """Тесты асинхронного интерфейса к хранилищу"""
+
+    def test_roundtrip_with_json_storage(self, tmp_path):
+        """Тест: операции JSONStorage через асинхронный интерфейс"""
+
+        async def scenario():
+            storage = JSONStorage(str(tmp_path / "v.json"))
+            async with AsyncStorageAdapter(storage) as async_storage:
+                await async_storage.add_vacancies(vacancies(5))
+                await async_storage.add_vacancy(vacancies(6)[5])
+                result = await async_storage.upsert_vacancies(vacancies(3))
+                top = await async_storage.query(
+                    VacancyQuery(order_by="-salary_from", limit=2)
+                )
+                await async_storage.delete_vacancies(vacancies(2))
+                remaining = await async_storage.get_vacancies()
+                await async_storage.clear()
+                empty = await async_storage.get_vacancies()
+            return result, top, remaining, empty
+
+        result, top, remaining, empty = asyncio.run(scenario())
+        assert result == UpsertResult(0, 0, 3)
+        assert [v.salary_from for v in top] == [6000, 5000]
+        assert len(remaining) == 4
+        assert empty == []
+
+    def test_event_loop_not_blocked(self):
+        """Тест: пока идет запись, цикл событий продолжает работу"""
+        storage = SlowStorage(delay=0.2)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.02)
+
+        async def scenario():
+            async with AsyncStorageAdapter(storage) as async_storage:
+                await asyncio.gather(async_storage.add_vacancy(None), ticker())
+
+        asyncio.run(scenario())
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.2
+
+    def test_readers_run_concurrently(self):
+        """Тест: чтения идут параллельно, записи — отдельно от всех"""
+        storage = SlowStorage()
+
+        async def scenario():
+            async with AsyncStorageAdapter(storage) as async_storage:
+                await asyncio.gather(
+                    *(async_storage.get_vacancies() for _ in range(3)),
+                    async_storage.add_vacancy(None),
+                    *(async_storage.get_vacancies() for _ in range(3)),
+                    async_storage.clear(),
+                )
+
+        asyncio.run(scenario())
+        assert storage.max_reads > 1
+        assert storage.overlaps == 0
@@ -0,0 +1,61 @@
+import os
+import sys
+
+# Добавляем корень проекта в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.bench_startup import (  # noqa: E402
+    check,
+    entry_subtree,
+    measure,
+    parse_importtime,
+)
+from benchmarks.bench_storage import BACKENDS, compare, run_backend  # noqa: E402
+from benchmarks.datagen import generate_records  # noqa: E402
+
+
+class TestBenchmarks:
+    """Быстрые проверки, что бенчмарки работоспособны"""
+
+    def test_datagen_is_deterministic(self):
+        """Тест: генератор воспроизводим и дает уникальные URL"""
+        records = generate_records(50, seed=1)
+        assert records == generate_records(50, seed=1)
+        assert len({r["url"] for r in records}) == 50
+
+    def test_run_all_backends_smoke(self):
+        """Тест: все хранилища проходят полный набор измерений"""
+        for backend in BACKENDS:
+            results = run_backend(backend, size=30, ops=2, seed=1)
+            metrics = {r["metric"] for r in results}
+            assert {"bulk_load", "open", "add", "delete", "query_page"} <= metrics
+
+    def test_compare_detects_regression(self):
+        """Тест поиска регрессий относительно базовых результатов"""
+        base = [{"backend": "json", "size": 10, "metric": "add", "p50_ms": 1.0}]
+        slow = [{"backend": "json", "size": 10, "metric": "add", "p50_ms": 9.0}]
+        assert compare(slow, base, tolerance=0.5)
+        assert not compare(base, base, tolerance=0.5)
+
+    def test_parse_importtime_subtree(self):
+        """Тест: разбор вывода importtime и поддерево точки входа"""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |   encodings.utf_8\n"
+            "import time:       300 |        400 | site\n"
+            "import time:        50 |         50 |     json.decoder\n"
+            "import time:        20 |         70 |   json\n"
+            "import time:      1000 |       1070 | src.cli\n"
+        )
+        records = parse_importtime(output)
+        assert [r.depth for r in records] == [1, 0, 2, 1, 0]
+        subtree = entry_subtree(records, "src.cli")
+        assert [r.module for r in subtree] == ["json.decoder", "json", "src.cli"]
+        assert subtree[-1].cumulative_us == 1070
+
+    def test_query_path_skips_heavy_modules(self):
+        """Тест: пакетный режим запускается без requests и numpy"""
+        result = measure("src.cli", runs=1)
+        assert result["forbidden"] == []
+        assert check(result, budget_ms=None) == []
+        assert check(dict(result, min_ms=500.0), budget_ms=100.0)
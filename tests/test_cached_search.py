@@ -0,0 +1,218 @@
+import threading
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.api.abstract_api import AbstractAPI  # noqa: E402
+from src.services.cached_search import CachedSearch, normalize_query  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+
+
+def hh_item(number: int, salary: int = 100000) -> dict:
+    return {
+        "name": f"Python Developer {number}",
+        "alternate_url": f"https://hh.ru/vacancy/{number}",
+        "salary": {"from": salary, "to": None, "currency": "RUR"},
+        "snippet": {"requirement": "Python"},
+        "employer": {"name": "IT компания"},
+    }
+
+
+class FakeAPI(AbstractAPI):
+    """API, возвращающий заданный ответ и считающий обращения"""
+
+    def __init__(self, response=None):
+        self.response = response if response is not None else [hh_item(1), hh_item(2)]
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def _connect(self) -> None:
+        pass
+
+    def get_vacancies(self, search_query, per_page=100):
+        self.release.wait(5)
+        self.calls += 1
+        return list(self.response)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def make_search(tmp_path, clock):
+    """Фабрика CachedSearch с подменой времени"""
+
+    def factory(api, **kwargs):
+        storage = JSONStorage(str(tmp_path / "vacancies.json"))
+        search = CachedSearch(
+            api, storage, log_filename=str(tmp_path / "query_log.json"), **kwargs
+        )
+        search._now = clock
+        return search
+
+    return factory
+
+
+class TestCachedSearch:
+    """Тесты чтения через локальное хранилище"""
+
+    def test_normalize_query(self):
+        """Тест: регистр и лишние пробелы не влияют на ключ"""
+        assert normalize_query("  Python   Разработчик ") == "python разработчик"
+
+    def test_fresh_results_skip_network(self, make_search):
+        """Тест: свежие результаты отдаются без обращения к API"""
+        api = FakeAPI()
+        search = make_search(api)
+
+        first = search.search("Python")
+        second = search.search("python ")
+
+        assert api.calls == 1
+        assert [v.url for v in second] == [v.url for v in first]
+        assert search.lookup("PYTHON") is not None
+
+    def test_unknown_query_is_not_cached(self, make_search):
+        """Тест: для невыполнявшегося запроса кэша нет"""
+        search = make_search(FakeAPI())
+        assert search.lookup("Python") is None
+        assert search.age("Python") is None
+
+    def test_stale_results_are_refetched(self, make_search, clock):
+        """Тест: устаревшие результаты запрашиваются заново"""
+        api = FakeAPI()
+        search = make_search(api, freshness=60)
+        search.search("Python")
+
+        clock.now += 61
+        assert search.lookup("Python") is None
+        api.response = [hh_item(3)]
+        result = search.search("Python")
+
+        assert api.calls == 2
+        assert [v.url for v in result] == ["https://hh.ru/vacancy/3"]
+        assert search.age("Python") == 0
+
+    def test_stale_while_revalidate(self, make_search, clock):
+        """Тест: устаревшие результаты отдаются сразу, обновление идет в фоне"""
+        api = FakeAPI()
+        search = make_search(api, freshness=60, background_refresh=True)
+        search.search("Python")
+
+        clock.now += 61
+        api.response = [hh_item(3)]
+        api.release.clear()
+        stale = search.search("Python")
+        # Повторный запрос не запускает второе обновление
+        search.search("Python")
+        api.release.set()
+        search.wait_for_refreshes(5)
+
+        assert [v.url for v in stale] == [
+            "https://hh.ru/vacancy/1",
+            "https://hh.ru/vacancy/2",
+        ]
+        assert api.calls == 2
+        assert search.is_fresh("Python")
+        assert [v.url for v in search.search("Python")] == ["https://hh.ru/vacancy/3"]
+
+    def test_background_error_goes_to_stderr(self, make_search, clock, capsys):
+        """Тест: ошибка фонового обновления пишется в stderr, а не в stdout"""
+        api = FakeAPI()
+        search = make_search(api, freshness=60, background_refresh=True)
+        search.search("Python")
+
+        def fail(search_query, per_page=100):
+            raise RuntimeError("нет сети")
+
+        api.get_vacancies = fail
+        clock.now += 61
+        assert len(search.search("Python")) == 2
+        search.wait_for_refreshes(5)
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "нет сети" in captured.err
+
+    def test_empty_response_keeps_previous_results(self, make_search, clock):
+        """Тест: пустой ответ API не затирает прежние результаты"""
+        api = FakeAPI()
+        search = make_search(api, freshness=60)
+        search.search("Python")
+
+        clock.now += 61
+        api.response = []
+        assert search.search("Python") == []
+        assert not search.is_fresh("Python")
+        assert len(search._cached_vacancies("Python")) == 2
+
+    def test_log_survives_restart(self, make_search):
+        """Тест: журнал запросов читается новым экземпляром"""
+        make_search(FakeAPI()).search("Python")
+
+        api = FakeAPI()
+        search = make_search(api)
+        assert len(search.search("Python")) == 2
+        assert api.calls == 0
+
+    def test_results_keep_api_order(self, make_search):
+        """Тест: результаты из хранилища идут в порядке выдачи API"""
+        api = FakeAPI([hh_item(5), hh_item(2), hh_item(9)])
+        search = make_search(api)
+        search.search("Python")
+        urls = [v.url for v in search.lookup("Python")]
+        assert urls == [f"https://hh.ru/vacancy/{n}" for n in (5, 2, 9)]
+
+    def test_negative_freshness(self, make_search):
+        """Тест: отрицательное окно свежести недопустимо"""
+        with pytest.raises(ValueError):
+            make_search(FakeAPI(), freshness=-1)
+
+    def test_hit_reads_by_keys(self, make_search, monkeypatch):
+        """Тест: свежие результаты читаются по ключам, без перебора хранилища"""
+        search = make_search(FakeAPI())
+        search.search("Python")
+
+        def full_scan(query):
+            raise AssertionError("перебор хранилища")
+
+        monkeypatch.setattr(search._storage, "query", full_scan)
+        assert len(search.search("Python")) == 2
+
+    def test_legacy_log_entry_is_refetched(self, make_search, tmp_path):
+        """Тест: запись журнала без ключей считается промахом"""
+        (tmp_path / "query_log.json").write_text(
+            '{"python": {"fetched_at": 1000000.0, "urls": ["x"]}}', "utf-8"
+        )
+        api = FakeAPI()
+        search = make_search(api)
+        assert len(search.search("Python")) == 2
+        assert api.calls == 1
+
+    def test_per_page(self, make_search):
+        """Тест: результаты обрезаются до per_page, неполная страница — промах"""
+        api = FakeAPI([hh_item(number) for number in range(3)])
+        search = make_search(api)
+        search.search("Python", per_page=3)
+        assert len(search.search("Python", per_page=2)) == 2
+        assert api.calls == 1
+
+        # Страница из 3 заполнена: для 5 вакансий нужен новый запрос
+        search.search("Python", per_page=5)
+        assert api.calls == 2
+        # Ответ меньше страницы: результатов больше нет
+        assert len(search.search("Python", per_page=10)) == 3
+        assert api.calls == 2
@@ -0,0 +1,250 @@
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import cli  # noqa: E402
+from src.api import hh_api  # noqa: E402
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.services.cached_search import CachedSearch  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+
+
+def hh_item(number, query="Python"):
+    return {
+        "name": f"{query} разработчик {number}",
+        "alternate_url": f"https://hh.ru/vacancy/{query}-{number}",
+        "salary": {"from": 100000 + number * 10000, "to": None, "currency": "RUR"},
+        "snippet": {"requirement": "Django"},
+        "employer": {"name": f"Компания {number % 2}"},
+    }
+
+
+class FakeAPI:
+    """API с заранее заданными ответами и подсчетом одновременных вызовов"""
+
+    def __init__(self, responses, delay=0.0):
+        self.responses = responses
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_vacancies(self, search_query, per_page=50):
+        with self._lock:
+            self.calls.append(search_query)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            response = self.responses.get(search_query, [])
+            if isinstance(response, Exception):
+                raise response
+            return response
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return JSONStorage(str(tmp_path / "vacancies.json"))
+
+
+@pytest.fixture
+def cache(tmp_path, storage):
+    return CachedSearch(
+        FakeAPI({}), storage, log_filename=str(tmp_path / "query_log.json")
+    )
+
+
+def fill(storage, count=6):
+    storage.add_vacancies(
+        Vacancy.cast_to_object_list([hh_item(number) for number in range(count)])
+    )
+
+
+class TestReadQueries:
+    def test_comments_blank_and_repeats(self, tmp_path):
+        """Тест: комментарии, пустые строки и повторы пропускаются"""
+        path = tmp_path / "queries.txt"
+        path.write_text("# вечерний прогон\nPython\n\n  Java  \nPython\n", "utf-8")
+        assert cli.read_queries(str(path)) == ["Python", "Java"]
+
+
+class TestRunFetch:
+    def test_concurrent_fetch_and_store(self, cache, storage):
+        """Тест: запросы выполняются параллельно, результаты сохраняются"""
+        queries = [f"q{number}" for number in range(6)]
+        api = FakeAPI(
+            {query: [hh_item(1, query), hh_item(2, query)] for query in queries},
+            delay=0.05,
+        )
+        report = cli.run_fetch(queries, cache, [api], concurrency=3)
+
+        assert api.max_active == 3
+        assert report["failed"] == 0
+        assert report["fetched"] == report["inserted"] == 12
+        assert [result["query"] for result in report["queries"]] == queries
+        assert len(storage.get_vacancies()) == 12
+        assert cache.lookup("q0") is not None
+        assert cli.fetch_exit_code(report) == cli.EXIT_OK
+
+    def test_fallback_and_failures(self, cache):
+        """Тест: резервный API, ошибки и пустые ответы"""
+        primary = FakeAPI({"ok": [hh_item(1)], "boom": RuntimeError("timeout")})
+        fallback = FakeAPI({"boom": [hh_item(2)]})
+        report = cli.run_fetch(["ok", "boom", "empty"], cache, [primary, fallback])
+
+        statuses = {result["query"]: result["status"] for result in report["queries"]}
+        assert statuses == {"ok": "ok", "boom": "ok", "empty": "empty"}
+        assert fallback.calls == ["boom", "empty"]
+        assert cli.fetch_exit_code(report) == cli.EXIT_INCOMPLETE
+
+        report = cli.run_fetch(["empty"], cache, [primary], allow_empty=True)
+        assert cli.fetch_exit_code(report) == cli.EXIT_OK
+
+    def test_page_size_recorded(self, tmp_path, storage):
+        """Тест: после fetch с малой страницей поиск с большей идет в API"""
+        api = FakeAPI({"Python": [hh_item(number) for number in range(3)]})
+        cache = CachedSearch(
+            api, storage, log_filename=str(tmp_path / "query_log.json")
+        )
+        cli.run_fetch(["Python"], cache, [api], per_page=3)
+        assert len(cache.search("Python", per_page=3)) == 3
+        assert api.calls == ["Python"]
+
+        api.responses["Python"] = [hh_item(number) for number in range(5)]
+        assert len(cache.search("Python", per_page=10)) == 5
+        assert api.calls == ["Python", "Python"]
+
+    def test_all_failed(self, cache):
+        """Тест: все запросы с ошибкой"""
+        api = FakeAPI({"a": RuntimeError("нет сети"), "b": RuntimeError("нет сети")})
+        report = cli.run_fetch(["a", "b"], cache, [api])
+        assert report["queries"][0]["error"] == "нет сети"
+        assert cli.fetch_exit_code(report) == cli.EXIT_FAILURE
+
+
+class TestMain:
+    def run(self, tmp_path, *args):
+        return cli.main(["--path", str(tmp_path / "vacancies.json"), *args])
+
+    def test_fetch_command(self, tmp_path, monkeypatch, capsys):
+        """Тест: команда fetch с файлом запросов и JSON-отчетом"""
+        api = FakeAPI({"Python": [hh_item(1)], "Java": [hh_item(1, "Java")]})
+        monkeypatch.setattr(cli, "HeadHunterAPI", lambda: api)
+        monkeypatch.setattr(cli, "FallbackHeadHunterAPI", lambda: FakeAPI({}))
+        queries = tmp_path / "queries.txt"
+        queries.write_text("Python\nJava\n", "utf-8")
+
+        code = self.run(
+            tmp_path,
+            "fetch",
+            "--queries-file",
+            str(queries),
+            "--query-log",
+            str(tmp_path / "log.json"),
+            "--json",
+        )
+        report = json.loads(capsys.readouterr().out)
+        assert code == cli.EXIT_OK
+        assert report["total"] == 2
+        assert report["inserted"] == 2
+        assert "vacancies_per_second" in report
+
+    def test_fetch_json_with_real_api(self, tmp_path, monkeypatch, capsys):
+        """Тест: диагностика API не попадает в stdout с JSON-отчетом"""
+
+        class Response:
+            status_code = 200
+
+            def json(self):
+                return {"items": [hh_item(1)]}
+
+        monkeypatch.setattr("requests.get", lambda *args, **kwargs: Response())
+        monkeypatch.setattr(hh_api.random, "uniform", lambda low, high: 0)
+        code = self.run(
+            tmp_path,
+            "fetch",
+            "Python",
+            "--no-fallback",
+            "--query-log",
+            str(tmp_path / "log.json"),
+            "--json",
+        )
+        captured = capsys.readouterr()
+        report = json.loads(captured.out)
+        assert code == cli.EXIT_OK
+        assert report["inserted"] == 1
+        assert "Статус ответа: 200" in captured.err
+
+    def test_fetch_without_queries(self, tmp_path, capsys):
+        """Тест: fetch без запросов — ошибка использования"""
+        assert self.run(tmp_path, "fetch") == cli.EXIT_USAGE
+
+    def test_query_command(self, tmp_path, capsys):
+        """Тест: команда query с фильтрами, сортировкой и JSON"""
+        fill(JSONStorage(str(tmp_path / "vacancies.json")))
+        code = self.run(
+            tmp_path,
+            "query",
+            "--salary-min",
+            "120000",
+            "--order-by=-avg",
+            "--limit",
+            "2",
+            "--output-format",
+            "json",
+        )
+        rows = json.loads(capsys.readouterr().out)
+        assert code == cli.EXIT_OK
+        assert [row["salary_from"] for row in rows] == [150000, 140000]
+
+    def test_query_nothing_found(self, tmp_path, capsys):
+        """Тест: query без результатов возвращает 1"""
+        fill(JSONStorage(str(tmp_path / "vacancies.json")))
+        assert self.run(tmp_path, "query", "--keyword", "cobol") == cli.EXIT_INCOMPLETE
+
+    def test_export_csv(self, tmp_path, capsys):
+        """Тест: экспорт в CSV"""
+        fill(JSONStorage(str(tmp_path / "vacancies.json")))
+        output = tmp_path / "export.csv"
+        code = self.run(
+            tmp_path, "export", str(output), "--export-format", "csv", "--limit", "3"
+        )
+        lines = output.read_text("utf-8").splitlines()
+        assert code == cli.EXIT_OK
+        assert lines[0].startswith("title,company,salary_from")
+        assert len(lines) == 4
+
+    def test_stats_json(self, tmp_path, capsys):
+        """Тест: статистика зарплат в JSON"""
+        fill(JSONStorage(str(tmp_path / "vacancies.json")))
+        code = self.run(tmp_path, "stats", "--json")
+        payload = json.loads(capsys.readouterr().out)
+        assert code == cli.EXIT_OK
+        assert payload["by_currency"]["RUR"]["median"] == 125000
+        assert list(payload["top_companies"]) == ["Компания 0", "Компания 1"]
+
+    def test_other_backend(self, tmp_path, capsys):
+        """Тест: выбор хранилища"""
+        path = str(tmp_path / "shards")
+        assert cli.main(["--storage", "sharded", "--path", path, "stats"]) == 0
+        assert "ни в одной не указана зарплата" in capsys.readouterr().out
+
+    def test_invalid_arguments(self, tmp_path):
+        """Тест: неверные аргументы — код 2"""
+        with pytest.raises(SystemExit) as error:
+            self.run(tmp_path, "query", "--limit", "0")
+        assert error.value.code == cli.EXIT_USAGE
+        with pytest.raises(SystemExit) as error:
+            self.run(tmp_path, "export", "-", "--offset", "-1")
+        assert error.value.code == cli.EXIT_USAGE
@@ -0,0 +1,98 @@
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.codecs import (  # noqa: E402
+    FORMATS,
+    decode_records,
+    detect_format,
+    encode_records,
+)
+from src.storage.json_storage import JSONStorage  # noqa: E402
+
+RECORDS = [
+    Vacancy(
+        "Python разработчик",
+        "https://hh.ru/vacancy/1",
+        salary_from=120000,
+        description="Разработка backend",
+    ).to_dict(),
+    {"title": "Без зарплаты", "url": "https://hh.ru/vacancy/2"},
+]
+
+
+class TestCodecs:
+    """Тесты форматов файла хранилища"""
+
+    @pytest.mark.parametrize("storage_format", FORMATS)
+    def test_roundtrip_and_detection(self, storage_format):
+        """Тест кодирования, декодирования и определения формата"""
+        payload = encode_records(RECORDS, storage_format)
+        assert detect_format(payload) == storage_format
+        assert decode_records(payload) == RECORDS
+
+    @pytest.mark.parametrize("storage_format", FORMATS)
+    def test_heterogeneous_keys_roundtrip(self, storage_format):
+        """Тест: поле, отсутствующее посреди записи, не становится None"""
+        records = [
+            {"title": "A", "url": "u1", "salary_from": 1, "company": "X"},
+            {"title": "B", "company": "Y"},
+            {"url": "u3", "salary_from": None},
+            {},
+        ]
+        decoded = decode_records(encode_records(records, storage_format))
+        assert decoded == records
+        assert [list(record) for record in decoded] == [
+            list(record) for record in records
+        ]
+
+    def test_columnar_version_1(self):
+        """Тест: файлы версии 1 без absent читаются как прежде"""
+        payload = (
+            b'{"format":"vacancies/columnar","version":1,'
+            b'"columns":["title","url"],"rows":[["A",null],["B"]]}'
+        )
+        assert decode_records(payload) == [{"title": "A", "url": None}, {"title": "B"}]
+
+    def test_compressed_is_smaller(self):
+        """Тест: сжатые форматы меньше исходного JSON"""
+        records = RECORDS * 50
+        json_size = len(encode_records(records, "json"))
+        assert len(encode_records(records, "columnar")) < json_size
+        assert len(encode_records(records, "gzip")) < json_size / 5
+
+    def test_errors(self):
+        """Тест неизвестного формата и поврежденных данных"""
+        with pytest.raises(ValueError):
+            encode_records(RECORDS, "bson")
+        with pytest.raises(ValueError):
+            decode_records(b"\x1f\x8bnot gzip")
+        with pytest.raises(ValueError):
+            decode_records(b'{"format": "other"}')
+
+
+class TestStorageFormats:
+    """Тесты JSONStorage со сжатым форматом"""
+
+    def test_storage_keeps_detected_format(self, tmp_path):
+        """Тест: формат существующего файла определяется и сохраняется"""
+        filename = str(tmp_path / "vacancies.json")
+        storage = JSONStorage(filename, storage_format="gzip")
+        storage.add_vacancy(Vacancy("Python", "https://hh.ru/vacancy/1"))
+        with open(filename, "rb") as f:
+            assert detect_format(f.read()) == "gzip"
+
+        reopened = JSONStorage(filename)
+        reopened.add_vacancy(Vacancy("Java", "https://hh.ru/vacancy/2"))
+        with open(filename, "rb") as f:
+            assert detect_format(f.read()) == "gzip"
+        assert len(JSONStorage(filename).get_vacancies()) == 2
+
+    def test_unknown_storage_format(self, tmp_path):
+        """Тест ошибки для неизвестного формата"""
+        with pytest.raises(ValueError):
+            JSONStorage(str(tmp_path / "vacancies.json"), storage_format="xml")
@@ -0,0 +1,118 @@
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+
+HOUR = 3600.0
+
+
+class FakeClock:
+    """Управляемое время для хранилища"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_storage(filename, clock, **kwargs):
+    storage = JSONStorage(filename, ttl=HOUR, **kwargs)
+    storage._now = clock
+    return storage
+
+
+def vacancies(count, start=0):
+    return [
+        Vacancy(f"Vacancy {i}", f"https://hh.ru/vacancy/{i}", salary_from=1000 * i)
+        for i in range(start, start + count)
+    ]
+
+
+class TestExpiry:
+    """Тесты срока жизни записей"""
+
+    def test_timestamps_recorded(self, tmp_path, clock):
+        """Тест: записи получают fetched_at и last_seen"""
+        storage = make_storage(str(tmp_path / "v.json"), clock)
+        storage.add_vacancy(vacancies(1)[0])
+        record = next(iter(storage._records.values()))
+        assert record["fetched_at"] == record["last_seen"] == clock.now
+
+    def test_expired_hidden_from_reads(self, tmp_path, clock):
+        """Тест: просроченные записи не выдаются еще до удаления"""
+        storage = make_storage(str(tmp_path / "v.json"), clock)
+        storage.add_vacancies(vacancies(3))
+        clock.now += HOUR + 1
+
+        assert storage.get_vacancies() == []
+        assert storage.top_by_salary(5) == []
+        assert len(storage._records) == 3
+
+    def test_eviction_amortized_into_writes(self, tmp_path, clock):
+        """Тест: каждая запись удаляет не больше evict_batch записей"""
+        filename = str(tmp_path / "v.json")
+        storage = make_storage(filename, clock, evict_batch=2)
+        storage.add_vacancies(vacancies(5))
+        clock.now += HOUR + 1
+
+        storage.add_vacancy(vacancies(1, start=10)[0])
+        assert len(JSONStorage(filename)._records) == 4
+
+        storage.add_vacancy(vacancies(1, start=11)[0])
+        assert len(JSONStorage(filename)._records) == 3
+
+        assert storage.evict_expired() == 1
+        assert [v.title for v in JSONStorage(filename).get_vacancies()] == [
+            "Vacancy 10",
+            "Vacancy 11",
+        ]
+
+    def test_upsert_refreshes_last_seen(self, tmp_path, clock):
+        """Тест: повторно полученные вакансии продлевают срок жизни"""
+        storage = make_storage(str(tmp_path / "v.json"), clock)
+        storage.upsert_vacancies(vacancies(2))
+
+        clock.now += HOUR * 0.75
+        result = storage.upsert_vacancies(vacancies(1))
+        assert result.unchanged == 1
+
+        clock.now += HOUR * 0.5
+        assert [v.title for v in storage.get_vacancies()] == ["Vacancy 0"]
+
+    def test_add_revives_expired(self, tmp_path, clock):
+        """Тест: повторное добавление заменяет просроченную запись"""
+        filename = str(tmp_path / "v.json")
+        storage = make_storage(filename, clock, evict_batch=0)
+        storage.add_vacancies(vacancies(2))
+        clock.now += HOUR + 1
+        assert storage.get_vacancies() == []
+
+        storage.add_vacancy(vacancies(1)[0])
+        assert [v.title for v in storage.get_vacancies()] == ["Vacancy 0"]
+        record = next(iter(storage._records.values()))
+        assert record["last_seen"] == clock.now
+
+        storage.add_vacancies(vacancies(2))
+        assert len(storage.get_vacancies()) == 2
+        assert len(storage._records) == 2
+        reloaded = make_storage(filename, clock)
+        assert [v.title for v in reloaded.get_vacancies()] == [
+            "Vacancy 0",
+            "Vacancy 1",
+        ]
+
+    def test_invalid_ttl(self, tmp_path):
+        """Тест: ttl должен быть положительным"""
+        with pytest.raises(ValueError):
+            JSONStorage(str(tmp_path / "v.json"), ttl=0)
@@ -0,0 +1,100 @@
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.storage.keyword_index import KeywordIndex, tokenize  # noqa: E402
+
+
+class TestKeywordIndex:
+    """Тесты инвертированного индекса ключевых слов"""
+
+    def build_index(self):
+        index = KeywordIndex()
+        index.add(1, ["Python разработчик", "Django, Flask"])
+        index.add(2, ["Java Developer", "Spring"])
+        index.add(3, ["Ведущий Python-разработчик", "Ёмкие задачи"])
+        return index
+
+    def test_tokenize_cyrillic(self):
+        """Тест токенизации кириллицы и буквы «ё»"""
+        assert tokenize("Ведущий Python-разработчик, Ёлка") == [
+            "ведущий",
+            "python",
+            "разработчик",
+            "елка",
+        ]
+        assert tokenize("") == []
+
+    def test_lookup_single_keyword(self):
+        """Тест поиска по одному слову"""
+        index = self.build_index()
+        assert index.candidates("python") == {1, 3}
+        assert index.candidates("РАЗРАБОТЧИК") == {1, 3}
+
+    def test_lookup_substring(self):
+        """Тест поиска по части слова"""
+        index = self.build_index()
+        assert index.candidates("разраб") == {1, 3}
+        assert index.candidates("ring") == {2}
+
+    def test_lookup_and(self):
+        """Тест пересечения списков (AND)"""
+        index = self.build_index()
+        assert index.lookup(["python", "flask"]) == {1}
+        assert index.lookup(["python", "spring"]) == set()
+
+    def test_lookup_without_tokens(self):
+        """Тест запроса, который индекс не может сузить"""
+        assert self.build_index().lookup(["++"]) is None
+
+    def test_remove(self):
+        """Тест инкрементального удаления"""
+        index = self.build_index()
+        index.remove(1, ["Python разработчик", "Django, Flask"])
+        assert index.candidates("python") == {3}
+        assert index.candidates("flask") == set()
+
+    def test_payload_roundtrip(self):
+        """Тест сериализации через позиции в файле"""
+        index = self.build_index()
+        payload = index.to_payload({1: 0, 2: 1, 3: 2})
+        restored = KeywordIndex.from_payload(payload, [10, 20, 30])
+        assert restored.candidates("python") == {10, 30}
+
+    def test_lookup_infix_and_short_tokens(self):
+        """Тест: подстрока в середине токена и токены короче триграммы"""
+        index = self.build_index()
+        assert index.candidates("вущ") == set()
+        assert index.candidates("дущ") == {3}
+        assert index.candidates("java") == {2}
+        assert index.candidates("ja") == {1, 2}
+        assert index.candidates("о") == {1, 3}
+
+    def test_vocabulary_updates_after_lookup(self):
+        """Тест: индекс триграмм следует за добавлением и удалением токенов"""
+        index = self.build_index()
+        assert index.candidates("kotlin") == set()
+        index.add(4, ["Kotlin"])
+        assert index.candidates("otli") == {4}
+        index.remove(4, ["Kotlin"])
+        assert index.candidates("otli") == set()
+
+    def test_merge_payload(self):
+        """Тест: добавление записей из частичного payload"""
+        index = self.build_index()
+        payload = KeywordIndex.payload_for([(3, ["Python, Kafka"])])
+        assert payload == {"python": [3], "kafka": [3]}
+        index.merge_payload(payload, [10, 20, 30, 40])
+        assert index.candidates("python") == {1, 3, 40}
+        assert index.candidates("afk") == {40}
+
+    def test_remove_payload(self):
+        """Тест: удаление записей по частичному payload"""
+        index = self.build_index()
+        payload = KeywordIndex.payload_for([(0, ["Python разработчик"])])
+        index.remove_payload(payload, [1, 2, 3])
+        assert index.candidates("python") == {3}
+        assert index.candidates("разработчик") == {3}
+        assert index.candidates("django") == {1}
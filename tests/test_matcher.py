@@ -0,0 +1,118 @@
+import random
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.utils.helpers import filter_vacancies  # noqa: E402
+from src.utils.matcher import KeywordMatcher, _trie_pattern  # noqa: E402
+
+# Больше порога отдельных поисков подстрок: проверяется путь через regex
+MANY_WORDS = [
+    "java",
+    "javascript",
+    "script",
+    "python",
+    "go",
+    "sql",
+    "c++",
+    "py",
+    "pyth",
+    "thon",
+    "ql",
+]
+
+
+def naive(text, all_words=(), any_words=(), exclude_words=()):
+    """Эталон: отдельный поиск каждой подстроки"""
+    return (
+        all(w in text for w in all_words)
+        and (not any_words or any(w in text for w in any_words))
+        and not any(w in text for w in exclude_words)
+    )
+
+
+class TestKeywordMatcher:
+    """Тесты KeywordMatcher"""
+
+    def test_overlapping_words_are_found(self):
+        """Тест: перекрывающиеся и вложенные слова находятся все"""
+        matcher = KeywordMatcher(MANY_WORDS[:3] + ["py", "pyth", "thon"])
+        assert matcher.matches("javascript and python")
+        assert not matcher.matches("javascript and pyt")
+
+    @pytest.mark.parametrize("word_count", [1, 3, len(MANY_WORDS)])
+    def test_agrees_with_substring_search(self, word_count):
+        """Тест: результат совпадает с поиском подстрок на случайных текстах"""
+        rng = random.Random(word_count)
+        words = MANY_WORDS[:word_count]
+        alphabet = "javscriptpyhongoql+ "
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            chosen = [
+                rng.sample(words, rng.randint(0, len(words))) for _ in range(3)
+            ]
+            matcher = KeywordMatcher(*chosen)
+            assert matcher.matches(text) == naive(text, *chosen), (text, chosen)
+
+    def test_trie_pattern(self):
+        """Тест: общие префиксы слов объединяются в одну ветку"""
+        assert _trie_pattern(["java", "javascript", "jq"]) == (
+            "j(?:ava(?:script)?|q)"
+        )
+
+    def test_or_and_not(self):
+        """Тест: семантика any_words и exclude_words"""
+        matcher = KeywordMatcher(
+            ["developer"], any_words=["python", "go"], exclude_words=["senior", "1c"]
+        )
+        assert matcher.matches("python developer")
+        assert matcher.matches("go developer, remote")
+        assert not matcher.matches("java developer")
+        assert not matcher.matches("senior python developer")
+        assert not matcher.matches("python")
+
+    def test_empty_matcher(self):
+        """Тест: пустые и пробельные слова не задают условия"""
+        matcher = KeywordMatcher(["", "  "])
+        assert matcher.is_empty
+        assert matcher.matches("anything")
+
+
+class TestFilterVacancies:
+    """Тесты filter_vacancies с несколькими видами условий"""
+
+    def vacancies(self):
+        return [
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", company="Yandex"),
+            Vacancy("Go Developer", "https://hh.ru/vacancy/2", requirements="Docker"),
+            Vacancy("Senior Java Developer", "https://hh.ru/vacancy/3"),
+            Vacancy("JavaScript Engineer", "https://hh.ru/vacancy/4"),
+        ]
+
+    def test_any_and_exclude(self):
+        """Тест: OR и NOT вместе с обязательными словами"""
+        result = filter_vacancies(
+            self.vacancies(),
+            ["developer"],
+            any_words=["java", "go", "python", "rust"],
+            exclude_words=["senior"],
+        )
+        assert [v.url for v in result] == [
+            "https://hh.ru/vacancy/1",
+            "https://hh.ru/vacancy/2",
+        ]
+
+    def test_only_exclude(self):
+        """Тест: фильтр только по исключаемым словам"""
+        result = filter_vacancies(self.vacancies(), [], exclude_words=["JAVA"])
+        assert len(result) == 2
+
+    def test_search_text_is_cached(self):
+        """Тест: текст для поиска строится один раз и включает компанию"""
+        vacancy = self.vacancies()[0]
+        assert vacancy.search_text is vacancy.search_text
+        assert "yandex" in vacancy.search_text
@@ -0,0 +1,205 @@
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import cli  # noqa: E402
+from src.models import vacancy as vacancy_module  # noqa: E402
+from src.services.cached_search import CachedSearch  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.utils.helpers import filter_vacancies  # noqa: E402
+from src.utils.metrics import METRICS, Histogram, MetricsRegistry  # noqa: E402
+
+
+@pytest.fixture
+def metrics():
+    """Общий реестр включен на время теста"""
+    METRICS.reset()
+    METRICS.enable()
+    yield METRICS
+    METRICS.disable()
+    METRICS.reset()
+
+
+class TestHistogram:
+    def test_buckets_and_summary(self):
+        """Тест: значения раскладываются по интервалам, граница включена"""
+        histogram = Histogram(buckets=(1, 2, 5))
+        for value in (0.5, 1, 1.5, 3, 10):
+            histogram.observe(value)
+        assert histogram.counts == [2, 1, 1, 1]
+        assert (histogram.count, histogram.min, histogram.max) == (5, 0.5, 10)
+        assert histogram.mean == 3.2
+
+    def test_quantile(self):
+        """Тест: оценка квантиля внутри интервала"""
+        histogram = Histogram(buckets=(10, 20))
+        for value in range(1, 21):
+            histogram.observe(value)
+        assert histogram.quantile(0.5) == 10
+        assert histogram.quantile(0.75) == 15
+        assert histogram.quantile(1.0) == 20
+        assert Histogram().quantile(0.5) == 0.0
+
+
+class TestRegistry:
+    def test_disabled_records_nothing(self):
+        """Тест: выключенный реестр ничего не записывает"""
+        registry = MetricsRegistry()
+        registry.inc("requests_total")
+        with registry.timer("fetch_seconds"):
+            pass
+
+        @registry.timed("call_seconds")
+        def call():
+            return 42
+
+        assert call() == 42
+        assert registry.to_dict() == {"counters": {}, "histograms": {}}
+        assert registry.timer("a") is registry.timer("b")
+
+    def test_counters_and_timers(self):
+        """Тест: счетчики, таймеры и декоратор"""
+        registry = MetricsRegistry(enabled=True)
+        registry.inc("requests_total")
+        registry.inc("requests_total", 2)
+        with registry.timer("fetch_seconds"):
+            pass
+
+        @registry.timed("call_seconds")
+        def fail():
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            fail()
+        assert registry.counter("requests_total") == 3
+        assert registry.histogram("fetch_seconds").count == 1
+        assert registry.histogram("call_seconds").count == 1
+
+    def test_thread_safety(self):
+        """Тест: одновременные обновления из потоков не теряются"""
+        registry = MetricsRegistry(enabled=True)
+
+        def worker():
+            for _ in range(1000):
+                registry.inc("total")
+                registry.observe("value_seconds", 0.001)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert registry.counter("total") == 4000
+        assert registry.histogram("value_seconds").count == 4000
+
+
+class TestExport:
+    def make_registry(self):
+        registry = MetricsRegistry(enabled=True, buckets=(0.1, 1))
+        registry.inc("requests_total", 3)
+        for value in (0.05, 0.5, 2):
+            registry.observe("fetch_seconds", value)
+        return registry
+
+    def test_prometheus(self):
+        """Тест: текстовый формат Prometheus с накопленными интервалами"""
+        text = self.make_registry().to_prometheus()
+        assert "# TYPE hh_requests_total counter\nhh_requests_total 3\n" in text
+        assert 'hh_fetch_seconds_bucket{le="0.1"} 1' in text
+        assert 'hh_fetch_seconds_bucket{le="1"} 2' in text
+        assert 'hh_fetch_seconds_bucket{le="+Inf"} 3' in text
+        assert "hh_fetch_seconds_sum 2.550000" in text
+        assert "hh_fetch_seconds_count 3" in text
+
+    def test_files_and_table(self, tmp_path, capsys):
+        """Тест: выгрузка в JSON, Prometheus и таблицу"""
+        registry = self.make_registry()
+        registry.export(str(tmp_path / "metrics.json"))
+        data = json.loads((tmp_path / "metrics.json").read_text("utf-8"))
+        assert data["counters"] == {"requests_total": 3}
+        assert data["histograms"]["fetch_seconds"]["buckets"]["+Inf"] == 1
+
+        registry.export(str(tmp_path / "out" / "metrics.prom"))
+        assert "hh_fetch_seconds_count 3" in (
+            tmp_path / "out" / "metrics.prom"
+        ).read_text("utf-8")
+
+        registry.export("-")
+        table = capsys.readouterr().err
+        assert "fetch_seconds" in table
+        assert "requests_total" in table
+
+
+class TestInstrumentation:
+    def test_hot_path_stages(self, tmp_path, metrics):
+        """Тест: этапы преобразования, записи и фильтрации замеряются"""
+
+        class FakeAPI:
+            def get_vacancies(self, search_query, per_page=50):
+                return [
+                    {
+                        "name": f"Python разработчик {number}",
+                        "alternate_url": f"https://hh.ru/vacancy/{number}",
+                        "salary": {"from": 100000, "to": None, "currency": "RUR"},
+                    }
+                    for number in range(3)
+                ]
+
+        storage = JSONStorage(str(tmp_path / "vacancies.json"))
+        cache = CachedSearch(
+            FakeAPI(), storage, log_filename=str(tmp_path / "log.json")
+        )
+        cache.refresh("Python")
+        filter_vacancies(storage.get_vacancies(), ["python"])
+
+        for name in (
+            "vacancy_convert_seconds",
+            "storage_upsert_seconds",
+            "storage_commit_seconds",
+            "storage_get_seconds",
+            "filter_keywords_seconds",
+        ):
+            assert metrics.histogram(name).count == 1, name
+        assert metrics.counter("vacancies_converted_total") == 3
+        assert metrics.counter("vacancies_inserted_total") == 3
+
+    def test_cli_option(self, tmp_path, monkeypatch, capsys):
+        """Тест: ключ --metrics пакетного режима"""
+
+        class FakeAPI:
+            def get_vacancies(self, search_query, per_page=50):
+                return [{"name": "Python", "alternate_url": "https://hh.ru/vacancy/1"}]
+
+        monkeypatch.setattr(cli, "HeadHunterAPI", FakeAPI)
+        target = tmp_path / "metrics.prom"
+        try:
+            code = cli.main(
+                [
+                    "--path",
+                    str(tmp_path / "vacancies.json"),
+                    "--metrics",
+                    str(target),
+                    "fetch",
+                    "Python",
+                    "--no-fallback",
+                    "--query-log",
+                    str(tmp_path / "log.json"),
+                ]
+            )
+        finally:
+            METRICS.disable()
+            METRICS.reset()
+        text = target.read_text("utf-8")
+        assert code == cli.EXIT_OK
+        assert "hh_vacancy_convert_seconds_count 1" in text
+        assert "hh_vacancies_inserted_total 1" in text
+
+    def test_models_do_not_depend_on_metrics(self):
+        """Тест: модель не импортирует utils, конвертацию замеряют вызывающие"""
+        assert "METRICS" not in vars(vacancy_module)
@@ -0,0 +1,126 @@
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.identity import record_key  # noqa: E402
+from src.storage.mmap_storage import MmapJSONStorage  # noqa: E402
+
+
+class TestMmapJSONStorage:
+    """Тесты для хранилища JSON Lines с mmap"""
+
+    @pytest.fixture
+    def filename(self, tmp_path):
+        return str(tmp_path / "vacancies.jsonl")
+
+    @pytest.fixture
+    def storage(self, filename):
+        storage = MmapJSONStorage(filename)
+        yield storage
+        storage.close()
+
+    @pytest.fixture
+    def sample_vacancies(self):
+        return [
+            Vacancy(
+                title="Python Developer",
+                url="https://hh.ru/vacancy/1",
+                salary_from=100000,
+                salary_to=150000,
+            ),
+            Vacancy(
+                title="Java Developer",
+                url="https://hh.ru/vacancy/2",
+                salary_from=80000,
+                description="Java programming",
+            ),
+        ]
+
+    def test_add_and_get(self, storage, sample_vacancies):
+        """Тест добавления и получения вакансий"""
+        for vacancy in sample_vacancies:
+            storage.add_vacancy(vacancy)
+
+        vacancies = storage.get_vacancies()
+        assert [v.title for v in vacancies] == ["Python Developer", "Java Developer"]
+        assert len(storage) == 2
+
+    def test_get_by_keys(self, storage, sample_vacancies):
+        """Тест чтения по ключам через индекс"""
+        for vacancy in sample_vacancies:
+            storage.add_vacancy(vacancy)
+        keys = [record_key(v.to_dict()) for v in reversed(sample_vacancies)]
+        found = storage.get_by_keys(keys + ["нет\x1fтакой"])
+        assert [v and v.title for v in found] == [
+            "Java Developer",
+            "Python Developer",
+            None,
+        ]
+
+    def test_duplicate_vacancy(self, storage, sample_vacancies):
+        """Тест предотвращения дублирования"""
+        storage.add_vacancy(sample_vacancies[0])
+        storage.add_vacancy(sample_vacancies[0])
+        assert len(storage.get_vacancies()) == 1
+
+    def test_filters(self, storage, sample_vacancies):
+        """Тест фильтров с той же семантикой, что у JSONStorage"""
+        for vacancy in sample_vacancies:
+            storage.add_vacancy(vacancy)
+
+        assert [v.title for v in storage.get_vacancies(keyword="java")] == [
+            "Java Developer"
+        ]
+        assert len(storage.get_vacancies(salary_min=90000)) == 1
+        assert len(storage.get_vacancies(salary_max=200000)) == 1
+
+    def test_iter_vacancies_is_lazy(self, storage, sample_vacancies):
+        """Тест ленивой выдачи вакансий"""
+        for vacancy in sample_vacancies:
+            storage.add_vacancy(vacancy)
+
+        iterator = storage.iter_vacancies()
+        assert next(iterator).title == "Python Developer"
+
+    def test_delete_vacancy(self, storage, sample_vacancies):
+        """Тест удаления без перезаписи файла"""
+        for vacancy in sample_vacancies:
+            storage.add_vacancy(vacancy)
+        size_before = os.path.getsize(storage._filename)
+
+        storage.delete_vacancy(sample_vacancies[0])
+
+        assert [v.title for v in storage.get_vacancies()] == ["Java Developer"]
+        assert os.path.getsize(storage._filename) == size_before
+
+    def test_reopen_uses_index(self, filename, sample_vacancies):
+        """Тест повторного открытия и восстановления индекса"""
+        storage = MmapJSONStorage(filename)
+        for vacancy in sample_vacancies:
+            storage.add_vacancy(vacancy)
+        storage.delete_vacancy(sample_vacancies[1])
+        storage.close()
+
+        reopened = MmapJSONStorage(filename)
+        assert [v.title for v in reopened.get_vacancies()] == ["Python Developer"]
+        reopened.close()
+
+        os.unlink(filename + ".idx")
+        rebuilt = MmapJSONStorage(filename)
+        assert [v.title for v in rebuilt.get_vacancies()] == ["Python Developer"]
+        rebuilt.close()
+
+    def test_clear_and_compact(self, storage, sample_vacancies):
+        """Тест очистки и уплотнения"""
+        for vacancy in sample_vacancies:
+            storage.add_vacancy(vacancy)
+        storage.delete_vacancy(sample_vacancies[0])
+        storage.compact()
+        assert len(storage.get_vacancies()) == 1
+
+        storage.clear()
+        assert storage.get_vacancies() == []
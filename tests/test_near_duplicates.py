@@ -0,0 +1,210 @@
+import os
+import random
+import sys
+
+import pytest
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.abstract_storage import UpsertResult  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.storage.near_duplicates import (  # noqa: E402
+    NearDuplicateIndex,
+    find_near_duplicates,
+    shingles,
+)
+
+REQUIREMENTS = (
+    "Опыт коммерческой разработки на Python от трех лет, знание Django и "
+    "PostgreSQL, понимание принципов REST, опыт написания тестов, умение "
+    "работать с git и docker, желание развиваться в команде"
+)
+OTHER_REQUIREMENTS = "Опыт работы на кухне, санитарная книжка, умение готовить"
+
+
+def record(title, requirements=REQUIREMENTS, company="Яндекс"):
+    return {"title": title, "requirements": requirements, "company": company}
+
+
+def random_records(count, seed=5):
+    """Случайные непохожие записи"""
+    rng = random.Random(seed)
+    words = [f"слово{i}" for i in range(2000)]
+    return [
+        (
+            i,
+            record(
+                " ".join(rng.choices(words, k=4)),
+                " ".join(rng.choices(words, k=25)),
+                f"Компания {i}",
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def vacancy(number, title="Python разработчик", company="Яндекс"):
+    return Vacancy(
+        title=title,
+        url=f"https://hh.ru/vacancy/{number}",
+        salary_from=100000,
+        requirements=REQUIREMENTS if company == "Яндекс" else OTHER_REQUIREMENTS,
+        company=company,
+    )
+
+
+class TestShingles:
+    def test_word_pairs(self):
+        """Тест: шинглы — пары соседних слов всех полей"""
+        assert shingles(record("Python разработчик", "Django", "Яндекс")) == {
+            "python разработчик",
+            "разработчик django",
+            "django яндекс",
+        }
+
+    def test_short_and_empty(self):
+        """Тест: короткий и пустой текст"""
+        assert shingles(record("Python", "", "")) == {"python"}
+        assert shingles(record("", "", "")) == set()
+
+
+class TestNearDuplicateIndex:
+    def test_finds_repost(self):
+        """Тест: перепубликация с немного измененным названием находится"""
+        index = NearDuplicateIndex()
+        index.add("a", record("Python разработчик"))
+        found = index.find(record("Python разработчик (remote)"))
+        assert found is not None
+        assert found[0] == "a"
+        assert found[1] >= 0.8
+
+    def test_different_vacancy_not_found(self):
+        """Тест: другая вакансия не считается дубликатом"""
+        index = NearDuplicateIndex()
+        index.add("a", record("Python разработчик"))
+        assert index.find(record("Java разработчик", "Spring и Kafka")) is None
+
+    def test_remove_and_replace(self):
+        """Тест: удаление и замена записи по ключу"""
+        index = NearDuplicateIndex()
+        index.add("a", record("Python разработчик"))
+        index.remove("a")
+        assert len(index) == 0
+        assert index.find(record("Python разработчик")) is None
+
+        index.add("b", record("Python разработчик"))
+        index.add("b", record("Повар", "Опыт работы на кухне", "Ресторан"))
+        assert len(index) == 1
+        assert index.find(record("Python разработчик")) is None
+
+    def test_earliest_wins_on_tie(self):
+        """Тест: при равном сходстве выбирается запись, добавленная раньше"""
+        index = NearDuplicateIndex()
+        index.add("first", record("Python разработчик"))
+        index.add("second", record("Python разработчик"))
+        assert index.find(record("Python разработчик")) == ("first", 1.0)
+
+    def test_empty_record_not_indexed(self):
+        """Тест: запись без слов не индексируется"""
+        index = NearDuplicateIndex()
+        index.add("a", record("", "", ""))
+        assert "a" not in index
+        assert index.find(record("", "", "")) is None
+
+    def test_invalid_parameters(self):
+        """Тест: неверные параметры"""
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(threshold=0)
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(num_perm=64, bands=10)
+
+    def test_signature_is_stable(self):
+        """Тест: подпись не зависит от экземпляра индекса"""
+        data = record("Python разработчик")
+        first, second = NearDuplicateIndex(), NearDuplicateIndex()
+        assert first.signature(data) == second.signature(data)
+
+
+class TestClusters:
+    def test_batch_clusters(self):
+        """Тест: пакетный поиск находит подмешанные перепубликации"""
+        records = random_records(500)
+        for number in range(20):
+            data = dict(records[number][1])
+            data["title"] += " senior"
+            records.append((1000 + number, data))
+
+        clusters = find_near_duplicates(records)
+        pairs = {tuple(cluster) for cluster in clusters}
+        expected = {(number, 1000 + number) for number in range(20)}
+        # Оценка MinHash вероятностная: допускаем единичные пропуски,
+        # но не ложные совпадения
+        assert pairs <= expected
+        assert len(pairs) >= 18
+
+    def test_transitive_cluster(self):
+        """Тест: цепочка похожих записей собирается в одну группу"""
+        records = [
+            ("a", record("Python разработчик")),
+            ("b", record("Python разработчик")),
+            ("c", record("Python разработчик")),
+            ("d", record("Повар", "Опыт работы на кухне", "Ресторан")),
+        ]
+        assert find_near_duplicates(records) == [["a", "b", "c"]]
+
+
+class TestStorageIntegration:
+    def make_storage(self, tmp_path, **kwargs):
+        return JSONStorage(str(tmp_path / "vacancies.json"), **kwargs)
+
+    def test_disabled_by_default(self, tmp_path):
+        """Тест: по умолчанию отбрасываются только точные дубликаты"""
+        storage = self.make_storage(tmp_path)
+        storage.add_vacancies([vacancy(1), vacancy(2)])
+        assert len(storage.get_vacancies()) == 2
+
+    def test_add_skips_repost(self, tmp_path):
+        """Тест: перепубликация под другим URL не добавляется"""
+        storage = self.make_storage(tmp_path, near_duplicate_threshold=0.8)
+        storage.add_vacancies([vacancy(1), vacancy(2, "Python разработчик (remote)")])
+        storage.add_vacancy(vacancy(3))
+        storage.add_vacancy(vacancy(4, "Java разработчик", "Сбер"))
+        urls = [item.url for item in storage.get_vacancies()]
+        assert urls == ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/4"]
+
+    def test_upsert_counts_repost_separately(self, tmp_path):
+        """Тест: upsert считает перепубликации отдельно от неизмененных"""
+        storage = self.make_storage(tmp_path, near_duplicate_threshold=0.8)
+        assert storage.upsert_vacancies([vacancy(1)]).inserted == 1
+        result = storage.upsert_vacancies([vacancy(2), vacancy(3, "Повар", "Кафе")])
+        assert result == UpsertResult(inserted=1, near_duplicates=1)
+        assert storage.upsert_vacancies([vacancy(1)]) == UpsertResult(unchanged=1)
+
+    def test_index_follows_delete_and_reload(self, tmp_path):
+        """Тест: индекс обновляется при удалении и загрузке из файла"""
+        storage = self.make_storage(tmp_path, near_duplicate_threshold=0.8)
+        storage.add_vacancy(vacancy(1))
+        storage.delete_vacancy(vacancy(1))
+        storage.add_vacancy(vacancy(2))
+        assert len(storage.get_vacancies()) == 1
+
+        reopened = self.make_storage(tmp_path, near_duplicate_threshold=0.8)
+        reopened.add_vacancy(vacancy(3))
+        assert len(reopened.get_vacancies()) == 1
+
+    def test_batch_pass_and_removal(self, tmp_path):
+        """Тест: пакетный поиск и удаление среди уже сохраненных"""
+        storage = self.make_storage(tmp_path)
+        storage.add_vacancies(
+            [vacancy(1), vacancy(2, "Повар", "Кафе"), vacancy(3), vacancy(4)]
+        )
+        clusters = storage.near_duplicate_clusters()
+        assert [[item.url[-1] for item in group] for group in clusters] == [
+            ["1", "3", "4"]
+        ]
+
+        assert storage.remove_near_duplicates() == 2
+        assert [item.url[-1] for item in storage.get_vacancies()] == ["1", "2"]
+        assert storage.remove_near_duplicates() == 0
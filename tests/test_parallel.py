@@ -0,0 +1,88 @@
+import pytest
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.datagen import generate_vacancies  # noqa: E402
+from src.utils import parallel  # noqa: E402
+from src.utils.helpers import filter_vacancies, get_vacancies_by_salary  # noqa: E402
+from src.utils.parallel import (  # noqa: E402
+    parallel_filter_vacancies,
+    parallel_get_vacancies_by_salary,
+)
+
+
+@pytest.fixture(scope="module")
+def vacancies():
+    return generate_vacancies(2000, seed=3)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+class TestParallelHelpers:
+    """Тесты параллельных вариантов фильтрации"""
+
+    @pytest.mark.parametrize(
+        "words, options",
+        [
+            (["python"], {}),
+            (["senior", "docker"], {}),
+            ([], {"any_words": ["django", "flask"], "exclude_words": ["junior"]}),
+        ],
+    )
+    def test_filter_matches_serial(self, vacancies, pool, words, options):
+        """Тест: результат и порядок совпадают с filter_vacancies"""
+        expected = filter_vacancies(vacancies, words, **options)
+        result = parallel_filter_vacancies(
+            vacancies, words, workers=2, threshold=0, executor=pool, **options
+        )
+        assert [v.url for v in result] == [v.url for v in expected]
+
+    @pytest.mark.parametrize(
+        "salary_range", ["100000-200000", "250000", "", "abc", "300000-100000"]
+    )
+    def test_salary_matches_serial(self, vacancies, pool, salary_range):
+        """Тест: результат и порядок совпадают с get_vacancies_by_salary"""
+        expected = get_vacancies_by_salary(vacancies, salary_range)
+        result = parallel_get_vacancies_by_salary(
+            vacancies, salary_range, workers=2, threshold=0, executor=pool
+        )
+        assert [v.url for v in result] == [v.url for v in expected]
+
+    def test_texts_built_in_workers(self, vacancies):
+        """Тест: в процессы уходят поля, строка для поиска строится там"""
+        chunk = generate_vacancies(3, seed=5)
+        fields = parallel._pack_texts(chunk)
+        assert len(fields) == 12
+        assert all(vacancy._search_text is None for vacancy in chunk)
+        words = (["python"], None, None)
+        assert parallel._match_chunk(fields, words) == [
+            position
+            for position, vacancy in enumerate(chunk)
+            if "python" in vacancy.search_text
+        ]
+
+    def test_own_pool(self, vacancies):
+        """Тест: без переданного пула создается собственный"""
+        result = parallel_filter_vacancies(
+            vacancies[:100], ["python"], workers=2, threshold=0
+        )
+        assert result == filter_vacancies(vacancies[:100], ["python"])
+
+    def test_small_input_stays_serial(self, vacancies, monkeypatch):
+        """Тест: ниже порога пул процессов не используется"""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("пул не должен создаваться")
+
+        monkeypatch.setattr(parallel, "ProcessPoolExecutor", fail)
+        assert len(parallel_filter_vacancies(vacancies, ["python"], workers=4)) > 0
+        parallel_get_vacancies_by_salary(vacancies, "100000", workers=4)
+        parallel_filter_vacancies(vacancies, ["python"], workers=1, threshold=0)
@@ -0,0 +1,92 @@
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.utils.helpers import (  # noqa: E402
+    filter_vacancies,
+    get_top_vacancies,
+    get_vacancies_by_salary,
+    sort_vacancies,
+)
+from src.utils.pipeline import Query  # noqa: E402
+
+
+def sample_vacancies():
+    """Вакансии с повторяющимися зарплатами и без зарплаты"""
+    salaries = [100000, None, 150000, 100000, 80000, None, 150000, 120000]
+    return [
+        Vacancy(
+            title=f"{'Python' if i % 2 else 'Java'} Developer {i}",
+            url=f"https://hh.ru/vacancy/{i}",
+            salary_from=salary,
+            description="Backend" if i % 3 else "Frontend",
+        )
+        for i, salary in enumerate(salaries)
+    ]
+
+
+class CountingIterable:
+    """Источник, считающий проходы по себе"""
+
+    def __init__(self, items):
+        self.items = items
+        self.passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        return iter(self.items)
+
+
+class TestQuery:
+    """Тесты ленивого конвейера отбора вакансий"""
+
+    def test_matches_helpers(self):
+        """Тест: конвейер дает то же, что цепочка вспомогательных функций"""
+        vacancies = sample_vacancies()
+        expected = get_top_vacancies(
+            sort_vacancies(
+                get_vacancies_by_salary(
+                    filter_vacancies(vacancies, ["developer"]), "90000-200000"
+                )
+            ),
+            3,
+        )
+        result = Query(vacancies).keywords(["developer"]).salary("90000-200000").top(3)
+        assert result == expected
+        assert [v.url for v in result] == [v.url for v in expected]
+
+    def test_top_is_stable_and_keeps_unsalaried_last(self):
+        """Тест: порядок top совпадает с sort_vacancies, включая равные"""
+        vacancies = sample_vacancies()
+        expected = sort_vacancies(vacancies)
+        for top_n in range(len(vacancies) + 2):
+            result = Query(vacancies).top(top_n)
+            assert [v.url for v in result] == [v.url for v in expected[:top_n]]
+
+    def test_single_pass_over_source(self):
+        """Тест: все условия и top — один проход по источнику"""
+        source = CountingIterable(sample_vacancies())
+        Query(source).keywords(["python"]).with_salary().salary("50000").top(2)
+        assert source.passes == 1
+
+    def test_queries_are_immutable(self):
+        """Тест: добавление условия не меняет исходный конвейер"""
+        base = Query(sample_vacancies())
+        python = base.keywords(["python"])
+        assert base.count() == 8
+        assert python.count() == 4
+
+    def test_empty_and_invalid_criteria(self):
+        """Тест: пустые критерии не фильтруют, неверный диапазон — все"""
+        vacancies = sample_vacancies()
+        assert Query(vacancies).keywords(["  "]).salary("").count() == 8
+        assert Query(vacancies).salary("abc").to_list() == []
+        assert Query(vacancies).top(0) == []
+
+    def test_sorted_and_where(self):
+        """Тест: sorted и произвольное условие"""
+        result = Query(sample_vacancies()).where(lambda v: "Java" in v.title).sorted()
+        assert [v.avg_salary for v in result] == [150000, 150000, 100000, 80000]
@@ -0,0 +1,119 @@
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.storage.mmap_storage import MmapJSONStorage  # noqa: E402
+from src.storage.query import VacancyQuery  # noqa: E402
+
+
+def make_vacancies():
+    """Вакансии с разными зарплатами, включая равные и отсутствующие"""
+    return [
+        Vacancy("Python Junior", "https://hh.ru/vacancy/1", salary_from=60000),
+        Vacancy("Python Middle", "https://hh.ru/vacancy/2", 120000, 160000),
+        Vacancy("Java Middle", "https://hh.ru/vacancy/3", salary_from=140000),
+        Vacancy("Python Intern", "https://hh.ru/vacancy/4"),
+        Vacancy("Python Senior", "https://hh.ru/vacancy/5", salary_to=250000),
+        Vacancy("Go Middle", "https://hh.ru/vacancy/6", salary_from=140000),
+    ]
+
+
+class TestVacancyQuery:
+    """Тесты объекта запроса"""
+
+    def test_from_kwargs_ignores_unknown(self):
+        """Тест: неизвестные критерии игнорируются"""
+        query = VacancyQuery.from_kwargs(keyword="python", unknown=1)
+        assert query.filters() == {"keyword": "python"}
+
+    def test_validation(self):
+        """Тест проверки параметров"""
+        with pytest.raises(ValueError):
+            VacancyQuery(order_by="-price")
+        with pytest.raises(ValueError):
+            VacancyQuery(limit=-1)
+
+    def test_order_properties(self):
+        """Тест разбора поля сортировки"""
+        query = VacancyQuery(order_by="-avg", limit=5, offset=10)
+        assert query.order_field == "avg"
+        assert query.descending
+        assert query.stop == 15
+
+
+@pytest.fixture(params=["json", "jsonl"])
+def storage(request, tmp_path):
+    """Хранилища с планировщиком и базовой реализацией query"""
+    if request.param == "json":
+        storage = JSONStorage(str(tmp_path / "vacancies.json"))
+    else:
+        storage = MmapJSONStorage(str(tmp_path / "vacancies.jsonl"))
+    for vacancy in make_vacancies():
+        storage.add_vacancy(vacancy)
+    return storage
+
+
+class TestStorageQuery:
+    """Тесты выполнения запросов в хранилищах"""
+
+    def titles(self, vacancies):
+        return [v.title for v in vacancies]
+
+    def test_limit_offset(self, storage):
+        """Тест окна выдачи в порядке добавления"""
+        result = storage.query(VacancyQuery(keyword="python", limit=2, offset=1))
+        assert self.titles(result) == ["Python Middle", "Python Intern"]
+
+    def test_order_by_salary_desc(self, storage):
+        """Тест сортировки по убыванию: равные — в порядке добавления"""
+        result = storage.query(VacancyQuery(order_by="-avg"))
+        assert self.titles(result) == [
+            "Python Senior",
+            "Python Middle",
+            "Java Middle",
+            "Go Middle",
+            "Python Junior",
+            "Python Intern",
+        ]
+
+    def test_order_by_salary_asc_with_filter(self, storage):
+        """Тест сортировки по возрастанию с фильтром и лимитом"""
+        query = VacancyQuery(keyword="python", order_by="salary_from", limit=3)
+        assert self.titles(storage.query(query)) == [
+            "Python Intern",
+            "Python Senior",
+            "Python Junior",
+        ]
+
+    def test_order_by_title(self, storage):
+        """Тест сортировки по названию"""
+        query = VacancyQuery(salary_min=100000, order_by="title")
+        assert self.titles(storage.query(query)) == [
+            "Go Middle",
+            "Java Middle",
+            "Python Middle",
+        ]
+
+    def test_get_vacancies_accepts_window(self, storage):
+        """Тест: get_vacancies принимает order_by и limit"""
+        result = storage.get_vacancies(order_by="-avg", limit=1)
+        assert self.titles(result) == ["Python Senior"]
+
+    def test_query_stops_at_limit(self, storage, monkeypatch):
+        """Тест: вакансии создаются только для выданных строк"""
+        created = []
+        original = Vacancy.from_dict.__func__
+
+        def counting_from_dict(cls, data):
+            created.append(data["title"])
+            return original(cls, data)
+
+        monkeypatch.setattr(Vacancy, "from_dict", classmethod(counting_from_dict))
+        iterator = iter(storage.query(VacancyQuery(offset=2, limit=3)))
+        assert next(iterator).title == "Java Middle"
+        assert created == ["Java Middle"]
@@ -0,0 +1,159 @@
+import io
+import os
+import sys
+
+import pytest
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.utils.helpers import print_vacancies  # noqa: E402
+from src.utils.render import (  # noqa: E402
+    Pager,
+    format_table_row,
+    render_vacancies,
+    write_vacancies,
+)
+
+
+def make_vacancies(count):
+    return [
+        Vacancy(
+            title=f"Python Developer {i}",
+            url=f"https://hh.ru/vacancy/{i}",
+            salary_from=100000 + i,
+            company=f"Компания {i}",
+            requirements="Опыт от 3 лет",
+        )
+        for i in range(count)
+    ]
+
+
+class CountingWrites(io.StringIO):
+    """Поток, считающий вызовы write"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class CountingVacancy(Vacancy):
+    """Вакансия, считающая свое форматирование"""
+
+    formatted = 0
+
+    def __str__(self):
+        CountingVacancy.formatted += 1
+        return super().__str__()
+
+
+class TestPrintVacancies:
+    def test_same_output_as_before(self, capsys):
+        """Тест: вывод совпадает с прежним построчным print"""
+        vacancies = make_vacancies(3)
+        print_vacancies(vacancies)
+        output = capsys.readouterr().out
+
+        expected = io.StringIO()
+        for i, vacancy in enumerate(vacancies, 1):
+            print(f"\n{'='*60}", file=expected)
+            print(f"Вакансия #{i}", file=expected)
+            print(f"{'='*60}", file=expected)
+            print(vacancy, file=expected)
+            print(file=expected)
+        assert output == expected.getvalue()
+
+    def test_empty(self, capsys):
+        """Тест: пустой список"""
+        print_vacancies([])
+        assert capsys.readouterr().out == "Вакансии не найдены\n"
+
+    def test_single_write(self):
+        """Тест: весь список выводится одной записью"""
+        out = CountingWrites()
+        write_vacancies(make_vacancies(500), out)
+        assert out.writes == 1
+        assert "Вакансия #500" in out.getvalue()
+
+
+class TestCompactTable:
+    def test_row_per_vacancy(self):
+        """Тест: одна строка таблицы на вакансию плюс заголовок"""
+        text = render_vacancies(make_vacancies(5), compact=True)
+        lines = text.splitlines()
+        assert len(lines) == 2 + 5
+        assert "Вакансия" in lines[0]
+        assert lines[2].split("|")[0].strip() == "1"
+
+    def test_long_values_truncated(self):
+        """Тест: длинные значения обрезаются, ширина строки постоянна"""
+        short = make_vacancies(1)[0]
+        long = Vacancy(
+            title="Очень " * 30 + "длинное название",
+            url="https://hh.ru/vacancy/x",
+            salary_from=100000,
+            company="Компания\nс переводом строки " * 5,
+        )
+        row = format_table_row(1, long)
+        assert "\n" not in row.rstrip("\n")
+        assert "…" in row
+        assert row.index("|", 10) == format_table_row(1, short).index("|", 10)
+
+
+class TestPager:
+    def test_only_visible_page_formatted(self):
+        """Тест: форматируется только видимая страница"""
+        vacancies = [
+            CountingVacancy(title=f"V{i}", url=f"https://hh.ru/vacancy/{i}")
+            for i in range(1000)
+        ]
+        CountingVacancy.formatted = 0
+        text = Pager(vacancies, page_size=20).render_page(3)
+        assert CountingVacancy.formatted == 20
+        assert "Вакансия #61" in text and "Вакансия #80" in text
+        assert "Вакансия #81" not in text
+        assert "Страница 4 из 50" in text
+
+    def test_last_page_partial(self):
+        """Тест: неполная последняя страница"""
+        pager = Pager(make_vacancies(45), page_size=20, compact=True)
+        assert pager.pages == 3
+        assert len(pager.render_page(2).splitlines()) == 2 + 5 + 2
+
+    def test_show_stops_on_quit(self):
+        """Тест: вывод прекращается по ответу q"""
+        out = CountingWrites()
+        answers = iter(["", "q"])
+        shown = Pager(make_vacancies(100), page_size=10).show(
+            out, lambda prompt: next(answers)
+        )
+        assert shown == 2
+        assert out.writes == 2
+        assert "Страница 2 из 10" in out.getvalue()
+
+    def test_show_all_pages(self):
+        """Тест: без прерывания выводятся все страницы"""
+        out = io.StringIO()
+        prompts = []
+        shown = Pager(make_vacancies(25), page_size=10).show(
+            out, lambda prompt: prompts.append(prompt) or ""
+        )
+        assert shown == 3
+        # После последней страницы вопрос не задается
+        assert len(prompts) == 2
+
+    def test_show_empty(self):
+        """Тест: пустой список"""
+        out = io.StringIO()
+        assert Pager([]).show(out, lambda prompt: "") == 0
+        assert out.getvalue() == "Вакансии не найдены\n"
+
+    def test_invalid_page_size(self):
+        """Тест: неположительный размер страницы"""
+        with pytest.raises(ValueError):
+            Pager([], page_size=0)
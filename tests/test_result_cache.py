@@ -0,0 +1,141 @@
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+
+
+def vacancies(count, start=0):
+    return [
+        Vacancy(
+            f"Python Developer {i}",
+            f"https://hh.ru/vacancy/{i}",
+            salary_from=1000 * i,
+            requirements="Python",
+        )
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = JSONStorage(str(tmp_path / "v.json"), cache_size=4)
+    storage.add_vacancies(vacancies(10))
+    return storage
+
+
+@pytest.fixture
+def executions(storage, monkeypatch):
+    """Счетчик реальных выполнений запросов"""
+    calls = []
+    execute_rows = storage._execute_rows
+
+    def counting(query):
+        calls.append(query)
+        return execute_rows(query)
+
+    monkeypatch.setattr(storage, "_execute_rows", counting)
+    return calls
+
+
+class TestResultCache:
+    """Тесты кэша результатов get_vacancies"""
+
+    def test_repeated_query_hits_cache(self, storage, executions):
+        """Тест: повторный запрос не выполняется заново"""
+        first = storage.get_vacancies(keyword="python", salary_min=5000)
+        second = storage.get_vacancies(salary_min=5000, keyword="python")
+
+        assert len(executions) == 1
+        assert [v.url for v in first] == [v.url for v in second]
+        assert first is not second
+
+    def test_keywords_list_and_tuple_share_entry(self, storage, executions):
+        """Тест: список и кортеж ключевых слов — один и тот же запрос"""
+        storage.get_vacancies(keywords=["python", "developer"])
+        storage.get_vacancies(keywords=("python", "developer"))
+        assert len(executions) == 1
+
+    def test_mutation_invalidates(self, storage, executions):
+        """Тест: изменение данных сбрасывает кэш"""
+        assert len(storage.get_vacancies()) == 10
+        storage.add_vacancy(vacancies(1, start=10)[0])
+        assert len(storage.get_vacancies()) == 11
+
+        storage.delete_vacancy(vacancies(1)[0])
+        assert len(storage.get_vacancies()) == 10
+
+        storage.clear()
+        assert storage.get_vacancies() == []
+        assert len(executions) == 4
+
+    def test_upsert_update_invalidates(self, storage):
+        """Тест: обновление вакансии на месте видно сразу"""
+        assert storage.get_vacancies(salary_min=100000) == []
+        changed = Vacancy(
+            "Python Developer 3", "https://hh.ru/vacancy/3", salary_from=200000
+        )
+        storage.upsert_vacancies([changed])
+        assert [v.url for v in storage.get_vacancies(salary_min=100000)] == [
+            "https://hh.ru/vacancy/3"
+        ]
+
+    def test_other_instance_write_invalidates(self, storage):
+        """Тест: запись другим экземпляром сбрасывает кэш при чтении"""
+        assert len(storage.get_vacancies()) == 10
+        JSONStorage(storage._filename).add_vacancy(vacancies(1, start=20)[0])
+        assert len(storage.get_vacancies()) == 11
+
+    def test_hit_skips_file_lock(self, storage, monkeypatch):
+        """Тест: без изменений файла попадание в кэш не берет блокировку"""
+        storage.get_vacancies(keyword="python")
+
+        def locked():
+            raise AssertionError("блокировка файла")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(storage._file_lock, "shared", locked)
+            assert len(storage.get_vacancies(keyword="python")) == 10
+
+        JSONStorage(storage.filename).add_vacancies(vacancies(1, start=10))
+        assert len(storage.get_vacancies(keyword="python")) == 11
+
+    def test_lru_is_bounded(self, storage, executions):
+        """Тест: кэш хранит не больше cache_size запросов"""
+        for salary in range(6):
+            storage.get_vacancies(salary_min=salary * 1000)
+        assert len(storage._result_cache) == 4
+
+        # Последний запрос в кэше, первый вытеснен
+        storage.get_vacancies(salary_min=5000)
+        storage.get_vacancies(salary_min=0)
+        assert len(executions) == 7
+
+    def test_expired_result_is_recomputed(self, tmp_path):
+        """Тест: просрочка записи из результата сбрасывает его"""
+        now = [1_000_000.0]
+        storage = JSONStorage(str(tmp_path / "v.json"), ttl=60)
+        storage._now = lambda: now[0]
+        storage.add_vacancies(vacancies(2))
+        now[0] += 30
+        storage.add_vacancies(vacancies(1, start=5))
+        assert len(storage.get_vacancies()) == 3
+
+        now[0] += 31
+        assert [v.url for v in storage.get_vacancies()] == ["https://hh.ru/vacancy/5"]
+
+    def test_cache_disabled(self, tmp_path):
+        """Тест: cache_size=0 отключает кэш"""
+        storage = JSONStorage(str(tmp_path / "v.json"), cache_size=0)
+        storage.add_vacancies(vacancies(3))
+        assert len(storage.get_vacancies()) == 3
+        assert not storage._result_cache
+
+    def test_negative_cache_size(self, tmp_path):
+        """Тест: отрицательный размер кэша недопустим"""
+        with pytest.raises(ValueError):
+            JSONStorage(str(tmp_path / "v.json"), cache_size=-1)
@@ -0,0 +1,60 @@
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.storage.salary_index import SalaryIndexes  # noqa: E402
+
+
+class TestSalaryIndexes:
+    """Тесты отсортированных зарплатных индексов"""
+
+    def build_indexes(self):
+        records = {
+            1: {"salary_from": 100000, "salary_to": 150000},
+            2: {"salary_from": 80000, "salary_to": None},
+            3: {"salary_from": None, "salary_to": None},
+            4: {"salary_from": 90000, "salary_to": 160000},
+        }
+        indexes = SalaryIndexes()
+        indexes.rebuild(records)
+        return indexes, records
+
+    def test_range(self):
+        """Тест диапазонного запроса по bisect"""
+        indexes, _ = self.build_indexes()
+        assert list(indexes["salary_from"].range(85000)) == [4, 1]
+        assert list(indexes["salary_to"].range(None, 155000)) == [1]
+        assert indexes["avg"].count_range(100000, 130000) == 2
+
+    def test_records_without_salary_not_indexed(self):
+        """Тест: вакансии без зарплаты не попадают в индекс"""
+        indexes, _ = self.build_indexes()
+        assert 3 not in indexes["avg"].range()
+        assert len(indexes["salary_to"]) == 2
+
+    def test_top_is_stable(self):
+        """Тест топ N: равные зарплаты в порядке добавления"""
+        indexes, _ = self.build_indexes()
+        indexes.add(5, {"salary_from": 200000, "salary_to": None})
+        assert indexes["avg"].top(3) == [5, 1, 4]
+        assert indexes["avg"].top(0) == []
+
+    def test_incremental_add_remove(self):
+        """Тест добавления и удаления без пересортировки"""
+        indexes, records = self.build_indexes()
+        indexes.remove(1, records[1])
+        indexes.add(6, {"salary_from": 300000, "salary_to": None})
+        assert indexes["salary_from"].top(2) == [6, 4]
+        assert list(indexes["avg"].range(120000)) == [4, 6]
+
+    def test_unknown_field(self):
+        """Тест ошибки для неизвестного поля"""
+        indexes, _ = self.build_indexes()
+        try:
+            indexes["median"]
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Ожидалась ошибка ValueError")
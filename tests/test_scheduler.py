@@ -0,0 +1,242 @@
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import cli  # noqa: E402
+from src.services.cached_search import CachedSearch  # noqa: E402
+from src.services.scheduler import (  # noqa: E402
+    RefreshScheduler,
+    read_saved_searches,
+)
+from src.storage.json_storage import JSONStorage  # noqa: E402
+
+
+def hh_item(number, query="Python"):
+    return {
+        "name": f"{query} разработчик {number}",
+        "alternate_url": f"https://hh.ru/vacancy/{query}-{number}",
+        "salary": {"from": 100000, "to": None, "currency": "RUR"},
+        "snippet": {"requirement": "Django"},
+        "employer": {"name": "Компания"},
+    }
+
+
+class FakeAPI:
+    """API с ответом по запросу и подсчетом одновременных вызовов"""
+
+    def __init__(self, responses=None, delay=0.0):
+        self.responses = responses or {}
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_vacancies(self, search_query, per_page=50):
+        with self._lock:
+            self.calls.append(search_query)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            response = self.responses.get(search_query, [hh_item(1, search_query)])
+            if isinstance(response, Exception):
+                raise response
+            return response
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class ClockScheduler(RefreshScheduler):
+    """Планировщик с управляемыми часами"""
+
+    now = 1000.0
+
+    def _now(self):
+        return self.now
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return JSONStorage(str(tmp_path / "vacancies.json"))
+
+
+def make_cache(tmp_path, storage, api):
+    return CachedSearch(api, storage, log_filename=str(tmp_path / "log.json"))
+
+
+class TestSchedule:
+    def test_new_search_runs_and_reschedules(self, tmp_path, storage):
+        """Тест: новый поиск выполняется сразу, результаты в хранилище"""
+        api = FakeAPI()
+        scheduler = ClockScheduler(make_cache(tmp_path, storage, api), jitter=0)
+        scheduler.add("Python", interval=600)
+        assert scheduler.next_due() == 1000.0
+
+        scheduler.now = 1005.0
+        for future in scheduler.run_pending():
+            future.result()
+        search = scheduler.searches[0]
+        assert (search.runs, search.last_fetched, search.last_error) == (1, 1, None)
+        assert search.last_start_delay == 5.0
+        assert search.next_run == 1605.0
+        assert len(storage.get_vacancies()) == 1
+        assert scheduler.run_pending() == []
+        scheduler.close()
+
+    def test_fresh_results_not_refetched(self, tmp_path, storage):
+        """Тест: свежие результаты из журнала не запрашиваются повторно"""
+        cache = make_cache(tmp_path, storage, FakeAPI())
+        cache.refresh("Python")
+        scheduler = RefreshScheduler(cache, jitter=0)
+        search = scheduler.add("python", interval=600)
+        assert search.next_run > time.time() + 590
+        assert scheduler.run_pending() == []
+
+    def test_jitter_spreads_runs(self, tmp_path, storage):
+        """Тест: интервалы смещаются в пределах jitter"""
+        scheduler = ClockScheduler(
+            make_cache(tmp_path, storage, FakeAPI()), jitter=0.1, seed=3
+        )
+        for number in range(10):
+            scheduler.add(f"запрос {number}", interval=100)
+        for future in scheduler.run_pending():
+            future.result()
+        runs = [search.next_run - 1000.0 for search in scheduler.searches]
+        assert all(90 <= delay <= 110 for delay in runs)
+        assert len(set(runs)) == 10
+        scheduler.close()
+
+    def test_bounded_concurrency(self, tmp_path, storage):
+        """Тест: одновременно выполняется не больше concurrency обновлений"""
+        api = FakeAPI(delay=0.05)
+        scheduler = RefreshScheduler(
+            make_cache(tmp_path, storage, api), concurrency=2
+        )
+        for number in range(6):
+            scheduler.add(f"запрос {number}", interval=600)
+        assert len(scheduler.run_pending()) == 6
+        scheduler.wait()
+        assert api.max_active == 2
+        assert len(storage.get_vacancies()) == 6
+        scheduler.close()
+
+    def test_failures_back_off(self, tmp_path, storage):
+        """Тест: после неудач повтор с удвоением задержки, не реже интервала"""
+        api = FakeAPI({"Python": RuntimeError("timeout"), "Java": []})
+        scheduler = ClockScheduler(
+            make_cache(tmp_path, storage, api), jitter=0, retry_delay=10
+        )
+        python = scheduler.add("Python", interval=30)
+        java = scheduler.add("Java", interval=30)
+
+        delays = []
+        for _ in range(3):
+            scheduler.now = python.next_run
+            for future in scheduler.run_pending():
+                future.result()
+            delays.append(python.next_run - scheduler.now)
+        assert delays == [10, 20, 30]
+        assert (python.failures, python.last_error) == (3, "timeout")
+        assert java.last_error == "пустой ответ"
+
+        api.responses["Python"] = [hh_item(1)]
+        scheduler.now = python.next_run
+        for future in scheduler.run_pending():
+            future.result()
+        assert python.consecutive_failures == 0
+        assert python.failures == 3
+        scheduler.close()
+
+    def test_status_lag(self, tmp_path, storage):
+        """Тест: возраст данных и отставание от интервала"""
+        scheduler = ClockScheduler(make_cache(tmp_path, storage, FakeAPI()), jitter=0)
+        scheduler.add("Python", interval=60)
+        assert scheduler.status()[0]["staleness"] is None
+        for future in scheduler.run_pending():
+            future.result()
+
+        scheduler.now = 1100.0
+        row = scheduler.status()[0]
+        assert (row["staleness"], row["lag"]) == (100.0, 40.0)
+        assert row["runs"] == 1
+        scheduler.close()
+
+    def test_run_forever_and_stop(self, tmp_path, storage):
+        """Тест: расписание обслуживается в фоне до stop"""
+        api = FakeAPI()
+        scheduler = RefreshScheduler(make_cache(tmp_path, storage, api), jitter=0)
+        scheduler.add("Python", interval=0.05)
+        thread = threading.Thread(target=scheduler.run_forever, daemon=True)
+        thread.start()
+        time.sleep(0.4)
+        scheduler.close()
+        thread.join(2)
+        assert not thread.is_alive()
+        assert len(api.calls) >= 3
+
+    def test_remove_and_validation(self, tmp_path, storage):
+        """Тест: удаление поиска и неверные параметры"""
+        scheduler = RefreshScheduler(make_cache(tmp_path, storage, FakeAPI()))
+        scheduler.add("Python", interval=60)
+        assert scheduler.remove(" python ")
+        assert not scheduler.remove("Python")
+        with pytest.raises(ValueError):
+            scheduler.add("Python", interval=0)
+        with pytest.raises(ValueError):
+            scheduler.add("  ", interval=60)
+        with pytest.raises(ValueError):
+            RefreshScheduler(scheduler._cache, jitter=1)
+
+
+class TestSavedSearchesFile:
+    def test_read(self, tmp_path):
+        """Тест: чтение файла сохраненных поисков"""
+        path = tmp_path / "saved.json"
+        path.write_text(
+            json.dumps([{"query": "Python", "interval": 600, "per_page": 20}]),
+            "utf-8",
+        )
+        assert read_saved_searches(str(path)) == [
+            {"query": "Python", "interval": 600.0, "per_page": 20}
+        ]
+
+        path.write_text(json.dumps([{"query": "Python"}]), "utf-8")
+        with pytest.raises(ValueError):
+            read_saved_searches(str(path))
+
+    def test_cli_once(self, tmp_path, monkeypatch, capsys):
+        """Тест: команда schedule --once"""
+        api = FakeAPI({"Java": RuntimeError("нет сети")})
+        monkeypatch.setattr(cli, "HeadHunterAPI", lambda: api)
+        path = tmp_path / "saved.json"
+        path.write_text(
+            json.dumps(
+                [{"query": "Python", "interval": 60}, {"query": "Java", "interval": 60}]
+            ),
+            "utf-8",
+        )
+        code = cli.main(
+            [
+                "--path",
+                str(tmp_path / "vacancies.json"),
+                "schedule",
+                str(path),
+                "--once",
+                "--query-log",
+                str(tmp_path / "log.json"),
+                "--json",
+            ]
+        )
+        status = json.loads(capsys.readouterr().out)
+        assert code == cli.EXIT_INCOMPLETE
+        assert [row["runs"] for row in status] == [1, 1]
+        assert status[1]["last_error"] == "нет сети"
@@ -0,0 +1,134 @@
+import random
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.search.bm25 import BM25Index  # noqa: E402
+from src.search.engine import VacancySearchEngine, rank_vacancies  # noqa: E402
+from src.search.stemmer import stem  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+
+
+def sample_vacancies():
+    return [
+        Vacancy(
+            "Python разработчик",
+            "https://hh.ru/vacancy/1",
+            description="Разработка backend-сервисов",
+            requirements="Опыт разработки на Python от 3 лет",
+        ),
+        Vacancy(
+            "Аналитик данных",
+            "https://hh.ru/vacancy/2",
+            description="Ищем аналитика в команду разработчиков",
+            requirements="SQL, Python",
+        ),
+        Vacancy(
+            "Java Developer",
+            "https://hh.ru/vacancy/3",
+            description="Spring, микросервисы",
+            requirements="Java 17",
+        ),
+    ]
+
+
+class TestStemmer:
+    """Тесты стеммера русского языка"""
+
+    @pytest.mark.parametrize(
+        "word, expected",
+        [
+            ("разработчика", "разработчик"),
+            ("разработчиков", "разработчик"),
+            ("программированию", "программирован"),
+            ("красивая", "красив"),
+            ("работающих", "работа"),
+            ("важнейшие", "важн"),
+            ("развивающийся", "развива"),
+            ("python", "python"),
+        ],
+    )
+    def test_stem(self, word, expected):
+        assert stem(word) == expected
+
+
+class TestBM25Index:
+    """Тесты индекса BM25"""
+
+    def test_inflected_forms_match(self):
+        """Тест: формы слова находят друг друга, название весит больше"""
+        results = rank_vacancies(sample_vacancies(), "разработчики")
+        assert [v.url for v, _ in results] == [
+            "https://hh.ru/vacancy/1",
+            "https://hh.ru/vacancy/2",
+        ]
+        assert results[0][1] > results[1][1] > 0
+
+    def test_unknown_terms(self):
+        """Тест: запрос без известных слов ничего не находит"""
+        assert rank_vacancies(sample_vacancies(), "кобол") == []
+        assert rank_vacancies(sample_vacancies(), "python", top_k=0) == []
+
+    def test_early_termination_keeps_exact_top(self):
+        """Тест: top-k с отсечением совпадает с полным ранжированием"""
+        rng = random.Random(7)
+        vocabulary = "python django sql docker разработчик аналитик данных".split()
+        vocabulary += ["java", "go", "linux"]
+        index = BM25Index.build(
+            (
+                str(i),
+                {
+                    "title": " ".join(rng.choices(vocabulary, k=rng.randint(1, 3))),
+                    "description": " ".join(rng.choices(vocabulary, k=10)),
+                },
+            )
+            for i in range(300)
+        )
+        for query in ("python", "python sql docker", "аналитик данных go linux"):
+            full = index.search(query, top_k=300)
+            for top_k in (1, 5, 20):
+                assert index.search(query, top_k) == full[:top_k]
+
+    def test_payload_roundtrip(self):
+        """Тест: сериализованный индекс дает те же результаты"""
+        index = BM25Index.build((v.url, v.to_dict()) for v in sample_vacancies())
+        restored = BM25Index.from_payload(index.to_payload())
+        assert restored.search("python разработка") == index.search(
+            "python разработка"
+        )
+
+
+class TestVacancySearchEngine:
+    """Тесты поиска по хранилищу"""
+
+    def test_index_persisted_and_reused(self, tmp_path, monkeypatch):
+        """Тест: при повторном открытии индекс читается с диска"""
+        storage = JSONStorage(str(tmp_path / "v.json"))
+        storage.add_vacancies(sample_vacancies())
+        first = VacancySearchEngine(storage).search("python")
+        assert os.path.exists(str(tmp_path / "v.json.bm25.json"))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("индекс не должен перестраиваться")
+
+        monkeypatch.setattr(BM25Index, "build", fail)
+        engine = VacancySearchEngine(JSONStorage(str(tmp_path / "v.json")))
+        assert engine.search("python") == first
+
+    def test_rebuild_after_storage_change(self, tmp_path):
+        """Тест: изменение хранилища перестраивает индекс"""
+        storage = JSONStorage(str(tmp_path / "v.json"))
+        storage.add_vacancies(sample_vacancies())
+        engine = VacancySearchEngine(storage)
+        assert engine.search("golang") == []
+
+        storage.add_vacancy(Vacancy("Golang разработчик", "https://hh.ru/vacancy/9"))
+        results = engine.search("golang")
+        assert [v.url for v, _ in results] == ["https://hh.ru/vacancy/9"]
+
+        storage.delete_vacancy(results[0][0])
+        assert engine.search("golang") == []
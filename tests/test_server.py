@@ -0,0 +1,179 @@
+import json
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.server import VacancyHTTPServer, VacancyService  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.utils.helpers import (  # noqa: E402
+    filter_vacancies,
+    get_top_vacancies,
+    get_vacancies_by_salary,
+    sort_vacancies,
+)
+
+
+def make_vacancies():
+    rows = [
+        ("Python разработчик", 100000, 150000, "Django, PostgreSQL"),
+        ("Java разработчик", 200000, None, "Spring"),
+        ("Python senior", 250000, 300000, "Django, Kafka"),
+        ("Тестировщик", None, None, "Python, pytest"),
+        ("Python junior", 60000, 80000, "Flask"),
+    ]
+    return [
+        Vacancy(
+            title=title,
+            url=f"https://hh.ru/vacancy/{number}",
+            salary_from=salary_from,
+            salary_to=salary_to,
+            requirements=requirements,
+            company=f"Компания {number % 2}",
+        )
+        for number, (title, salary_from, salary_to, requirements) in enumerate(rows)
+    ]
+
+
+def titles(response):
+    return [item["title"] for item in response["items"]]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = JSONStorage(str(tmp_path / "vacancies.json"))
+    storage.add_vacancies(make_vacancies())
+    return storage
+
+
+@pytest.fixture
+def service(storage):
+    return VacancyService(storage, refresh_interval=0)
+
+
+class TestService:
+    def test_search_matches_helpers(self, service):
+        """Тест: поиск совпадает с filter_vacancies и get_vacancies_by_salary"""
+        vacancies = make_vacancies()
+        expected = get_vacancies_by_salary(
+            filter_vacancies(vacancies, ["python"]), "100000-300000"
+        )
+        response = service.search(keywords=["python"], salary_range="100000-300000")
+        assert titles(response) == [vacancy.title for vacancy in expected]
+        assert response["total"] == len(expected)
+
+    def test_search_order_and_window(self, service):
+        """Тест: порядок по зарплате, limit и offset"""
+        response = service.search(keywords=["python"], order="salary", limit=2)
+        assert titles(response) == ["Python senior", "Python разработчик"]
+        assert response["total"] == 4
+        response = service.search(order="salary", limit=2, offset=3)
+        assert titles(response) == ["Python junior", "Тестировщик"]
+        with pytest.raises(ValueError):
+            service.search(order="title")
+
+    def test_top_matches_helpers(self, service):
+        """Тест: топ совпадает с sort_vacancies + get_top_vacancies"""
+        expected = get_top_vacancies(sort_vacancies(make_vacancies()), 10)
+        assert titles(service.top(10)) == [vacancy.title for vacancy in expected]
+        assert titles(service.top(1, exclude_words=["senior"])) == [
+            "Java разработчик"
+        ]
+
+    def test_salary_range(self, service):
+        """Тест: диапазон зарплат, неверный формат — ничего не найдено"""
+        assert titles(service.salary_range("80000")) == [
+            "Python разработчик",
+            "Java разработчик",
+            "Python senior",
+        ]
+        assert service.salary_range("много")["total"] == 0
+        assert service.salary_range("")["total"] == 5
+
+    def test_stats(self, service):
+        """Тест: статистика в формате src.cli stats --json"""
+        stats = service.stats()
+        assert stats["total"] == 5
+        assert stats["by_currency"]["RUR"]["count"] == 4
+
+    def test_cache_and_refresh(self, storage):
+        """Тест: ответы кэшируются до изменения хранилища"""
+        service = VacancyService(storage, refresh_interval=0)
+        first = service.search(keywords=["python"])
+        assert service.search(keywords=["python"]) is first
+        assert service.health()["cache"]["hits"] == 1
+
+        storage.add_vacancy(Vacancy("Python lead", "https://hh.ru/vacancy/9"))
+        assert service.search(keywords=["python"])["total"] == 5
+        assert service.health()["vacancies"] == 6
+
+    def test_refresh_interval(self, storage):
+        """Тест: до истечения интервала снимок не перечитывается"""
+        service = VacancyService(storage, refresh_interval=3600)
+        service.snapshot()
+        storage.add_vacancy(Vacancy("Python lead", "https://hh.ru/vacancy/9"))
+        assert service.health()["vacancies"] == 5
+
+
+class TestHTTP:
+    @pytest.fixture
+    def base_url(self, service):
+        server = VacancyHTTPServer(("127.0.0.1", 0), service, workers=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    def get(self, url):
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                return response.status, json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as error:
+            return error.code, json.loads(error.read().decode("utf-8"))
+
+    def test_routes(self, base_url):
+        """Тест: маршруты и параметры запроса"""
+        status, body = self.get(
+            f"{base_url}/search?keyword=python&keyword=django&order=salary"
+        )
+        assert status == 200
+        assert titles(body) == ["Python senior", "Python разработчик"]
+
+        status, body = self.get(f"{base_url}/top?n=1")
+        assert titles(body) == ["Python senior"]
+        status, body = self.get(f"{base_url}/salary-range?range=50000-100000")
+        assert titles(body) == ["Python junior"]
+        status, body = self.get(f"{base_url}/stats")
+        assert body["total"] == 5
+        status, body = self.get(f"{base_url}/health")
+        assert body["vacancies"] == 5
+
+    def test_errors(self, base_url):
+        """Тест: неизвестный маршрут и неверные параметры"""
+        assert self.get(f"{base_url}/nothing")[0] == 404
+        status, body = self.get(f"{base_url}/top?n=abc")
+        assert status == 400
+        assert "n" in body["error"]
+
+    def test_concurrent_requests(self, base_url):
+        """Тест: одновременные запросы обрабатываются пулом"""
+        results = []
+
+        def worker():
+            results.append(self.get(f"{base_url}/search?keyword=python")[1]["total"])
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [4] * 8
@@ -0,0 +1,117 @@
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.abstract_storage import UpsertResult  # noqa: E402
+from src.storage.identity import record_key  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.storage.sharded_storage import ShardedJSONStorage  # noqa: E402
+
+
+def vacancies(count, start=0):
+    return [
+        Vacancy(
+            f"Developer {i}",
+            f"https://hh.ru/vacancy/{i}",
+            salary_from=1000 * (i % 7) or None,
+            requirements="Python" if i % 2 else "Java",
+        )
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.fixture(params=[0, 2], ids=["serial", "pool"])
+def storage(request, tmp_path):
+    """Шардированное хранилище с перебором в процессе и в пуле"""
+    storage = ShardedJSONStorage(
+        str(tmp_path / "shards"), shards=3, workers=request.param
+    )
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def reference(tmp_path):
+    """Обычное хранилище с теми же данными для сравнения"""
+    return JSONStorage(str(tmp_path / "reference.json"), cache_size=0)
+
+
+class TestShardedStorage:
+    """Тесты ShardedJSONStorage"""
+
+    def test_records_are_partitioned(self, storage):
+        """Тест: вакансии распределяются по нескольким файлам шардов"""
+        storage.add_vacancies(vacancies(30))
+        sizes = [
+            len(JSONStorage(filename).get_vacancies())
+            for filename in storage._filenames
+        ]
+        assert sum(sizes) == 30
+        assert all(size > 0 for size in sizes)
+
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            {},
+            {"keyword": "python"},
+            {"salary_min": 3000},
+            {"order_by": "-salary_from", "limit": 5},
+            {"keyword": "java", "order_by": "title", "offset": 3, "limit": 4},
+            {"order_by": "-avg", "offset": 25},
+        ],
+    )
+    def test_matches_single_file_storage(self, storage, reference, criteria):
+        """Тест: результаты совпадают с обычным хранилищем"""
+        storage.add_vacancies(vacancies(30))
+        reference.add_vacancies(vacancies(30))
+
+        result = storage.get_vacancies(**criteria)
+        expected = reference.get_vacancies(**criteria)
+        if "order_by" in criteria:
+            # Порядок равных ключей между шардами не определен
+            query_field = criteria["order_by"].lstrip("-")
+            key = {
+                "salary_from": lambda v: v.salary_from or 0,
+                "avg": lambda v: v.avg_salary,
+                "title": lambda v: v.title.lower(),
+            }[query_field]
+            assert [key(v) for v in result] == [key(v) for v in expected]
+        else:
+            assert {v.url for v in result} == {v.url for v in expected}
+            assert len(result) == len(expected)
+
+    def test_upsert_and_delete_route_to_shard(self, storage):
+        """Тест: обновление и удаление попадают в шард вакансии"""
+        storage.upsert_vacancies(vacancies(10))
+        changed = Vacancy("Renamed", "https://hh.ru/vacancy/4", salary_from=99000)
+        assert storage.upsert_vacancies([changed]) == UpsertResult(0, 1, 0)
+        assert [v.title for v in storage.get_vacancies(salary_min=99000)] == [
+            "Renamed"
+        ]
+
+        storage.delete_vacancy(changed)
+        assert len(storage.get_vacancies()) == 9
+        storage.delete_vacancies(vacancies(3))
+        assert len(storage.get_vacancies()) == 6
+        storage.clear()
+        assert storage.get_vacancies() == []
+
+    def test_get_by_keys(self, storage):
+        """Тест: чтение по ключам из шардов в порядке ключей"""
+        storage.add_vacancies(vacancies(10))
+        wanted = [vacancies(1, start)[0] for start in (7, 2, 5)]
+        keys = [record_key(v.to_dict()) for v in wanted] + ["нет\x1fтакой"]
+        found = storage.get_by_keys(keys)
+        assert [v and v.url for v in found] == [v.url for v in wanted] + [None]
+
+    def test_shard_count_is_fixed(self, tmp_path):
+        """Тест: число шардов берется из shards.json"""
+        directory = str(tmp_path / "shards")
+        ShardedJSONStorage(directory, shards=5, workers=0)
+        assert ShardedJSONStorage(directory, workers=0).shard_count == 5
+        with pytest.raises(ValueError):
+            ShardedJSONStorage(directory, shards=2)
@@ -1,4 +1,5 @@
 import pytest
+import multiprocessing
 import os
 import sys
 import tempfile
@@ -7,7 +8,18 @@ import tempfile
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage import json_storage  # noqa: E402
 from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.storage.query import VacancyQuery  # noqa: E402
+
+
+def _ingest_worker(filename: str, worker: int, count: int) -> None:
+    """Добавляет вакансии в общее хранилище из отдельного процесса"""
+    storage = JSONStorage(filename)
+    for i in range(count):
+        storage.add_vacancy(
+            Vacancy(f"Worker {worker} #{i}", f"https://hh.ru/vacancy/{worker}{i:03}")
+        )
 
 
 class TestJSONStorage:
@@ -20,9 +32,15 @@ class TestJSONStorage:
             temp_filename = f.name
         storage = JSONStorage(temp_filename)
         yield storage
-        # Очистка после теста
-        if os.path.exists(temp_filename):
-            os.unlink(temp_filename)
+        # Очистка после теста (файл данных и индекс рядом с ним)
+        for filename in (
+            temp_filename,
+            temp_filename + ".index.json",
+            temp_filename + ".index.log",
+            temp_filename + ".lock",
+        ):
+            if os.path.exists(filename):
+                os.unlink(filename)
 
     @pytest.fixture
     def sample_vacancy(self):
@@ -62,6 +80,28 @@ class TestJSONStorage:
         vacancies_after = storage.get_vacancies()
         assert len(vacancies_after) == 0
 
+    def test_delete_vacancies_single_commit(self, storage, monkeypatch):
+        """Тест: пакетное удаление сохраняет файл один раз"""
+        vacancies = [
+            Vacancy(f"Developer {i}", f"https://hh.ru/vacancy/{i}")
+            for i in range(5)
+        ]
+        storage.add_vacancies(vacancies)
+        commits = []
+        commit = storage._commit
+        monkeypatch.setattr(
+            storage, "_commit", lambda fd: commits.append(fd) or commit(fd)
+        )
+
+        storage.delete_vacancies(vacancies[:3] + [Vacancy("Нет", "https://x")])
+        assert len(commits) == 1
+        assert [v.title for v in storage.get_vacancies()] == [
+            "Developer 3",
+            "Developer 4",
+        ]
+        storage.delete_vacancies([Vacancy("Нет", "https://x")])
+        assert len(commits) == 1
+
     def test_filter_by_keyword(self, storage, sample_vacancy):
         """Тест фильтрации по ключевому слову"""
         storage.add_vacancy(sample_vacancy)
@@ -96,3 +136,197 @@ class TestJSONStorage:
 
         vacancies = storage.get_vacancies(salary_min=200000)
         assert len(vacancies) == 0
+
+    def test_filter_by_keywords_and(self, storage, sample_vacancy):
+        """Тест фильтрации по нескольким ключевым словам"""
+        storage.add_vacancy(sample_vacancy)
+        storage.add_vacancy(
+            Vacancy(
+                title="Python разработчик",
+                url="https://hh.ru/vacancy/789",
+                requirements="Django, PostgreSQL",
+            )
+        )
+
+        vacancies = storage.get_vacancies(keywords=["python", "django"])
+        assert [v.title for v in vacancies] == ["Python разработчик"]
+
+        vacancies = storage.get_vacancies(keyword="разраб")
+        assert len(vacancies) == 1
+
+    def test_keyword_index_persisted(self, storage, sample_vacancy):
+        """Тест загрузки сохраненного индекса и его инвалидации"""
+        storage.add_vacancy(sample_vacancy)
+        assert os.path.exists(storage._index_filename)
+
+        reopened = JSONStorage(storage._filename)
+        assert len(reopened.get_vacancies(keyword="python")) == 1
+
+        # Файл данных изменен в обход хранилища: индекс перестраивается
+        with open(storage._filename, "w", encoding="utf-8") as f:
+            f.write("[]")
+        assert JSONStorage(storage._filename).get_vacancies(keyword="python") == []
+
+    def test_keyword_index_log(self, storage, sample_vacancy):
+        """Тест: добавления, замены и удаления дописываются в журнал"""
+        storage.add_vacancy(sample_vacancy)
+        storage.add_vacancy(
+            Vacancy(
+                "Java Developer",
+                "https://hh.ru/vacancy/2",
+                requirements="Spring",
+            )
+        )
+        storage.add_vacancy(
+            Vacancy("Kotlin Developer", "https://hh.ru/vacancy/3")
+        )
+        reopened = JSONStorage(storage._filename)
+        assert reopened._index_slots is not None
+        assert [v.title for v in reopened.get_vacancies(keyword="spring")] == [
+            "Java Developer"
+        ]
+
+        index_size = os.path.getsize(storage._index_filename)
+        storage.delete_vacancy(sample_vacancy)
+        storage.upsert_vacancies(
+            [
+                Vacancy(
+                    "Kotlin Developer",
+                    "https://hh.ru/vacancy/3",
+                    requirements="Ktor",
+                )
+            ]
+        )
+        storage.add_vacancy(Vacancy("Go Developer", "https://hh.ru/vacancy/4"))
+        # Индекс не переписывался: изменения только в журнале
+        assert os.path.getsize(storage._index_filename) == index_size
+        with open(storage._index_log_filename, encoding="utf-8") as f:
+            assert len(f.readlines()) == 5
+
+        reopened = JSONStorage(storage._filename)
+        assert reopened._index_slots is not None
+        for keyword in ("python", "developer", "ktor", "go", "spring"):
+            expected = storage.get_vacancies(keyword=keyword)
+            found = reopened.get_vacancies(keyword=keyword)
+            assert [v.title for v in found] == [v.title for v in expected]
+        assert reopened.get_vacancies(keyword="python") == []
+        assert len(reopened.get_vacancies(keyword="developer")) == 3
+
+        # Изменения после загрузки продолжают журнал
+        reopened.delete_vacancy(
+            Vacancy("Go Developer", "https://hh.ru/vacancy/4")
+        )
+        again = JSONStorage(storage._filename)
+        assert again._index_slots is not None
+        assert [v.title for v in again.get_vacancies(keyword="developer")] == [
+            "Java Developer",
+            "Kotlin Developer",
+        ]
+
+    def test_keyword_index_log_compaction(self, storage, monkeypatch):
+        """Тест: разросшийся журнал сливается с индексом"""
+        monkeypatch.setattr(json_storage, "INDEX_LOG_MIN_SIZE", 0)
+        vacancies = [
+            Vacancy(f"Developer {number}", f"https://hh.ru/vacancy/{number}")
+            for number in range(6)
+        ]
+        for vacancy in vacancies:
+            storage.add_vacancy(vacancy)
+        for vacancy in vacancies[1::2]:
+            storage.delete_vacancy(vacancy)
+        # 9 сохранений, но журнал сливался с индексом
+        lines = 0
+        if os.path.exists(storage._index_log_filename):
+            with open(storage._index_log_filename, encoding="utf-8") as f:
+                lines = len(f.readlines())
+        assert lines < 9
+        reopened = JSONStorage(storage._filename)
+        found = reopened.get_vacancies(keyword="developer")
+        assert [v.title for v in found] == [
+            "Developer 0",
+            "Developer 2",
+            "Developer 4",
+        ]
+
+    def test_salary_ranges_and_top(self, storage, sample_vacancy):
+        """Тест диапазонов по индексам и топ N по зарплате"""
+        storage.add_vacancy(sample_vacancy)
+        storage.add_vacancy(
+            Vacancy("Senior", "https://hh.ru/vacancy/2", salary_from=200000)
+        )
+        storage.add_vacancy(Vacancy("Intern", "https://hh.ru/vacancy/3"))
+
+        assert len(storage.get_vacancies(salary_max=160000)) == 1
+        assert [v.title for v in storage.get_vacancies(avg_min=120000)] == [
+            "Python Developer",
+            "Senior",
+        ]
+        assert [v.title for v in storage.top_by_salary(5)] == [
+            "Senior",
+            "Python Developer",
+        ]
+
+        storage.delete_vacancy(Vacancy("Senior", "https://hh.ru/vacancy/2"))
+        assert [v.title for v in storage.top_by_salary(1)] == ["Python Developer"]
+
+    def test_query_iterator_survives_reload(self, storage):
+        """Тест: начатый итератор query дочитывает снимок после перезагрузки"""
+        vacancies = [
+            Vacancy(f"Developer {i}", f"https://hh.ru/vacancy/{i}", salary_from=i)
+            for i in range(1, 6)
+        ]
+        storage.add_vacancies(vacancies)
+        plain = storage.query(VacancyQuery())
+        ordered = storage.query(VacancyQuery.from_kwargs(order_by="-salary_from"))
+        assert next(plain).title == "Developer 1"
+        assert next(ordered).title == "Developer 5"
+
+        # Другой экземпляр удаляет запись: идентификаторы перенумеровываются
+        JSONStorage(storage._filename).delete_vacancy(vacancies[0])
+        storage.get_vacancies()
+        assert len(storage._records) == 4
+
+        assert [v.title for v in plain] == [f"Developer {i}" for i in range(2, 6)]
+        assert [v.title for v in ordered] == [
+            f"Developer {i}" for i in range(4, 0, -1)
+        ]
+
+    def test_reader_sees_other_instance_writes(self, storage, sample_vacancy):
+        """Тест: читатель перечитывает файл после записи другим экземпляром"""
+        other = JSONStorage(storage._filename)
+        assert storage.get_vacancies() == []
+
+        other.add_vacancy(sample_vacancy)
+        assert len(storage.get_vacancies()) == 1
+
+    def test_writes_merge_with_other_instance(self, storage, sample_vacancy):
+        """Тест: запись не теряет изменения другого экземпляра"""
+        other = JSONStorage(storage._filename)
+        other.add_vacancy(sample_vacancy)
+        storage.add_vacancy(Vacancy("Java Developer", "https://hh.ru/vacancy/456"))
+
+        titles = {v.title for v in JSONStorage(storage._filename).get_vacancies()}
+        assert titles == {"Python Developer", "Java Developer"}
+
+    def test_add_vacancies_bulk(self, storage, sample_vacancy):
+        """Тест пакетного добавления с пропуском дубликатов"""
+        storage.add_vacancies(
+            [sample_vacancy, sample_vacancy, Vacancy("Go", "https://hh.ru/vacancy/7")]
+        )
+        assert len(storage.get_vacancies()) == 2
+
+    def test_parallel_process_ingestion(self, storage):
+        """Тест параллельной записи из нескольких процессов"""
+        processes = [
+            multiprocessing.Process(
+                target=_ingest_worker, args=(storage._filename, worker, 10)
+            )
+            for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        assert len(storage.get_vacancies()) == 40
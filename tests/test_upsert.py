@@ -0,0 +1,80 @@
+import pytest
+import os
+import sys
+
+# Добавляем путь к src в sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.vacancy import Vacancy  # noqa: E402
+from src.storage.abstract_storage import UpsertResult  # noqa: E402
+from src.storage.json_storage import JSONStorage  # noqa: E402
+from src.storage.mmap_storage import MmapJSONStorage  # noqa: E402
+
+
+def batch(salary: int = 100000, title: str = "Python Developer"):
+    return [
+        Vacancy(title, "https://hh.ru/vacancy/1", salary_from=salary),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/2", salary_from=90000),
+    ]
+
+
+@pytest.fixture(params=["json", "jsonl"])
+def storage(request, tmp_path):
+    """JSONStorage с собственной реализацией и хранилище с базовой"""
+    if request.param == "json":
+        return JSONStorage(str(tmp_path / "vacancies.json"))
+    return MmapJSONStorage(str(tmp_path / "vacancies.jsonl"))
+
+
+class TestUpsert:
+    """Тесты upsert_vacancies"""
+
+    def test_insert_then_unchanged(self, storage):
+        """Тест: повторная загрузка того же набора ничего не меняет"""
+        assert storage.upsert_vacancies(batch()) == UpsertResult(2, 0, 0)
+        assert storage.upsert_vacancies(batch()) == UpsertResult(0, 0, 2)
+        assert len(storage.get_vacancies()) == 2
+
+    def test_changed_salary_is_updated(self, storage):
+        """Тест: изменившаяся зарплата обновляет вакансию"""
+        storage.upsert_vacancies(batch())
+        assert storage.upsert_vacancies(batch(salary=150000)) == UpsertResult(0, 1, 1)
+
+        vacancies = storage.get_vacancies()
+        assert len(vacancies) == 2
+        assert {v.salary_from for v in vacancies} == {150000, 90000}
+
+    def test_changed_title_is_not_duplicated(self, storage):
+        """Тест: смена названия не создает вторую запись"""
+        storage.upsert_vacancies(batch())
+        result = storage.upsert_vacancies(batch(title="Senior Python Developer"))
+        assert result == UpsertResult(0, 1, 1)
+        titles = {v.title for v in storage.get_vacancies()}
+        assert titles == {"Senior Python Developer", "Java Developer"}
+
+
+class TestJSONStorageUpsert:
+    """Тесты обновления на месте в JSONStorage"""
+
+    def test_update_keeps_position(self, tmp_path):
+        """Тест: обновленная вакансия остается на своем месте"""
+        storage = JSONStorage(str(tmp_path / "vacancies.json"))
+        storage.upsert_vacancies(batch())
+        storage.upsert_vacancies(batch(salary=150000))
+        assert [v.title for v in storage.get_vacancies()] == [
+            "Python Developer",
+            "Java Developer",
+        ]
+        assert [v.title for v in storage.get_vacancies(salary_min=120000)] == [
+            "Python Developer"
+        ]
+
+    def test_unchanged_does_not_write(self, tmp_path):
+        """Тест: без изменений файл не перезаписывается"""
+        filename = str(tmp_path / "vacancies.json")
+        storage = JSONStorage(filename)
+        storage.upsert_vacancies(batch())
+        mtime = os.stat(filename).st_mtime_ns
+
+        storage.upsert_vacancies(batch())
+        assert os.stat(filename).st_mtime_ns == mtime